@@ -4,13 +4,33 @@ This package provides the core functionality for STEP file ingestion,
 geometry analysis, and export operations using Open CASCADE Technology.
 """
 
-from .occt_io import LoadedModel, StepImportError, load_step, get_occt_info
-from .summary import summarize_shape, GeometrySummary
-from .export import export_glb_placeholder, ExportError
+from typing import Any
+
+from .occt_io import LoadedModel, StepImportError, load_step, load_step_batch, get_occt_info
 
 __version__ = "0.1.0"
 __all__ = [
-    "LoadedModel", "StepImportError", "load_step", "get_occt_info",
-    "summarize_shape", "GeometrySummary",
+    "LoadedModel", "StepImportError", "load_step", "load_step_batch", "get_occt_info",
+    "summarize_shape", "summarize_shapes", "GeometrySummary",
     "export_glb_placeholder", "ExportError"
-]
\ No newline at end of file
+]
+
+# summary and export pull in numpy; import them when first requested
+_LAZY_EXPORTS = {
+    "summarize_shape": "summary",
+    "summarize_shapes": "summary",
+    "GeometrySummary": "summary",
+    "export_glb_placeholder": "export",
+    "ExportError": "export",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -7,14 +7,19 @@ with placeholder implementations for GLB/GLTF export.
 from __future__ import annotations
 
 import base64
+import binascii
 import logging
+import struct
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import IO, Any, Dict, Optional, Tuple, Union
 
+import numpy as np
+import orjson
 import structlog
 
 from .occt_io import LoadedModel
+from .triangulation import collect_triangulations, fill_nodes, tessellation_symbols
 
 logger = structlog.get_logger(__name__)
 
@@ -24,27 +29,69 @@ class ExportError(Exception):
     pass
 
 
-def export_glb_placeholder(model_id: str, output_path: Optional[Union[str, Path]] = None) -> Tuple[str, bytes]:
-    """Generate a placeholder GLB file for Phase 0.
+# GLB container magic and JSON chunk type (glTF 2.0 binary format)
+_GLB_MAGIC = b'glTF'
+_GLB_CHUNK_JSON = b'JSON'
+_GLB_CHUNK_BIN = b'BIN\x00'
 
-    In Phase 1, this will be replaced with actual tessellation and GLB generation.
+# JSON chunks are padded with at most three spaces
+_GLB_JSON_PAD = b'   '
+
+# glTF accessor component types and buffer view targets
+_GL_SHORT = 5122
+_GL_UNSIGNED_SHORT = 5123
+_GL_UNSIGNED_INT = 5125
+_GL_ARRAY_BUFFER = 34962
+_GL_ELEMENT_ARRAY_BUFFER = 34963
+
+# Sentinel substituted with the (JSON-escaped) model id in the GLTF template
+_MODEL_ID_SENTINEL = "{MODEL_ID}"
+_MODEL_ID_SENTINEL_BYTES = _MODEL_ID_SENTINEL.encode('utf-8')
+
+
+def _pack_glb(json_bytes: bytes, bin_bytes: bytes = b'') -> bytes:
+    """Assemble a GLB container from a JSON chunk and optional BIN chunk.
 
     Args:
-        model_id: Model identifier
-        output_path: Optional output file path
+        json_bytes: Serialized glTF JSON
+        bin_bytes: Binary buffer contents (omitted from the file when empty)
 
     Returns:
-        Tuple of (uri, glb_bytes)
+        GLB file bytes
     """
-    logger.info("Generating placeholder GLB export", model_id=model_id)
+    json_length = len(json_bytes)
+    bin_length = len(bin_bytes)
+
+    # Chunks are padded to 4-byte boundaries: JSON with spaces, BIN with zeros
+    json_padded = (json_length + 3) & ~3
+    bin_padded = (bin_length + 3) & ~3
+    total_length = 12 + 8 + json_padded
+    if bin_length:
+        total_length += 8 + bin_padded
+
+    # bytearray is zero-filled, so only the JSON padding needs writing
+    buf = bytearray(total_length)
+    struct.pack_into('<4sII', buf, 0, _GLB_MAGIC, 2, total_length)
+    struct.pack_into('<I4s', buf, 12, json_padded, _GLB_CHUNK_JSON)
+    buf[20:20 + json_length] = json_bytes
+    buf[20 + json_length:20 + json_padded] = _GLB_JSON_PAD[:json_padded - json_length]
+    if bin_length:
+        offset = 20 + json_padded
+        struct.pack_into('<I4s', buf, offset, bin_padded, _GLB_CHUNK_BIN)
+        buf[offset + 8:offset + 8 + bin_length] = bin_bytes
+    return bytes(buf)
 
-    # Create minimal GLB header (placeholder)
-    # Real implementation will use trimesh or similar for actual GLB generation
-    glb_header = b'glTF'  # Magic number
-    glb_header += (2).to_bytes(4, 'little')  # Version
-    glb_header += (12).to_bytes(4, 'little')  # Total length (header only)
 
+def _build_glb_placeholder() -> bytes:
+    """Build the static placeholder GLB payload.
+
+    The placeholder does not depend on the model, so this runs once at import.
+
+    Returns:
+        GLB file bytes
+    """
     # Add some minimal JSON content
+    # Real implementation will use trimesh or similar for actual GLB generation
     json_content = {
         "asset": {"version": "2.0", "generator": "ShapeBridge Phase 0 Placeholder"},
         "scene": 0,
@@ -56,50 +103,15 @@ def export_glb_placeholder(model_id: str, output_path: Optional[Union[str, Path]
         "buffers": []
     }
 
-    import json
-    json_bytes = json.dumps(json_content).encode('utf-8')
-    json_length = len(json_bytes)
-
-    # Pad JSON to 4-byte boundary
-    json_padding = (4 - (json_length % 4)) % 4
-    json_bytes += b' ' * json_padding
+    return _pack_glb(orjson.dumps(json_content))
 
-    # Update total length
-    total_length = 12 + 8 + len(json_bytes)  # header + chunk header + json
-    glb_data = b'glTF'
-    glb_data += (2).to_bytes(4, 'little')
-    glb_data += total_length.to_bytes(4, 'little')
-
-    # JSON chunk
-    glb_data += (len(json_bytes)).to_bytes(4, 'little')
-    glb_data += b'JSON'
-    glb_data += json_bytes
-
-    # Generate URI
-    if output_path:
-        uri = f"file://{Path(output_path).resolve()}"
-        # Write to file if path provided
-        Path(output_path).write_bytes(glb_data)
-    else:
-        uri = f"memory://{model_id}.glb"
-
-    logger.info("Placeholder GLB generated", model_id=model_id, size_bytes=len(glb_data))
-
-    return uri, glb_data
 
-
-def export_gltf_placeholder(model_id: str, output_path: Optional[Union[str, Path]] = None) -> Tuple[str, Dict[str, Any]]:
-    """Generate a placeholder GLTF file for Phase 0.
-
-    Args:
-        model_id: Model identifier
-        output_path: Optional output file path
+def _build_gltf_template() -> bytes:
+    """Render the placeholder GLTF document with model id sentinels.
 
     Returns:
-        Tuple of (uri, gltf_dict)
+        Indented UTF-8 JSON containing ``{MODEL_ID}`` placeholders
     """
-    logger.info("Generating placeholder GLTF export", model_id=model_id)
-
     gltf_content = {
         "asset": {
             "version": "2.0",
@@ -109,13 +121,13 @@ def export_gltf_placeholder(model_id: str, output_path: Optional[Union[str, Path
         "scenes": [{"nodes": [0]}],
         "nodes": [
             {
-                "name": f"Model_{model_id}",
+                "name": f"Model_{_MODEL_ID_SENTINEL}",
                 "mesh": 0
             }
         ],
         "meshes": [
             {
-                "name": f"Mesh_{model_id}",
+                "name": f"Mesh_{_MODEL_ID_SENTINEL}",
                 "primitives": []
             }
         ],
@@ -123,31 +135,154 @@ def export_gltf_placeholder(model_id: str, output_path: Optional[Union[str, Path
         "bufferViews": [],
         "buffers": []
     }
+    return orjson.dumps(gltf_content, option=orjson.OPT_INDENT_2)
+
+
+_GLB_PLACEHOLDER_BYTES = _build_glb_placeholder()
+_GLTF_TEMPLATE = _build_gltf_template()
+
+
+def _write_export(data: bytes, model_id: str, extension: str,
+                  output_path: Optional[Union[str, Path]] = None,
+                  output_fp: Optional[IO[bytes]] = None) -> str:
+    """Write export bytes to a file handle or path and return their URI.
+
+    Args:
+        data: Encoded export payload
+        model_id: Model identifier, used for in-memory URIs
+        extension: File extension for in-memory URIs
+        output_path: Optional output file path
+        output_fp: Optional open binary file, taking precedence over the path
+
+    Returns:
+        ``file://`` URI of the written file, or a ``memory://`` URI
+    """
+    if output_fp is not None:
+        output_fp.write(data)
+        name = getattr(output_fp, 'name', None)
+        if isinstance(name, str):
+            return f"file://{Path(name).resolve()}"
+        return f"memory://{model_id}.{extension}"
 
-    # Generate URI
     if output_path:
-        uri = f"file://{Path(output_path).resolve()}"
-        # Write to file if path provided
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(gltf_content, f, indent=2)
-    else:
-        uri = f"memory://{model_id}.gltf"
+        path = Path(output_path)
+        path.write_bytes(data)
+        return f"file://{path.resolve()}"
+
+    return f"memory://{model_id}.{extension}"
+
+
+def export_glb_placeholder(model_id: str, output_path: Optional[Union[str, Path]] = None,
+                           output_fp: Optional[IO[bytes]] = None) -> Tuple[str, bytes]:
+    """Generate a placeholder GLB file for Phase 0.
+
+    In Phase 1, this will be replaced with actual tessellation and GLB generation.
+
+    Args:
+        model_id: Model identifier
+        output_path: Optional output file path
+        output_fp: Optional open binary file to write to instead
+
+    Returns:
+        Tuple of (uri, glb_bytes)
+    """
+    logger.info("Generating placeholder GLB export", model_id=model_id)
+
+    glb_data = _GLB_PLACEHOLDER_BYTES
+    uri = _write_export(glb_data, model_id, 'glb', output_path, output_fp)
+
+    logger.info("Placeholder GLB generated", model_id=model_id, size_bytes=len(glb_data))
+
+    return uri, glb_data
+
+
+def export_gltf_placeholder(model_id: str, output_path: Optional[Union[str, Path]] = None,
+                            output_fp: Optional[IO[bytes]] = None) -> Tuple[str, Dict[str, Any]]:
+    """Generate a placeholder GLTF file for Phase 0.
+
+    Args:
+        model_id: Model identifier
+        output_path: Optional output file path
+        output_fp: Optional open binary file to write to instead
+
+    Returns:
+        Tuple of (uri, gltf_dict)
+    """
+    logger.info("Generating placeholder GLTF export", model_id=model_id)
+
+    # Escape the id so quotes/backslashes cannot break the rendered JSON
+    gltf_bytes = _GLTF_TEMPLATE.replace(_MODEL_ID_SENTINEL_BYTES, orjson.dumps(model_id)[1:-1])
+    uri = _write_export(gltf_bytes, model_id, 'gltf', output_path, output_fp)
 
     logger.info("Placeholder GLTF generated", model_id=model_id)
 
-    return uri, gltf_content
+    return uri, orjson.loads(gltf_bytes)
+
+
+# Payloads above this size are base64-encoded in chunks when streamed
+_B64_STREAM_THRESHOLD = 4 << 20
+# Multiple of 3 so chunk encodings concatenate without inner padding
+_B64_CHUNK_SIZE = 48 * 1024
+
+
+def _b64_stream(data: bytes, out: IO[bytes]) -> int:
+    """Base64-encode ``data`` into a binary writer one chunk at a time.
+
+    Only one encoded chunk is alive at a time, instead of a full-size
+    encoded copy of the payload.
+
+    Args:
+        data: Raw bytes to encode
+        out: Binary file-like object to write the encoding to
+
+    Returns:
+        Number of encoded bytes written
+    """
+    view = memoryview(data)
+    written = 0
+    for start in range(0, len(view), _B64_CHUNK_SIZE):
+        chunk = binascii.b2a_base64(view[start:start + _B64_CHUNK_SIZE], newline=False)
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def write_base64(data: bytes, out: IO[bytes]) -> int:
+    """Write ``data`` base64-encoded to ``out``.
+
+    Payloads above the streaming threshold are encoded in chunks so a
+    full-size encoded copy is never held in memory.
+
+    Args:
+        data: Raw bytes to encode
+        out: Binary file-like object
+
+    Returns:
+        Number of encoded bytes written
+    """
+    if len(data) > _B64_STREAM_THRESHOLD:
+        return _b64_stream(data, out)
+    encoded = base64.b64encode(data)
+    out.write(encoded)
+    return len(encoded)
 
 
 def export_model_view(loaded_model: LoadedModel,
                      format: str = "glb",
-                     output_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+                     output_path: Optional[Union[str, Path]] = None,
+                     encode_base64: bool = True,
+                     output_fp: Optional[IO[bytes]] = None) -> Dict[str, Any]:
     """Export a 3D view of the loaded model.
 
     Args:
         loaded_model: LoadedModel to export
         format: Export format ("glb" or "gltf")
         output_path: Optional output file path
+        output_fp: Optional open binary file to write to instead of
+            ``output_path``; the caller owns (and closes) the handle
+        encode_base64: If True, return GLB bytes base64-encoded under
+            ``data_base64`` (for JSON transports); otherwise return the raw
+            bytes under ``data`` (see ``write_base64`` for streaming them)
 
     Returns:
         Dictionary containing export results
@@ -159,17 +294,25 @@ def export_model_view(loaded_model: LoadedModel,
 
     try:
         if format.lower() == "glb":
-            uri, data = export_glb_placeholder(loaded_model.model_id, output_path)
+            uri, data = export_glb_placeholder(loaded_model.model_id, output_path, output_fp)
+            if encode_base64:
+                return {
+                    "format": "glb",
+                    "uri": uri,
+                    "size_bytes": len(data),
+                    "data_base64": base64.b64encode(data).decode('ascii'),
+                    "mime_type": "model/gltf-binary"
+                }
             return {
                 "format": "glb",
                 "uri": uri,
                 "size_bytes": len(data),
-                "data_base64": base64.b64encode(data).decode('ascii'),
+                "data": data,
                 "mime_type": "model/gltf-binary"
             }
 
         elif format.lower() == "gltf":
-            uri, data = export_gltf_placeholder(loaded_model.model_id, output_path)
+            uri, data = export_gltf_placeholder(loaded_model.model_id, output_path, output_fp)
             return {
                 "format": "gltf",
                 "uri": uri,
@@ -185,14 +328,30 @@ def export_model_view(loaded_model: LoadedModel,
         raise ExportError(f"Failed to export {format}: {e}") from e
 
 
+def _vertex_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted per-vertex normals computed over the whole mesh at once."""
+    corners = vertices[faces]
+    face_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    normals = np.zeros_like(vertices)
+    for k in range(3):
+        np.add.at(normals, faces[:, k], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    lengths[lengths == 0.0] = 1.0
+    unit_normals: np.ndarray = (normals / lengths).astype(np.float32)
+    return unit_normals
+
+
 # Future Phase 1 implementation will include:
-# - Actual tessellation using OCCT
 # - Mesh optimization and simplification
 # - Material and texture support
 # - Animation support for assemblies
 
 def _future_tessellate_shape(shape: Any, binding: str, deflection: float = 0.1) -> Dict[str, Any]:
-    """Placeholder for future tessellation implementation.
+    """Tessellate a shape into flat NumPy arrays.
+
+    Faces are meshed with BRepMesh_IncrementalMesh, then a single explorer
+    pass collects each face's triangulation so the output arrays can be
+    allocated once at their final size and filled face by face.
 
     Args:
         shape: TopoDS_Shape
@@ -200,26 +359,164 @@ def _future_tessellate_shape(shape: Any, binding: str, deflection: float = 0.1)
         deflection: Tessellation quality parameter
 
     Returns:
-        Dictionary containing vertices, faces, normals, etc.
+        Dictionary with ``vertices`` (N, 3) float32, ``faces`` (M, 3) uint32
+        and ``normals`` (N, 3) float32 arrays
+
+    Raises:
+        ExportError: If the binding is unsupported or meshing fails
+    """
+    try:
+        sym = tessellation_symbols(binding)
+    except ValueError as e:
+        raise ExportError(str(e)) from e
+
+    mesher = sym['mesher'](shape, deflection)
+    mesher.Perform()
+    if not mesher.IsDone():
+        raise ExportError('BRepMesh_IncrementalMesh failed')
+
+    patches, n_nodes, n_tris = collect_triangulations(shape, sym)
+
+    vertices = np.empty((n_nodes, 3), dtype=np.float64)
+    faces = np.empty((n_tris, 3), dtype=np.uint32)
+
+    v_off = f_off = 0
+    for poly, location, reverse in patches:
+        nb_nodes, nb_tris = poly.NbNodes(), poly.NbTriangles()
+
+        fill_nodes(vertices[v_off:v_off + nb_nodes], poly, location)
+
+        tris = faces[f_off:f_off + nb_tris]
+        tris[:] = [
+            (t.Value(1), t.Value(2), t.Value(3))
+            for t in map(poly.Triangle, range(1, nb_tris + 1))
+        ]
+        if reverse:
+            tris[:, [1, 2]] = tris[:, [2, 1]]
+        # OCCT node indices are 1-based and local to the face
+        tris -= 1
+        tris += v_off
+
+        v_off += nb_nodes
+        f_off += nb_tris
+
+    return {
+        'vertices': vertices.astype(np.float32),
+        'faces': faces,
+        'normals': _vertex_normals(vertices, faces),
+    }
+
+
+def _quantize_positions(vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Map positions onto the unsigned 16-bit grid spanning their bounding box.
+
+    Args:
+        vertices: (N, 3) float positions
+
+    Returns:
+        Tuple of (N, 3) uint16 positions, per-axis offset and per-axis scale
+        such that ``position = offset + q / 65535 * scale``
     """
-    # This will be implemented in Phase 1 using:
-    # - BRepMesh_IncrementalMesh for tessellation
-    # - TopExp_Explorer to extract triangles
-    # - Conversion to trimesh for GLB generation
-    raise NotImplementedError("Tessellation will be implemented in Phase 1")
+    bmin = vertices.min(axis=0).astype(np.float64)
+    extent = vertices.max(axis=0) - bmin
+    extent[extent == 0.0] = 1.0
+    q = np.rint((vertices - bmin) / extent * 65535.0).astype(np.uint16)
+    return q, bmin, extent
 
 
 def _future_create_glb_from_mesh(mesh_data: Dict[str, Any]) -> bytes:
-    """Placeholder for future GLB generation from mesh data.
+    """Generate a quantized GLB from tessellated mesh arrays.
+
+    Positions are stored as normalized uint16 and normals as normalized
+    int16 (KHR_mesh_quantization); the node transform undoes the position
+    normalization so viewers see the original coordinates.
 
     Args:
-        mesh_data: Dictionary containing mesh vertices, faces, etc.
+        mesh_data: Dictionary from ``_future_tessellate_shape``
 
     Returns:
         GLB file bytes
     """
-    # This will be implemented in Phase 1 using trimesh:
-    # import trimesh
-    # mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
-    # return mesh.export(file_type='glb')
-    raise NotImplementedError("GLB generation will be implemented in Phase 1")
\ No newline at end of file
+    vertices = np.asarray(mesh_data['vertices'])
+    faces = np.ascontiguousarray(mesh_data['faces'], dtype=np.uint32)
+    normals = mesh_data.get('normals')
+    n_vertices = len(vertices)
+
+    q, offset, scale = _quantize_positions(vertices)
+
+    # Vertex attribute elements must start on 4-byte boundaries, so each
+    # 3-component short is padded out to an 8-byte stride.
+    positions = np.zeros((n_vertices, 4), dtype='<u2')
+    positions[:, :3] = q
+    chunks = [positions.tobytes()]
+
+    attributes = {'POSITION': 0}
+    accessors = [{
+        'bufferView': 0,
+        'componentType': _GL_UNSIGNED_SHORT,
+        'normalized': True,
+        'count': n_vertices,
+        'type': 'VEC3',
+        'min': q.min(axis=0).tolist(),
+        'max': q.max(axis=0).tolist(),
+    }]
+
+    if normals is not None:
+        # Viewers transform normals by the inverse-transpose of the node
+        # scale, so pre-apply the scale to land back on the original normals.
+        normals = np.asarray(normals, dtype=np.float64) * scale
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        lengths[lengths == 0.0] = 1.0
+        packed = np.zeros((n_vertices, 4), dtype='<i2')
+        packed[:, :3] = np.rint(np.clip(normals / lengths, -1.0, 1.0) * 32767.0)
+        chunks.append(packed.tobytes())
+        attributes['NORMAL'] = len(accessors)
+        accessors.append({
+            'bufferView': len(accessors),
+            'componentType': _GL_SHORT,
+            'normalized': True,
+            'count': n_vertices,
+            'type': 'VEC3',
+        })
+
+    indices_view = len(chunks)
+    chunks.append(faces.astype('<u4', copy=False).tobytes())
+    accessors.append({
+        'bufferView': indices_view,
+        'componentType': _GL_UNSIGNED_INT,
+        'count': faces.size,
+        'type': 'SCALAR',
+    })
+
+    buffer_views = []
+    byte_offset = 0
+    for index, chunk in enumerate(chunks):
+        view = {'buffer': 0, 'byteOffset': byte_offset, 'byteLength': len(chunk)}
+        if index == indices_view:
+            view['target'] = _GL_ELEMENT_ARRAY_BUFFER
+        else:
+            view['byteStride'] = 8
+            view['target'] = _GL_ARRAY_BUFFER
+        buffer_views.append(view)
+        byte_offset += len(chunk)
+
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'ShapeBridge'},
+        'extensionsUsed': ['KHR_mesh_quantization'],
+        'extensionsRequired': ['KHR_mesh_quantization'],
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [{
+            'mesh': 0,
+            'translation': offset.tolist(),
+            'scale': scale.tolist(),
+        }],
+        'meshes': [{'primitives': [{
+            'attributes': attributes,
+            'indices': len(accessors) - 1,
+        }]}],
+        'accessors': accessors,
+        'bufferViews': buffer_views,
+        'buffers': [{'byteLength': byte_offset}],
+    }
+    return _pack_glb(orjson.dumps(gltf), b''.join(chunks))
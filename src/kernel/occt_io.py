@@ -6,7 +6,12 @@ different OCCT Python bindings (pyOCCT and pythonOCC-core).
 
 from __future__ import annotations
 
+import functools
+import mmap
 import os
+import stat
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,6 +20,12 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Bytes inspected from the start of a STEP file when no ENDSEC; is found
+_STEP_HEADER_READ_SIZE = 8192
+
+# Upper bound of the memory-mapped window searched for the header's ENDSEC;
+_STEP_HEADER_SCAN_LIMIT = 64 * 1024
+
 
 class StepImportError(Exception):
     """Raised when STEP file import fails."""
@@ -28,9 +39,107 @@ class OCCTNotAvailableError(Exception):
     pass
 
 
-@dataclass
+def _resolve_pyocct() -> dict[str, Any] | None:
+    """Resolve STEP reader symbols from pyOCCT, or None if not installed."""
+    try:
+        import OCCT
+        from OCCT.IFSelect import IFSelect_RetDone
+        from OCCT.Interface import Interface_Static
+        from OCCT.STEPControl import STEPControl_Reader
+    except ImportError:
+        return None
+
+    return {
+        "label": "pyOCCT",
+        "reader": STEPControl_Reader,
+        "interface_static": Interface_Static,
+        "ret_done": IFSelect_RetDone,
+        "version": getattr(OCCT, "__version__", "unknown"),
+    }
+
+
+def _resolve_pythonocc() -> dict[str, Any] | None:
+    """Resolve STEP reader symbols from pythonOCC, or None if not installed."""
+    try:
+        # Try OCP import first (classic pythonOCC)
+        import OCP
+        from OCP.IFSelect import IFSelect_RetDone
+        from OCP.Interface import Interface_Static
+        from OCP.STEPControl import STEPControl_Reader
+
+        version_module: Any = OCP
+    except ImportError:
+        try:
+            # Try OCC.Core import (conda pythonocc-core)
+            import OCC
+            from OCC.Core.IFSelect import IFSelect_RetDone
+            from OCC.Core.Interface import Interface_Static
+            from OCC.Core.STEPControl import STEPControl_Reader
+        except ImportError:
+            return None
+
+        # Verify this is conda pythonocc-core and not FreeCAD
+        if "conda" not in OCC.__file__ and "anaconda" not in OCC.__file__:
+            return None
+        version_module = OCC
+
+    return {
+        "label": "pythonOCC",
+        "reader": STEPControl_Reader,
+        "interface_static": Interface_Static,
+        "ret_done": IFSelect_RetDone,
+        "version": getattr(version_module, "__version__", "unknown"),
+    }
+
+
+def _resolve_freecad_occ() -> dict[str, Any] | None:
+    """Resolve STEP reader symbols from FreeCAD OCC, or None if not installed."""
+    try:
+        import OCC.Core
+        from OCC.Core.IFSelect import IFSelect_RetDone
+        from OCC.Core.Interface import Interface_Static
+        from OCC.Core.STEPControl import STEPControl_Reader
+    except ImportError:
+        return None
+
+    return {
+        "label": "FreeCAD OCC",
+        "reader": STEPControl_Reader,
+        "interface_static": Interface_Static,
+        "ret_done": IFSelect_RetDone,
+        # FreeCAD OCC may not have __version__
+        "version": getattr(OCC.Core, "__version__", "freecad_bundled"),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _reader_bindings() -> dict[str, dict[str, Any]]:
+    """STEP reader symbols of each installed binding.
+
+    Resolved on the first load rather than at import time, so importing
+    this module never imports an OCCT binding; later loads reuse the
+    cached table instead of going through the import machinery per file.
+
+    Returns:
+        Mapping of binding name to its resolved reader symbols
+    """
+    return {
+        name: symbols
+        for name, symbols in (
+            ("pyOCCT", _resolve_pyocct()),
+            ("pythonOCC", _resolve_pythonocc()),
+            ("freecad_occ", _resolve_freecad_occ()),
+        )
+        if symbols is not None
+    }
+
+
+@dataclass(slots=True)
 class LoadedModel:
-    """Container for a successfully loaded STEP model."""
+    """Container for a successfully loaded STEP model.
+
+    Slotted to keep per-instance overhead low when many models are held.
+    """
 
     model_id: str
     file_path: str
@@ -45,7 +154,7 @@ class LoadedModel:
     def __post_init__(self) -> None:
         """Validate loaded model."""
         if not self.model_id:
-            self.model_id = Path(self.file_path).stem
+            self.model_id = _path_stem(self.file_path)
 
         # Ensure required metadata
         if "file_size" not in self.metadata:
@@ -55,9 +164,14 @@ class LoadedModel:
                 self.metadata["file_size"] = -1
 
 
+@functools.lru_cache(maxsize=1)
 def get_occt_info() -> dict[str, Any]:
     """Get information about available OCCT bindings.
 
+    Binding detection only runs once per process; the cached dictionary is
+    shared between callers and must not be mutated. Use
+    ``get_occt_info.cache_clear()`` to force re-detection.
+
     Returns:
         Dictionary with binding availability and version info
     """
@@ -125,214 +239,201 @@ def get_occt_info() -> dict[str, Any]:
     return info
 
 
-def _validate_step_file(file_path: str | Path) -> Path:
+def _path_stem(path: str) -> str:
+    """Return the file name of ``path`` without its extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _validate_step_file(
+    file_path: str | Path, file_stat: os.stat_result | None = None
+) -> tuple[str, os.stat_result]:
     """Validate STEP file exists and is readable.
 
+    Uses a single ``os.stat`` call; the result is returned so callers can
+    reuse it (e.g. for the file size) without touching the filesystem again.
+
     Args:
         file_path: Path to STEP file
+        file_stat: Result of an ``os.stat`` the caller already made of
+            ``file_path``, so it is not repeated
 
     Returns:
-        Validated Path object
+        Tuple of (resolved path string, stat result)
 
     Raises:
         StepImportError: If file validation fails
     """
-    path = Path(file_path).resolve()
+    path = os.path.realpath(os.fspath(file_path))
 
-    if not path.exists():
-        raise StepImportError(f"STEP file not found: {path}")
+    st = file_stat
+    if st is None:
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise StepImportError(f"STEP file not found: {path}") from None
+        except OSError as e:
+            raise StepImportError(f"Cannot access STEP file: {path}: {e}") from e
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise StepImportError(f"Path is not a file: {path}")
 
-    if path.stat().st_size == 0:
+    if st.st_size == 0:
         raise StepImportError(f"STEP file is empty: {path}")
 
-    # Basic STEP file validation
-    try:
-        with open(path, encoding="utf-8", errors="ignore") as f:
-            header = f.read(1024)
-            if not header.startswith("ISO-10303-"):
-                logger.warning("File does not start with ISO-10303 header", file=str(path))
-    except Exception as e:
-        logger.warning("Could not validate STEP header", file=str(path), error=str(e))
+    return path, st
 
-    return path
 
+def _read_step_header(file_path: str | Path) -> tuple[bool, dict[str, str]]:
+    """Read the STEP header once for both validation and unit detection.
 
-def _extract_step_units(file_path: Path) -> dict[str, str]:
-    """Extract unit information from STEP file header.
+    The file is memory-mapped so the header section (everything before the
+    first ``ENDSEC;``) can be located without copying the file into Python,
+    which keeps the cost flat for very large STEP files.
 
     Args:
         file_path: Path to STEP file
 
     Returns:
-        Dictionary mapping unit types to unit names
-    """
-    default_units = {"length": "mm", "angle": "deg"}
-
-    try:
-        with open(file_path, encoding="utf-8", errors="ignore") as f:
-            # Read header section (usually first ~50 lines)
-            header_lines = []
-            for i, line in enumerate(f):
-                header_lines.append(line.strip())
-                if i > 50 or line.strip() == "ENDSEC;":
-                    break
-
-        header_text = " ".join(header_lines).upper()
-
-        # Simple unit detection
-        units = default_units.copy()
-
-        if "MILLIMETRE" in header_text or "MM" in header_text:
-            units["length"] = "mm"
-        elif "METRE" in header_text and "MILLIMETRE" not in header_text:
-            units["length"] = "m"
-        elif "INCH" in header_text:
-            units["length"] = "in"
-
-        if "DEGREE" in header_text:
-            units["angle"] = "deg"
-        elif "RADIAN" in header_text:
-            units["angle"] = "rad"
+        Tuple of (starts with ISO-10303 magic, units dictionary)
 
-        return units
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty or special files cannot be memory-mapped
+            head = f.read(_STEP_HEADER_READ_SIZE)
+            end = head.find(b"ENDSEC;")
+            head = head[:end] if end >= 0 else head
+        else:
+            with mm:
+                end = mm.find(b"ENDSEC;", 0, _STEP_HEADER_SCAN_LIMIT)
+                head = mm[: end if end >= 0 else _STEP_HEADER_READ_SIZE]
 
-    except Exception as e:
-        logger.warning("Could not extract units from STEP file", file=str(file_path), error=str(e))
-        return default_units
+    return head.startswith(b"ISO-10303-"), _extract_step_units_from_header(head)
 
 
-def _try_pyocct_import(file_path: Path) -> LoadedModel | None:
-    """Attempt to load STEP file using pyOCCT binding.
+def _extract_step_units_from_header(head: bytes) -> dict[str, str]:
+    """Detect units from the raw bytes of a STEP header section.
 
     Args:
-        file_path: Path to STEP file
+        head: STEP header bytes
 
     Returns:
-        LoadedModel if successful, None if failed
+        Dictionary mapping unit types to unit names
     """
-    try:
-        import OCCT
-        from OCCT.IFSelect import IFSelect_RetDone
-        from OCCT.Interface import Interface_Static
-        from OCCT.STEPControl import STEPControl_Reader
+    header = head.upper()
 
-        logger.debug("Attempting STEP import with pyOCCT", file=str(file_path))
+    # Simple unit detection. Millimetre and degree are the defaults, so only
+    # the alternatives need scanning once the default markers are ruled out.
+    units = {"length": "mm", "angle": "deg"}
 
-        # Create reader and configure
-        reader = STEPControl_Reader()
+    if b"MILLIMETRE" not in header and b"MM" not in header:
+        if b"METRE" in header:
+            units["length"] = "m"
+        elif b"INCH" in header:
+            units["length"] = "in"
 
-        # Set some common options for better compatibility
-        Interface_Static.SetCVal("xstep.cascade.unit", "mm")
-        Interface_Static.SetRVal("read.precision.mode", 1)
-        Interface_Static.SetRVal("read.precision.val", 0.01)
+    if b"DEGREE" not in header and b"RADIAN" in header:
+        units["angle"] = "rad"
 
-        # Read file
-        status = reader.ReadFile(str(file_path))
-        if status != IFSelect_RetDone:
-            raise StepImportError(f"pyOCCT read failed with status: {status}")
+    return units
 
-        # Transfer geometry
-        nb_roots = reader.NbRootsForTransfer()
-        if nb_roots == 0:
-            raise StepImportError("No geometry roots found in STEP file")
 
-        logger.debug("Found geometry roots", count=nb_roots)
-        reader.TransferRoots()
+@functools.lru_cache(maxsize=1024)
+def _read_step_header_cached(
+    file_path: str, mtime_ns: int, size: int
+) -> tuple[bool, dict[str, str]]:
+    """Memoized ``_read_step_header`` keyed on the file's identity.
 
-        # Get the unified shape
-        shape = reader.OneShape()
-        if shape.IsNull():
-            raise StepImportError("Failed to create unified shape from STEP file")
+    Rewriting the file changes its mtime/size, so stale entries are never
+    hit. Callers must copy the returned units dictionary before mutating it.
 
-        # Extract units and metadata
-        units = _extract_step_units(file_path)
+    Args:
+        file_path: Resolved path to STEP file
+        mtime_ns: ``st_mtime_ns`` of the file
+        size: ``st_size`` of the file
 
-        # Try to get more detailed unit info from OCCT
-        try:
-            length_unit = Interface_Static.CVal("xstep.cascade.unit")
-            if length_unit:
-                units["length"] = (
-                    length_unit.decode() if isinstance(length_unit, bytes) else str(length_unit)
-                )
-        except Exception:
-            pass
+    Returns:
+        Tuple of (starts with ISO-10303 magic, units dictionary)
+    """
+    return _read_step_header(file_path)
 
-        metadata = {
-            "nb_roots": nb_roots,
-            "reader_type": "STEPControl_Reader",
-            "file_size": file_path.stat().st_size,
-        }
 
-        # Get version info
-        occt_version = getattr(OCCT, "__version__", "unknown")
+def _extract_step_units(file_path: str | Path) -> dict[str, str]:
+    """Extract unit information from STEP file header.
 
-        return LoadedModel(
-            model_id=file_path.stem,
-            file_path=str(file_path),
-            occt_shape=shape,
-            units=units,
-            metadata=metadata,
-            occt_binding="pyOCCT",
-            occt_version=occt_version,
-        )
+    Args:
+        file_path: Path to STEP file
 
-    except ImportError:
-        logger.debug("pyOCCT not available")
-        return None
+    Returns:
+        Dictionary mapping unit types to unit names
+    """
+    try:
+        path = os.path.realpath(file_path)
+        st = os.stat(path)
+        return dict(_read_step_header_cached(path, st.st_mtime_ns, st.st_size)[1])
     except Exception as e:
-        logger.warning("pyOCCT import failed", file=str(file_path), error=str(e))
-        return None
+        logger.warning("Could not extract units from STEP file", file=str(file_path), error=str(e))
+        return {"length": "mm", "angle": "deg"}
 
 
-def _try_pythonocc_import(file_path: Path) -> LoadedModel | None:
-    """Attempt to load STEP file using pythonOCC binding.
+@functools.cache
+def _configure_reader_globals(binding_name: str) -> None:
+    """Apply the static STEP reader settings once per binding.
 
     Args:
+        binding_name: Key into ``_reader_bindings()``
+    """
+    interface_static = _reader_bindings()[binding_name]["interface_static"]
+
+    # Set some common options for better compatibility
+    interface_static.SetCVal("xstep.cascade.unit", "mm")
+    interface_static.SetRVal("read.precision.mode", 1)
+    interface_static.SetRVal("read.precision.val", 0.01)
+
+
+def _load_with_reader(
+    binding_name: str,
+    file_path: str,
+    units: dict[str, str] | None = None,
+    file_stat: os.stat_result | None = None,
+) -> LoadedModel | None:
+    """Attempt to load STEP file using the given OCCT binding.
+
+    Args:
+        binding_name: Binding to use ("pyOCCT", "pythonOCC" or "freecad_occ")
         file_path: Path to STEP file
+        units: Units already extracted from the STEP header, if available
+        file_stat: Stat result from validation, if available
 
     Returns:
-        LoadedModel if successful, None if failed
-    """
-    try:
-        # Try OCP import first (classic pythonOCC)
-        try:
-            import OCP
-            from OCP.IFSelect import IFSelect_RetDone
-            from OCP.Interface import Interface_Static
-            from OCP.STEPControl import STEPControl_Reader
+        LoadedModel if successful, None if the binding is unavailable or
+        failed internally
 
-            logger.debug("Attempting STEP import with pythonOCC (OCP)", file=str(file_path))
-            version_module = OCP
-        except ImportError:
-            # Try OCC.Core import (conda pythonocc-core)
-            import OCC
-            from OCC.Core.IFSelect import IFSelect_RetDone
-            from OCC.Core.Interface import Interface_Static
-            from OCC.Core.STEPControl import STEPControl_Reader
+    Raises:
+        StepImportError: If OCCT rejects the file itself (read status, no
+            geometry roots, null shape); other bindings would fail the same way
+    """
+    symbols = _reader_bindings().get(binding_name)
+    if symbols is None:
+        logger.debug("OCCT binding not available", binding=binding_name)
+        return None
 
-            # Verify this is conda pythonocc-core and not FreeCAD
-            if "conda" not in OCC.__file__ and "anaconda" not in OCC.__file__:
-                raise ImportError("FreeCAD OCC detected, not conda pythonocc-core") from None
-            logger.debug(
-                "Attempting STEP import with conda pythonocc-core (OCC.Core)", file=str(file_path)
-            )
-            version_module = OCC
+    label = symbols["label"]
 
-        # Create reader and configure
-        reader = STEPControl_Reader()
+    try:
+        logger.debug("Attempting STEP import", binding=label, file=file_path)
 
-        # Set some common options for better compatibility
-        Interface_Static.SetCVal("xstep.cascade.unit", "mm")
-        Interface_Static.SetRVal("read.precision.mode", 1)
-        Interface_Static.SetRVal("read.precision.val", 0.01)
+        _configure_reader_globals(binding_name)
+        reader = symbols["reader"]()
 
         # Read file
-        status = reader.ReadFile(str(file_path))
-        if status != IFSelect_RetDone:
-            raise StepImportError(f"pythonOCC read failed with status: {status}")
+        status = reader.ReadFile(file_path)
+        if status != symbols["ret_done"]:
+            raise StepImportError(f"{label} read failed with status: {status}")
 
         # Transfer geometry
         nb_roots = reader.NbRootsForTransfer()
@@ -348,125 +449,87 @@ def _try_pythonocc_import(file_path: Path) -> LoadedModel | None:
             raise StepImportError("Failed to create unified shape from STEP file")
 
         # Extract units and metadata
-        units = _extract_step_units(file_path)
+        units = dict(units) if units is not None else _extract_step_units(file_path)
 
         # Try to get more detailed unit info from OCCT
         try:
-            length_unit = Interface_Static.CVal("xstep.cascade.unit")
+            length_unit = symbols["interface_static"].CVal("xstep.cascade.unit")
             if length_unit:
-                units["length"] = str(length_unit)
+                units["length"] = (
+                    length_unit.decode() if isinstance(length_unit, bytes) else str(length_unit)
+                )
         except Exception:
             pass
 
         metadata = {
             "nb_roots": nb_roots,
             "reader_type": "STEPControl_Reader",
-            "file_size": file_path.stat().st_size,
+            "file_size": (file_stat or os.stat(file_path)).st_size,
         }
 
-        # Get version info
-        occt_version = getattr(version_module, "__version__", "unknown")
-
         return LoadedModel(
-            model_id=file_path.stem,
-            file_path=str(file_path),
+            model_id=_path_stem(file_path),
+            file_path=file_path,
             occt_shape=shape,
             units=units,
             metadata=metadata,
-            occt_binding="pythonOCC",
-            occt_version=occt_version,
+            occt_binding=binding_name,
+            occt_version=symbols["version"],
         )
 
-    except ImportError:
-        logger.debug("pythonOCC not available")
-        return None
+    except StepImportError:
+        raise
     except Exception as e:
-        logger.warning("pythonOCC import failed", file=str(file_path), error=str(e))
+        logger.warning("STEP import failed", binding=label, file=file_path, error=str(e))
         return None
 
 
-def _try_freecad_occ_import(file_path: Path) -> LoadedModel | None:
-    """Attempt to load STEP file using FreeCAD OCC binding.
+def _try_pyocct_import(
+    file_path: str,
+    units: dict[str, str] | None = None,
+    file_stat: os.stat_result | None = None,
+) -> LoadedModel | None:
+    """Attempt to load STEP file using pyOCCT binding."""
+    return _load_with_reader("pyOCCT", file_path, units, file_stat)
 
-    Args:
-        file_path: Path to STEP file
 
-    Returns:
-        LoadedModel if successful, None if failed
-    """
-    try:
-        import OCC.Core
-        from OCC.Core.IFSelect import IFSelect_RetDone
-        from OCC.Core.Interface import Interface_Static
-        from OCC.Core.STEPControl import STEPControl_Reader
-
-        logger.debug("Attempting STEP import with FreeCAD OCC", file=str(file_path))
+def _try_pythonocc_import(
+    file_path: str,
+    units: dict[str, str] | None = None,
+    file_stat: os.stat_result | None = None,
+) -> LoadedModel | None:
+    """Attempt to load STEP file using pythonOCC binding."""
+    return _load_with_reader("pythonOCC", file_path, units, file_stat)
 
-        # Create reader and configure
-        reader = STEPControl_Reader()
 
-        # Set some common options for better compatibility
-        Interface_Static.SetCVal("xstep.cascade.unit", "mm")
-        Interface_Static.SetRVal("read.precision.mode", 1)
-        Interface_Static.SetRVal("read.precision.val", 0.01)
-
-        # Read file
-        status = reader.ReadFile(str(file_path))
-        if status != IFSelect_RetDone:
-            raise StepImportError(f"FreeCAD OCC read failed with status: {status}")
+def _try_freecad_occ_import(
+    file_path: str,
+    units: dict[str, str] | None = None,
+    file_stat: os.stat_result | None = None,
+) -> LoadedModel | None:
+    """Attempt to load STEP file using FreeCAD OCC binding."""
+    return _load_with_reader("freecad_occ", file_path, units, file_stat)
 
-        # Transfer geometry
-        nb_roots = reader.NbRootsForTransfer()
-        if nb_roots == 0:
-            raise StepImportError("No geometry roots found in STEP file")
 
-        logger.debug("Found geometry roots", count=nb_roots)
-        reader.TransferRoots()
+def _available_loaders() -> list[tuple[str, Callable[..., LoadedModel | None]]]:
+    """Get the STEP loaders for detected bindings, in order of preference.
 
-        # Get the unified shape
-        shape = reader.OneShape()
-        if shape.IsNull():
-            raise StepImportError("Failed to create unified shape from STEP file")
+    Relies on the memoized ``get_occt_info`` so bindings that are not
+    installed are never attempted.
 
-        # Extract units and metadata
-        units = _extract_step_units(file_path)
-
-        # Try to get more detailed unit info from OCCT
-        try:
-            length_unit = Interface_Static.CVal("xstep.cascade.unit")
-            if length_unit:
-                units["length"] = str(length_unit)
-        except Exception:
-            pass
-
-        metadata = {
-            "nb_roots": nb_roots,
-            "reader_type": "STEPControl_Reader",
-            "file_size": file_path.stat().st_size,
-        }
-
-        # Get version info - FreeCAD OCC may not have __version__
-        occt_version = getattr(OCC.Core, "__version__", "freecad_bundled")
-
-        return LoadedModel(
-            model_id=file_path.stem,
-            file_path=str(file_path),
-            occt_shape=shape,
-            units=units,
-            metadata=metadata,
-            occt_binding="freecad_occ",
-            occt_version=occt_version,
-        )
-
-    except ImportError:
-        logger.debug("FreeCAD OCC not available")
-        return None
-    except Exception as e:
-        logger.warning("FreeCAD OCC import failed", file=str(file_path), error=str(e))
-        return None
+    Returns:
+        List of (binding name, loader function) tuples
+    """
+    occt_info = get_occt_info()
+    loaders = [
+        ("pyOCCT", "pyOCCT_available", _try_pyocct_import),
+        ("pythonOCC", "pythonOCC_available", _try_pythonocc_import),
+        ("freecad_occ", "freecad_occ_available", _try_freecad_occ_import),
+    ]
+    return [(name, loader) for name, flag, loader in loaders if occt_info.get(flag)]
 
 
-def load_step(file_path: str | Path) -> LoadedModel:
+def load_step(file_path: str | Path, file_stat: os.stat_result | None = None) -> LoadedModel:
     """Load a STEP file using available OCCT bindings.
 
     This function attempts to load the STEP file using the available
@@ -477,6 +540,8 @@ def load_step(file_path: str | Path) -> LoadedModel:
 
     Args:
         file_path: Path to the STEP file
+        file_stat: Optional ``os.stat`` result for ``file_path`` from the
+            caller, saving a second stat of the same file
 
     Returns:
         LoadedModel containing the geometry and metadata
@@ -486,36 +551,50 @@ def load_step(file_path: str | Path) -> LoadedModel:
         OCCTNotAvailableError: If no OCCT binding is available
     """
     # Validate file first
-    validated_path = _validate_step_file(file_path)
+    validated_path, file_stat = _validate_step_file(file_path, file_stat)
 
-    logger.info("Loading STEP file", file=str(validated_path))
+    logger.info("Loading STEP file", file=validated_path)
 
-    # Try each binding in order of preference
-    loaders = [
-        ("pyOCCT", _try_pyocct_import),
-        ("pythonOCC", _try_pythonocc_import),
-        ("freecad_occ", _try_freecad_occ_import),
-    ]
+    # Single header read shared by the format check and unit detection
+    units = None
+    try:
+        is_step, units = _read_step_header_cached(
+            validated_path, file_stat.st_mtime_ns, file_stat.st_size
+        )
+        units = dict(units)
+        if not is_step:
+            logger.warning("File does not start with ISO-10303 header", file=validated_path)
+    except Exception as e:
+        logger.warning("Could not validate STEP header", file=validated_path, error=str(e))
 
     last_error = None
-    for binding_name, loader_func in loaders:
+    for binding_name, loader_func in _available_loaders():
         try:
-            result = loader_func(validated_path)
+            result = loader_func(validated_path, units, file_stat)
             if result is not None:
                 logger.info(
                     "Successfully loaded STEP file",
-                    file=str(validated_path),
+                    file=validated_path,
                     binding=binding_name,
                     model_id=result.model_id,
                     units=result.units,
                 )
                 return result
+        except StepImportError as e:
+            # The file itself is invalid; retrying with another binding is pointless
+            logger.warning(
+                "STEP file rejected by OCCT",
+                binding=binding_name,
+                file=validated_path,
+                error=str(e),
+            )
+            raise
         except Exception as e:
             last_error = e
             logger.warning(
                 "STEP import failed with binding",
                 binding=binding_name,
-                file=str(validated_path),
+                file=validated_path,
                 error=str(e),
             )
 
@@ -523,9 +602,9 @@ def load_step(file_path: str | Path) -> LoadedModel:
     occt_info = get_occt_info()
 
     if (
-        not occt_info["pyOCCT_available"]
-        and not occt_info["pythonOCC_available"]
-        and not occt_info["freecad_occ_available"]
+        not occt_info.get("pyOCCT_available")
+        and not occt_info.get("pythonOCC_available")
+        and not occt_info.get("freecad_occ_available")
     ):
         raise OCCTNotAvailableError(
             "No OCCT Python binding available. "
@@ -539,4 +618,69 @@ def load_step(file_path: str | Path) -> LoadedModel:
     if last_error:
         raise StepImportError(f"Failed to load STEP file with available bindings: {last_error}")
     else:
-        raise StepImportError("Failed to load STEP file: unknown error")
+        raise StepImportError("Failed to load STEP file with available bindings")
+
+
+def _warm_worker() -> None:
+    """Pool initializer: run binding detection once per worker."""
+    get_occt_info()
+
+
+def _load_one(file_path: str | Path) -> LoadedModel | Exception:
+    """Load a single STEP file, returning the error instead of raising it."""
+    try:
+        return load_step(file_path)
+    except Exception as e:
+        return e
+
+
+def load_step_batch(
+    file_paths: Iterable[str | Path],
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> list[LoadedModel | Exception]:
+    """Load many STEP files in parallel.
+
+    STEP parsing dominates ingestion cost and is independent per file, so
+    files are spread over a worker pool. Threads are used by default: the
+    SWIG/pybind shapes of pythonOCC and pyOCCT cannot be pickled back from
+    worker processes. ``use_processes=True`` is only useful for bindings
+    whose shapes pickle and whose readers are not thread-safe.
+
+    A failure for one file, including a worker crash or a result that
+    cannot be sent back, is recorded in that file's slot and does not
+    abort the rest of the batch.
+
+    Args:
+        file_paths: Paths to STEP files
+        max_workers: Pool size (defaults to the CPU count)
+        use_processes: Use a process pool rather than a thread pool
+
+    Returns:
+        One entry per input path, in order: the LoadedModel, or the exception
+        raised while loading that file
+    """
+    paths = list(file_paths)
+    if len(paths) <= 1:
+        return [_load_one(path) for path in paths]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    executor: Executor
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_worker)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers, initializer=_warm_worker)
+
+    logger.info(
+        "Loading STEP batch", count=len(paths), workers=max_workers, processes=use_processes
+    )
+
+    results: list[LoadedModel | Exception] = []
+    with executor:
+        futures = [executor.submit(_load_one, path) for path in paths]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
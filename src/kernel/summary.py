@@ -6,514 +6,475 @@ summaries for the STEPGraph-IR representation.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-
+import importlib
+import pickle
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+
+import numpy as np
+import orjson
 import structlog
 
 from .occt_io import LoadedModel
+from .triangulation import triangulation_vertices
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
-class GeometrySummary:
-    """Summary of geometric properties and topology."""
-
-    model_id: str
-    units: dict[str, str]
-
-    # Topological counts
-    solids: int = 0
-    shells: int = 0
-    faces: int = 0
-    edges: int = 0
-    vertices: int = 0
-
-    # Geometric properties
-    bounding_box: dict[str, float] | None = None
-    surface_area: float | None = None
-    volume: float | None = None
-
-    # Analysis flags
-    has_pmi: bool = False
-    has_assemblies: bool = False
-    has_curves: bool = False
-    has_surfaces: bool = False
-
-    # Metadata
-    file_size: int = 0
-    occt_binding: str = ""
-    analysis_warnings: list[str] = None
+_COUNT_KEYS = ("solids", "shells", "faces", "edges", "vertices")
 
-    def __post_init__(self) -> None:
-        """Initialize warnings list if None."""
-        if self.analysis_warnings is None:
-            self.analysis_warnings = []
+# OCCT packages backing each binding label used by LoadedModel.occt_binding,
+# in the same order of preference as the STEP loader
+_BINDING_PACKAGES = {
+    "pyOCCT": ("OCCT",),
+    "pythonOCC": ("OCP", "OCC.Core"),
+    "freecad_occ": ("OCC.Core",),
+}
 
 
-def _count_topology_pyocct(shape: Any) -> dict[str, int]:
-    """Count topological entities using pyOCCT.
+def _resolve_binding_symbols(package: str) -> SimpleNamespace | None:
+    """Import the OCCT symbols used for summaries, or None if not installed.
 
     Args:
-        shape: TopoDS_Shape from pyOCCT
+        package: Top-level OCCT package ("OCCT", "OCP" or "OCC.Core")
 
     Returns:
-        Dictionary with entity counts
+        Namespace of counting, bounding box and mass property callables
     """
+
+    def module(name: str) -> Any:
+        return importlib.import_module(f"{package}.{name}")
+
     try:
-        from OCCT.TopAbs import TopAbs_EDGE, TopAbs_FACE, TopAbs_SHELL, TopAbs_SOLID, TopAbs_VERTEX
-        from OCCT.TopExp import TopExp_Explorer
-
-        counts = {
-            "solids": 0,
-            "shells": 0,
-            "faces": 0,
-            "edges": 0,
-            "vertices": 0,
-        }
+        top_abs = module("TopAbs")
+        top_exp = module("TopExp")
+        bnd_lib = module("BRepBndLib")
+        gprop_lib = module("BRepGProp")
+
+        # Static method spelling differs per binding
+        if package == "OCCT":
+            map_shapes = top_exp.TopExp.MapShapes_
+        elif package == "OCP":
+            map_shapes = top_exp.TopExp.MapShapes_s
+        else:
+            map_shapes = getattr(top_exp, "topexp_MapShapes", None) or top_exp.topexp.MapShapes
+
+        # AddOptimal only exists from OCCT 7.2; precise boxes fall back to Add
+        if package == "OCCT":
+            bnd_add_optimal = getattr(bnd_lib.BRepBndLib, "AddOptimal_", None)
+        elif package == "OCP":
+            bnd_add_optimal = getattr(bnd_lib.BRepBndLib, "AddOptimal_s", None)
+        else:
+            bnd_add_optimal = getattr(bnd_lib, "brepbndlib_AddOptimal", None)
+
+        if package == "OCC.Core":
+            bnd_add = bnd_lib.brepbndlib_Add
+            surface_properties = gprop_lib.brepgprop_SurfaceProperties
+            volume_properties = gprop_lib.brepgprop_VolumeProperties
+        else:
+            bnd_add = bnd_lib.BRepBndLib_Add
+            surface_properties = gprop_lib.BRepGProp_SurfaceProperties
+            volume_properties = gprop_lib.BRepGProp_VolumeProperties
+
+        return SimpleNamespace(
+            map_shapes=map_shapes,
+            shape_map=module("TopTools").TopTools_IndexedMapOfShape,
+            type_mappings=(
+                (top_abs.TopAbs_VERTEX, "vertices"),
+                (top_abs.TopAbs_EDGE, "edges"),
+                (top_abs.TopAbs_FACE, "faces"),
+                (top_abs.TopAbs_SHELL, "shells"),
+                (top_abs.TopAbs_SOLID, "solids"),
+            ),
+            bnd_box=module("Bnd").Bnd_Box,
+            bnd_add=bnd_add,
+            bnd_add_optimal=bnd_add_optimal,
+            gprops=module("GProp").GProp_GProps,
+            surface_properties=surface_properties,
+            volume_properties=volume_properties,
+        )
+    except (ImportError, AttributeError):
+        return None
 
-        # Count each type of topological entity
-        type_mappings = [
-            (TopAbs_SOLID, "solids"),
-            (TopAbs_SHELL, "shells"),
-            (TopAbs_FACE, "faces"),
-            (TopAbs_EDGE, "edges"),
-            (TopAbs_VERTEX, "vertices"),
-        ]
-
-        for topo_type, count_key in type_mappings:
-            explorer = TopExp_Explorer(shape, topo_type)
-            count = 0
-            while explorer.More():
-                count += 1
-                explorer.Next()
-            counts[count_key] = count
 
-        return counts
+def _resolve_first(packages: tuple[str, ...]) -> SimpleNamespace | None:
+    """Resolve symbols from the first installed package of a binding."""
+    for package in packages:
+        symbols = _resolve_binding_symbols(package)
+        if symbols is not None:
+            return symbols
+    return None
 
-    except Exception as e:
-        logger.warning("Failed to count topology with pyOCCT", error=str(e))
-        return {"solids": 0, "shells": 0, "faces": 0, "edges": 0, "vertices": 0}
 
+# Summary symbols of each installed binding, resolved once at module load so
+# the analysis functions never go through the import machinery
+_BINDINGS: dict[str, SimpleNamespace] = {
+    name: symbols
+    for name, packages in _BINDING_PACKAGES.items()
+    if (symbols := _resolve_first(packages)) is not None
+}
 
-def _count_topology_pythonocc(shape: Any) -> dict[str, int]:
-    """Count topological entities using pythonOCC.
 
-    Args:
-        shape: TopoDS_Shape from pythonOCC
+# Relative error bound for volume integration; summaries do not need more
+_VOLUME_TOLERANCE = 1e-3
 
-    Returns:
-        Dictionary with entity counts
-    """
-    try:
-        from OCP.TopAbs import TopAbs_EDGE, TopAbs_FACE, TopAbs_SHELL, TopAbs_SOLID, TopAbs_VERTEX
-        from OCP.TopExp import TopExp_Explorer
-
-        counts = {
-            "solids": 0,
-            "shells": 0,
-            "faces": 0,
-            "edges": 0,
-            "vertices": 0,
-        }
+# Marks a mass property that has not been computed yet
+_PENDING: Any = object()
 
-        # Count each type of topological entity
-        type_mappings = [
-            (TopAbs_SOLID, "solids"),
-            (TopAbs_SHELL, "shells"),
-            (TopAbs_FACE, "faces"),
-            (TopAbs_EDGE, "edges"),
-            (TopAbs_VERTEX, "vertices"),
-        ]
-
-        for topo_type, count_key in type_mappings:
-            explorer = TopExp_Explorer(shape, topo_type)
-            count = 0
-            while explorer.More():
-                count += 1
-                explorer.Next()
-            counts[count_key] = count
 
-        return counts
+class BBox(NamedTuple):
+    """Axis-aligned bounding box corners."""
 
-    except Exception as e:
-        logger.warning("Failed to count topology with pythonOCC", error=str(e))
-        return {"solids": 0, "shells": 0, "faces": 0, "edges": 0, "vertices": 0}
+    min_x: float
+    min_y: float
+    min_z: float
+    max_x: float
+    max_y: float
+    max_z: float
 
 
-def _compute_bounding_box_pyocct(shape: Any) -> dict[str, float] | None:
-    """Compute bounding box using pyOCCT.
+@dataclass(slots=True)
+class _MassProperties:
+    """Surface area and volume, possibly pending until first read.
 
-    Args:
-        shape: TopoDS_Shape from pyOCCT
+    Kept outside the frozen summary so it can be filled in later.
+    """
 
-    Returns:
-        Bounding box dictionary or None if computation fails
+    surface_area: float | None = None
+    volume: float | None = None
+    # (shape, binding) used to resolve pending values
+    source: tuple[Any, str] | None = None
+    warnings: tuple[str, ...] = ()
+
+    def resolve(self) -> None:
+        """Compute pending surface area and volume, then drop the shape."""
+        if self.source is None:
+            return
+        shape, binding = self.source
+        self.source = None
+
+        surface_area, volume = _compute_mass_properties(
+            shape,
+            binding,
+            compute_area=self.surface_area is _PENDING,
+            compute_volume=self.volume is _PENDING,
+        )
+        warnings = []
+        if self.surface_area is _PENDING:
+            self.surface_area = surface_area
+            if surface_area is None:
+                warnings.append("Could not compute surface area")
+        if self.volume is _PENDING:
+            self.volume = volume
+            if volume is None:
+                warnings.append("Could not compute volume")
+        self.warnings = tuple(warnings)
+
+
+@dataclass(slots=True, frozen=True)
+class GeometrySummary:
+    """Summary of geometric properties and topology.
+
+    ``surface_area`` and ``volume`` may be left pending by
+    ``summarize_shape``; they are computed from the shape on first access,
+    which is also when their failure warnings are added. Reading
+    ``analysis_warnings`` resolves them first so the list is complete.
     """
-    try:
-        from OCCT.Bnd import Bnd_Box
-        from OCCT.BRepBndLib import BRepBndLib_Add
 
-        bbox = Bnd_Box()
-        BRepBndLib_Add(shape, bbox)
+    model_id: str
+    length_unit: str
+    angle_unit: str
 
-        if bbox.IsVoid():
-            return None
+    # Topological counts
+    solids: int = 0
+    shells: int = 0
+    faces: int = 0
+    edges: int = 0
+    vertices: int = 0
 
-        xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
+    # Geometric properties
+    bbox: BBox | None = None
+    mass: _MassProperties = field(default_factory=_MassProperties, repr=False, compare=False)
+
+    # Analysis flags
+    has_pmi: bool = False
+    has_assemblies: bool = False
+    has_curves: bool = False
+    has_surfaces: bool = False
 
+    # Metadata
+    file_size: int = 0
+    occt_binding: str = ""
+    warnings: tuple[str, ...] = ()
+
+    @property
+    def units(self) -> dict[str, str]:
+        """Units as a dictionary."""
+        return {"length": self.length_unit, "angle": self.angle_unit}
+
+    @property
+    def bounding_box(self) -> dict[str, float] | None:
+        """Bounding box as a dictionary, or None if unavailable."""
+        return self.bbox._asdict() if self.bbox is not None else None
+
+    @property
+    def surface_area(self) -> float | None:
+        """Total surface area, computed on first access if pending."""
+        if self.mass.surface_area is _PENDING:
+            self.mass.resolve()
+        return self.mass.surface_area
+
+    @property
+    def volume(self) -> float | None:
+        """Total volume, computed on first access if pending."""
+        if self.mass.volume is _PENDING:
+            self.mass.resolve()
+        return self.mass.volume
+
+    @property
+    def analysis_warnings(self) -> tuple[str, ...]:
+        """All analysis warnings, including those from mass properties."""
+        self.mass.resolve()
+        if not self.mass.warnings:
+            return self.warnings
+        return self.warnings + self.mass.warnings
+
+    def to_dict(self) -> dict[str, Any]:
+        """Nested dictionary view used by the MCP tools and JSON output."""
         return {
-            "min_x": float(xmin),
-            "min_y": float(ymin),
-            "min_z": float(zmin),
-            "max_x": float(xmax),
-            "max_y": float(ymax),
-            "max_z": float(zmax),
+            "units": self.units,
+            "topology": {
+                "solids": self.solids,
+                "shells": self.shells,
+                "faces": self.faces,
+                "edges": self.edges,
+                "vertices": self.vertices,
+            },
+            "properties": {
+                "bounding_box": self.bounding_box,
+                "surface_area": self.surface_area,
+                "volume": self.volume,
+            },
+            "analysis": {
+                "has_pmi": self.has_pmi,
+                "has_assemblies": self.has_assemblies,
+                "has_curves": self.has_curves,
+                "has_surfaces": self.has_surfaces,
+            },
+            "metadata": {
+                "file_size": self.file_size,
+                "occt_binding": self.occt_binding,
+                "warnings": list(self.analysis_warnings),
+            },
         }
 
-    except Exception as e:
-        logger.warning("Failed to compute bounding box with pyOCCT", error=str(e))
+    def to_json(self) -> bytes:
+        """Encode ``to_dict()`` as UTF-8 JSON bytes with orjson."""
+        return orjson.dumps(self.to_dict())
+
+
+def _bbox_from_vertices(vertices: np.ndarray) -> BBox | None:
+    """Bounding box of an (N, 3) vertex array, or None if it is empty."""
+    if not len(vertices):
         return None
+    return BBox(*vertices.min(axis=0).tolist(), *vertices.max(axis=0).tolist())
+
 
+def _compute_bounding_box(shape: Any, binding: str, precise: bool = False) -> BBox | None:
+    """Compute the axis-aligned bounding box of a shape.
 
-def _compute_bounding_box_pythonocc(shape: Any) -> dict[str, float] | None:
-    """Compute bounding box using pythonOCC.
+    The default ``Add`` pass reads any existing triangulation and pads the
+    box by shape tolerances, which is loose but cheap and enough for a
+    summary. ``precise`` uses ``AddOptimal`` instead, which fits spline
+    surfaces tightly at several times the cost.
 
     Args:
-        shape: TopoDS_Shape from pythonOCC
+        shape: TopoDS_Shape
+        binding: OCCT binding name
+        precise: Compute tight bounds with ``AddOptimal``
 
     Returns:
-        Bounding box dictionary or None if computation fails
+        Bounding box corners or None if computation fails
     """
-    try:
-        from OCP.Bnd import Bnd_Box
-        from OCP.BRepBndLib import BRepBndLib_Add
+    symbols = _BINDINGS.get(binding)
+    if symbols is None:
+        logger.debug("OCCT binding not available for bounding box", binding=binding)
+        return None
 
-        bbox = Bnd_Box()
-        BRepBndLib_Add(shape, bbox)
+    try:
+        bbox = symbols.bnd_box()
+        if precise and symbols.bnd_add_optimal is not None:
+            symbols.bnd_add_optimal(shape, bbox, True, False)
+        else:
+            symbols.bnd_add(shape, bbox, True)
 
         if bbox.IsVoid():
-            return None
-
-        xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
+            # Fall back to the nodes of any triangulation already on the shape
+            return _bbox_from_vertices(triangulation_vertices(shape, binding))
 
-        return {
-            "min_x": float(xmin),
-            "min_y": float(ymin),
-            "min_z": float(zmin),
-            "max_x": float(xmax),
-            "max_y": float(ymax),
-            "max_z": float(zmax),
-        }
+        return BBox(*map(float, bbox.Get()))
 
     except Exception as e:
-        logger.warning("Failed to compute bounding box with pythonOCC", error=str(e))
+        logger.warning("Failed to compute bounding box", binding=binding, error=str(e))
         return None
 
 
-def _compute_mass_properties_pyocct(shape: Any) -> tuple[float | None, float | None]:
-    """Compute mass properties (surface area, volume) using pyOCCT.
+def _compute_mass_properties(
+    shape: Any, binding: str, compute_area: bool = True, compute_volume: bool = True
+) -> tuple[float | None, float | None]:
+    """Compute mass properties (surface area, volume) of a shape.
 
     Args:
-        shape: TopoDS_Shape from pyOCCT
+        shape: TopoDS_Shape
+        binding: OCCT binding name
+        compute_area: Whether to compute the surface area
+        compute_volume: Whether to compute the volume
 
     Returns:
-        Tuple of (surface_area, volume) or (None, None) if computation fails
+        Tuple of (surface_area, volume); either is None if it was skipped or
+        cannot be computed
     """
-    try:
-        from OCCT.BRepGProp import BRepGProp_SurfaceProperties, BRepGProp_VolumeProperties
-        from OCCT.GProp import GProp_GProps
+    # Each property is one whole-shape BRepGProp call that walks the faces
+    # in C++. Fusing these with the bounding box into a per-face loop would
+    # save B-Rep walks but cost several Python/OCCT crossings per face, and
+    # would force area/volume to be computed eagerly with the bbox.
+    symbols = _BINDINGS.get(binding)
+    if symbols is None:
+        logger.debug("OCCT binding not available for mass properties", binding=binding)
+        return None, None
 
-        # Surface area
-        surface_area = None
+    # Surface area
+    surface_area = None
+    if compute_area:
         try:
-            surface_props = GProp_GProps()
-            BRepGProp_SurfaceProperties(shape, surface_props)
+            surface_props = symbols.gprops()
+            symbols.surface_properties(shape, surface_props)
             surface_area = float(surface_props.Mass())
         except Exception as e:
             logger.debug("Failed to compute surface area", error=str(e))
 
-        # Volume
-        volume = None
+    # Volume, integrated to a relative tolerance with shared faces skipped
+    volume = None
+    if compute_volume:
         try:
-            volume_props = GProp_GProps()
-            BRepGProp_VolumeProperties(shape, volume_props)
+            volume_props = symbols.gprops()
+            symbols.volume_properties(shape, volume_props, _VOLUME_TOLERANCE, False, True)
             volume = float(volume_props.Mass())
         except Exception as e:
             logger.debug("Failed to compute volume", error=str(e))
 
-        return surface_area, volume
+    return surface_area, volume
 
-    except Exception as e:
-        logger.warning("Failed to compute mass properties with pyOCCT", error=str(e))
-        return None, None
 
-
-def _compute_mass_properties_pythonocc(shape: Any) -> tuple[float | None, float | None]:
-    """Compute mass properties (surface area, volume) using pythonOCC.
+def _analyze_geometry_content(counts: dict[str, int]) -> dict[str, bool]:
+    """Derive content flags from topology counts without touching the shape.
 
     Args:
-        shape: TopoDS_Shape from pythonOCC
+        counts: Entity counts as returned by ``_count_topology``
 
     Returns:
-        Tuple of (surface_area, volume) or (None, None) if computation fails
+        Dictionary with analysis flags
     """
-    try:
-        from OCP.BRepGProp import BRepGProp_SurfaceProperties, BRepGProp_VolumeProperties
-        from OCP.GProp import GProp_GProps
-
-        # Surface area
-        surface_area = None
-        try:
-            surface_props = GProp_GProps()
-            BRepGProp_SurfaceProperties(shape, surface_props)
-            surface_area = float(surface_props.Mass())
-        except Exception as e:
-            logger.debug("Failed to compute surface area", error=str(e))
-
-        # Volume
-        volume = None
-        try:
-            volume_props = GProp_GProps()
-            BRepGProp_VolumeProperties(shape, volume_props)
-            volume = float(volume_props.Mass())
-        except Exception as e:
-            logger.debug("Failed to compute volume", error=str(e))
-
-        return surface_area, volume
+    return {
+        "has_curves": counts["edges"] > 0,
+        "has_surfaces": counts["faces"] > 0,
+        "has_assemblies": False,
+        "has_pmi": False,  # TODO: Implement PMI detection in Phase 1
+    }
 
-    except Exception as e:
-        logger.warning("Failed to compute mass properties with pythonOCC", error=str(e))
-        return None, None
 
+def _count_topology(shape: Any, binding: str) -> dict[str, int]:
+    """Count topological entities.
 
-def _count_topology_freecad_occ(shape: Any) -> dict[str, int]:
-    """Count topological entities using FreeCAD OCC.
+    Each entity type is collected by TopExp::MapShapes into an indexed map
+    in C++, so the count is a single ``Extent()`` call rather than a Python
+    loop over an explorer. Shared sub-shapes are counted once.
 
     Args:
-        shape: TopoDS_Shape from FreeCAD OCC
+        shape: TopoDS_Shape
+        binding: OCCT binding name
 
     Returns:
-        Dictionary with entity counts
+        Dictionary with entity counts (all zero if counting fails)
     """
-    try:
-        from OCC.Core.TopAbs import (
-            TopAbs_EDGE,
-            TopAbs_FACE,
-            TopAbs_SHELL,
-            TopAbs_SOLID,
-            TopAbs_VERTEX,
-        )
-        from OCC.Core.TopExp import TopExp_Explorer
-
-        counts = {
-            "solids": 0,
-            "shells": 0,
-            "faces": 0,
-            "edges": 0,
-            "vertices": 0,
-        }
-
-        # Count each type of topological entity
-        type_mappings = [
-            (TopAbs_SOLID, "solids"),
-            (TopAbs_SHELL, "shells"),
-            (TopAbs_FACE, "faces"),
-            (TopAbs_EDGE, "edges"),
-            (TopAbs_VERTEX, "vertices"),
-        ]
-
-        for topo_type, count_key in type_mappings:
-            explorer = TopExp_Explorer(shape, topo_type)
-            count = 0
-            while explorer.More():
-                count += 1
-                explorer.Next()
-            counts[count_key] = count
+    counts = dict.fromkeys(_COUNT_KEYS, 0)
 
+    symbols = _BINDINGS.get(binding)
+    if symbols is None:
+        logger.debug("OCCT binding not available for topology counting", binding=binding)
         return counts
 
-    except Exception as e:
-        logger.warning("Failed to count topology with FreeCAD OCC", error=str(e))
-        return {"solids": 0, "shells": 0, "faces": 0, "edges": 0, "vertices": 0}
-
-
-def _compute_bounding_box_freecad_occ(shape: Any) -> dict[str, float] | None:
-    """Compute bounding box using FreeCAD OCC.
-
-    Args:
-        shape: TopoDS_Shape from FreeCAD OCC
-
-    Returns:
-        Bounding box dictionary or None if computation fails
-    """
     try:
-        from OCC.Core.Bnd import Bnd_Box
-        from OCC.Core.BRepBndLib import brepbndlib_Add
-
-        bbox = Bnd_Box()
-        brepbndlib_Add(shape, bbox)
-
-        if bbox.IsVoid():
-            return None
-
-        xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
-
-        return {
-            "min_x": float(xmin),
-            "min_y": float(ymin),
-            "min_z": float(zmin),
-            "max_x": float(xmax),
-            "max_y": float(ymax),
-            "max_z": float(zmax),
-        }
-
+        for topo_type, count_key in symbols.type_mappings:
+            shape_map = symbols.shape_map()
+            symbols.map_shapes(shape, topo_type, shape_map)
+            counts[count_key] = shape_map.Extent()
     except Exception as e:
-        logger.warning("Failed to compute bounding box with FreeCAD OCC", error=str(e))
-        return None
-
+        logger.warning("Failed to count topology", binding=binding, error=str(e))
+        return dict.fromkeys(_COUNT_KEYS, 0)
 
-def _compute_mass_properties_freecad_occ(shape: Any) -> tuple[float | None, float | None]:
-    """Compute mass properties (surface area, volume) using FreeCAD OCC.
-
-    Args:
-        shape: TopoDS_Shape from FreeCAD OCC
+    return counts
 
-    Returns:
-        Tuple of (surface_area, volume) or (None, None) if computation fails
-    """
-    try:
-        from OCC.Core.BRepGProp import brepgprop_SurfaceProperties, brepgprop_VolumeProperties
-        from OCC.Core.GProp import GProp_GProps
 
-        # Surface area
-        surface_area = None
-        try:
-            surface_props = GProp_GProps()
-            brepgprop_SurfaceProperties(shape, surface_props)
-            surface_area = float(surface_props.Mass())
-        except Exception as e:
-            logger.debug("Failed to compute surface area", error=str(e))
-
-        # Volume
-        volume = None
-        try:
-            volume_props = GProp_GProps()
-            brepgprop_VolumeProperties(shape, volume_props)
-            volume = float(volume_props.Mass())
-        except Exception as e:
-            logger.debug("Failed to compute volume", error=str(e))
-
-        return surface_area, volume
-
-    except Exception as e:
-        logger.warning("Failed to compute mass properties with FreeCAD OCC", error=str(e))
-        return None, None
-
-
-def _analyze_geometry_content(shape: Any, binding: str) -> dict[str, bool]:
-    """Analyze geometric content for presence of different entity types.
+def _build_summary(
+    model_id: str,
+    shape: Any,
+    binding: str,
+    file_size: int,
+    units: dict[str, str],
+    counts: tuple[int, ...] | None = None,
+    bbox: BBox | None = None,
+) -> GeometrySummary:
+    """Run the topology and property analysis behind ``summarize_shape``.
 
     Args:
+        model_id: Model identifier
         shape: TopoDS_Shape
         binding: OCCT binding name
-
-    Returns:
-        Dictionary with analysis flags
-    """
-    analysis = {
-        "has_curves": False,
-        "has_surfaces": False,
-        "has_assemblies": False,
-        "has_pmi": False,  # TODO: Implement PMI detection in Phase 1
-    }
-
-    try:
-        if binding == "pyOCCT":
-            from OCCT.TopAbs import TopAbs_EDGE, TopAbs_FACE
-            from OCCT.TopExp import TopExp_Explorer
-
-            # Check for edges (curves)
-            edge_explorer = TopExp_Explorer(shape, TopAbs_EDGE)
-            if edge_explorer.More():
-                analysis["has_curves"] = True
-
-            # Check for faces (surfaces)
-            face_explorer = TopExp_Explorer(shape, TopAbs_FACE)
-            if face_explorer.More():
-                analysis["has_surfaces"] = True
-
-        elif binding == "pythonOCC":
-            from OCP.TopAbs import TopAbs_EDGE, TopAbs_FACE
-            from OCP.TopExp import TopExp_Explorer
-
-            # Check for edges (curves)
-            edge_explorer = TopExp_Explorer(shape, TopAbs_EDGE)
-            if edge_explorer.More():
-                analysis["has_curves"] = True
-
-            # Check for faces (surfaces)
-            face_explorer = TopExp_Explorer(shape, TopAbs_FACE)
-            if face_explorer.More():
-                analysis["has_surfaces"] = True
-
-        elif binding == "freecad_occ":
-            from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
-            from OCC.Core.TopExp import TopExp_Explorer
-
-            # Check for edges (curves)
-            edge_explorer = TopExp_Explorer(shape, TopAbs_EDGE)
-            if edge_explorer.More():
-                analysis["has_curves"] = True
-
-            # Check for faces (surfaces)
-            face_explorer = TopExp_Explorer(shape, TopAbs_FACE)
-            if face_explorer.More():
-                analysis["has_surfaces"] = True
-
-    except Exception as e:
-        logger.warning("Failed to analyze geometry content", binding=binding, error=str(e))
-
-    return analysis
-
-
-def summarize_shape(loaded_model: LoadedModel) -> GeometrySummary:
-    """Generate a comprehensive summary of the loaded geometry.
-
-    Args:
-        loaded_model: LoadedModel containing the geometry
+        file_size: Source file size in bytes
+        units: Units dictionary
+        counts: Known entity counts in ``_COUNT_KEYS`` order, skipping the count
+        bbox: Known bounding box, skipping its computation
 
     Returns:
         GeometrySummary with topology counts and properties
     """
-    logger.info("Generating geometry summary", model_id=loaded_model.model_id)
+    logger.info("Generating geometry summary", model_id=model_id)
 
     warnings = []
-    binding = loaded_model.occt_binding
-
-    # Count topological entities
-    if binding == "pyOCCT":
-        topology_counts = _count_topology_pyocct(loaded_model.occt_shape)
-        bounding_box = _compute_bounding_box_pyocct(loaded_model.occt_shape)
-        surface_area, volume = _compute_mass_properties_pyocct(loaded_model.occt_shape)
-    elif binding == "pythonOCC":
-        topology_counts = _count_topology_pythonocc(loaded_model.occt_shape)
-        bounding_box = _compute_bounding_box_pythonocc(loaded_model.occt_shape)
-        surface_area, volume = _compute_mass_properties_pythonocc(loaded_model.occt_shape)
-    elif binding == "freecad_occ":
-        topology_counts = _count_topology_freecad_occ(loaded_model.occt_shape)
-        bounding_box = _compute_bounding_box_freecad_occ(loaded_model.occt_shape)
-        surface_area, volume = _compute_mass_properties_freecad_occ(loaded_model.occt_shape)
+    topology_counts = dict(zip(_COUNT_KEYS, counts, strict=True)) if counts is not None else None
+    bounding_box = bbox
+
+    if binding in _BINDINGS:
+        if topology_counts is None:
+            topology_counts = _count_topology(shape, binding)
+        if bounding_box is None:
+            bounding_box = _compute_bounding_box(shape, binding)
+
+        # Mass properties are left for first access on the summary. Area
+        # needs faces and volume needs solids; otherwise skip the
+        # integration entirely rather than let OCCT fail on the shape.
+        surface_area = _PENDING if topology_counts["faces"] else None
+        volume = _PENDING if topology_counts["solids"] else None
+        if surface_area is _PENDING or volume is _PENDING:
+            mass_source = (shape, binding)
+        else:
+            mass_source = None
     else:
-        logger.error("Unknown OCCT binding", binding=binding)
-        topology_counts = {"solids": 0, "shells": 0, "faces": 0, "edges": 0, "vertices": 0}
-        bounding_box = None
+        if topology_counts is None:
+            topology_counts = _count_topology(shape, binding)
         surface_area, volume = None, None
-        warnings.append(f"Unknown OCCT binding: {binding}")
+        mass_source = None
+        if binding not in _BINDING_PACKAGES:
+            logger.error("Unknown OCCT binding", binding=binding)
+            warnings.append(f"Unknown OCCT binding: {binding}")
+        warnings.append("Could not compute surface area")
+        warnings.append("Could not compute volume")
 
-    # Analyze geometric content
-    content_analysis = _analyze_geometry_content(loaded_model.occt_shape, binding)
+    content_analysis = _analyze_geometry_content(topology_counts)
 
     # Check for potential issues
     if topology_counts["faces"] == 0 and topology_counts["edges"] > 0:
@@ -525,45 +486,151 @@ def summarize_shape(loaded_model: LoadedModel) -> GeometrySummary:
     if bounding_box is None:
         warnings.append("Could not compute bounding box")
 
-    if surface_area is None:
-        warnings.append("Could not compute surface area")
-
-    if volume is None:
-        warnings.append("Could not compute volume")
-
     # Create summary
     summary = GeometrySummary(
-        model_id=loaded_model.model_id,
-        units=loaded_model.units.copy(),
+        model_id=model_id,
+        length_unit=units.get("length", "mm"),
+        angle_unit=units.get("angle", "deg"),
         solids=topology_counts["solids"],
         shells=topology_counts["shells"],
         faces=topology_counts["faces"],
         edges=topology_counts["edges"],
         vertices=topology_counts["vertices"],
-        bounding_box=bounding_box,
-        surface_area=surface_area,
-        volume=volume,
+        bbox=bounding_box,
+        mass=_MassProperties(surface_area, volume, mass_source),
         has_pmi=content_analysis["has_pmi"],
         has_assemblies=content_analysis["has_assemblies"],
         has_curves=content_analysis["has_curves"],
         has_surfaces=content_analysis["has_surfaces"],
-        file_size=loaded_model.metadata.get("file_size", 0),
+        file_size=file_size,
         occt_binding=binding,
-        analysis_warnings=warnings,
+        warnings=tuple(warnings),
     )
 
     logger.info(
         "Geometry summary completed",
-        model_id=loaded_model.model_id,
+        model_id=model_id,
         faces=summary.faces,
         edges=summary.edges,
         vertices=summary.vertices,
-        warnings_count=len(warnings),
+        warnings_count=len(summary.warnings),
     )
 
     return summary
 
 
+def _metadata_counts(metadata: dict[str, Any]) -> tuple[int, ...] | None:
+    """Topology counts recorded by the loader, if complete and well-formed."""
+    counts = metadata.get("topology_counts")
+    if not isinstance(counts, dict):
+        return None
+    try:
+        return tuple(int(counts[key]) for key in _COUNT_KEYS)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _metadata_bbox(metadata: dict[str, Any]) -> BBox | None:
+    """Bounding box recorded by the loader, if complete and well-formed."""
+    bbox = metadata.get("bounding_box")
+    if not isinstance(bbox, dict):
+        return None
+    try:
+        return BBox(*(float(bbox[key]) for key in BBox._fields))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def summarize_shape(loaded_model: LoadedModel, force_recompute: bool = False) -> GeometrySummary:
+    """Generate a comprehensive summary of the loaded geometry.
+
+    Topology counts and the bounding box are taken from
+    ``loaded_model.metadata`` ("topology_counts", "bounding_box") when a
+    producer has already recorded them. Nothing is cached here: the
+    summary holds on to the shape only until its mass properties are
+    read, so callers that reuse summaries (the MCP session) keep them
+    alongside the model and drop both together.
+
+    Args:
+        loaded_model: LoadedModel containing the geometry
+        force_recompute: Ignore recorded metadata and analyse the shape
+
+    Returns:
+        GeometrySummary with topology counts and properties
+    """
+    model_id = loaded_model.model_id
+    shape = loaded_model.occt_shape
+    binding = loaded_model.occt_binding
+    units = loaded_model.units
+    metadata = loaded_model.metadata
+    file_size = metadata.get("file_size", 0)
+
+    if force_recompute:
+        return _build_summary(model_id, shape, binding, file_size, units)
+
+    return _build_summary(
+        model_id, shape, binding, file_size, units,
+        _metadata_counts(metadata), _metadata_bbox(metadata),
+    )
+
+
+def _summarize_resolved(loaded_model: LoadedModel) -> GeometrySummary:
+    """Summarize in a worker process with mass properties already computed.
+
+    Pending values cannot cross the process boundary: the shape would be
+    pickled back and the ``_PENDING`` sentinel would not survive.
+    """
+    summary = summarize_shape(loaded_model)
+    summary.mass.resolve()
+    return summary
+
+
+def _models_picklable(models: list[LoadedModel]) -> bool:
+    """Whether the models can be sent to worker processes.
+
+    Picklability depends on the binding's shape type, so one model per
+    binding is tried before anything is dispatched; errors raised by the
+    workers themselves are then left to propagate.
+    """
+    probes = {model.occt_binding: model for model in models}
+    try:
+        for model in probes.values():
+            pickle.dumps(model)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.info("Shapes cannot be sent to worker processes, using threads", error=str(e))
+        return False
+    return True
+
+
+def summarize_shapes(
+    models: Iterable[LoadedModel], max_workers: int | None = None
+) -> list[GeometrySummary]:
+    """Summarize many models in parallel, preserving their order.
+
+    Models are spread over a process pool, each worker resolving the OCCT
+    symbols once when it imports this module. Shapes from bindings that
+    cannot be pickled are summarized on a thread pool instead, which still
+    overlaps the OCCT work that runs outside the GIL.
+
+    Args:
+        models: Loaded models to summarize
+        max_workers: Pool size (defaults to the executor's own default)
+
+    Returns:
+        One GeometrySummary per model, in input order
+    """
+    models = list(models)
+    if len(models) < 2 or max_workers == 1:
+        return [summarize_shape(model) for model in models]
+
+    if _models_picklable(models):
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_summarize_resolved, models, chunksize=4))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(summarize_shape, models))
+
+
 def create_placeholder_summary(model_id: str, error_message: str) -> GeometrySummary:
     """Create a placeholder summary when geometry analysis fails.
 
@@ -576,6 +643,7 @@ def create_placeholder_summary(model_id: str, error_message: str) -> GeometrySum
     """
     return GeometrySummary(
         model_id=model_id,
-        units={"length": "unknown", "angle": "unknown"},
-        analysis_warnings=[f"Analysis failed: {error_message}"],
+        length_unit="unknown",
+        angle_unit="unknown",
+        warnings=(f"Analysis failed: {error_message}",),
     )
@@ -0,0 +1,149 @@
+"""Access to the triangulations OCCT keeps on B-rep faces.
+
+Shared by export (tessellation into mesh arrays) and summary (bounding box
+fallback from an already meshed shape), without either importing the other.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+@functools.cache
+def tessellation_symbols(binding: str) -> Dict[str, Any]:
+    """Resolve the OCCT meshing symbols for a binding once.
+
+    pyOCCT, OCP and pythonocc-core expose the same classes but spell static
+    methods differently (``Foo.Bar_``, ``Foo.Bar_s``, ``Foo.Bar``), so the
+    callables are normalised here instead of branching per face.
+
+    Args:
+        binding: OCCT binding name ('pyOCCT', 'pythonOCC' or 'freecad_occ')
+
+    Returns:
+        Dictionary of mesher, explorer and accessor callables
+
+    Raises:
+        ValueError: If the binding is unknown
+    """
+    if binding == 'pyOCCT':
+        from OCCT.BRep import BRep_Tool
+        from OCCT.BRepMesh import BRepMesh_IncrementalMesh
+        from OCCT.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+        from OCCT.TopExp import TopExp_Explorer
+        from OCCT.TopLoc import TopLoc_Location
+        from OCCT.TopoDS import TopoDS
+
+        to_face, triangulation = TopoDS.Face_, BRep_Tool.Triangulation_
+    elif binding in ('pythonOCC', 'freecad_occ'):
+        try:
+            if binding != 'pythonOCC':
+                raise ImportError
+            # Same OCP-first preference as the STEP loader
+            from OCP.BRep import BRep_Tool
+            from OCP.BRepMesh import BRepMesh_IncrementalMesh
+            from OCP.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+            from OCP.TopExp import TopExp_Explorer
+            from OCP.TopLoc import TopLoc_Location
+            from OCP.TopoDS import TopoDS
+
+            to_face, triangulation = TopoDS.Face_s, BRep_Tool.Triangulation_s
+        except ImportError:
+            from OCC.Core.BRep import BRep_Tool
+            from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+            from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+            from OCC.Core.TopExp import TopExp_Explorer
+            from OCC.Core.TopLoc import TopLoc_Location
+            from OCC.Core.TopoDS import topods
+
+            to_face, triangulation = topods.Face, BRep_Tool.Triangulation
+    else:
+        raise ValueError(f'Unsupported binding for tessellation: {binding}')
+
+    return {
+        'mesher': BRepMesh_IncrementalMesh,
+        'explorer': TopExp_Explorer,
+        'location': TopLoc_Location,
+        'face_type': TopAbs_FACE,
+        'reversed': TopAbs_REVERSED,
+        'to_face': to_face,
+        'triangulation': triangulation,
+    }
+
+
+def _location_affine(location: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a TopLoc_Location into a 3x3 linear part and a translation."""
+    trsf = location.Transformation()
+    matrix = np.array(
+        [[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)],
+        dtype=np.float64,
+    )
+    return matrix[:, :3], matrix[:, 3]
+
+
+def collect_triangulations(
+    shape: Any, sym: Dict[str, Any]
+) -> Tuple[List[Tuple[Any, Any, bool]], int, int]:
+    """Gather the existing triangulation of every face in one explorer pass.
+
+    Args:
+        shape: TopoDS_Shape
+        sym: Symbols from ``tessellation_symbols``
+
+    Returns:
+        Tuple of ([(triangulation, location, reversed)], total nodes, total triangles)
+    """
+    to_face = sym['to_face']
+    triangulation = sym['triangulation']
+    make_location = sym['location']
+    reversed_orientation = sym['reversed']
+
+    patches: List[Tuple[Any, Any, bool]] = []
+    n_nodes = n_tris = 0
+    explorer = sym['explorer'](shape, sym['face_type'])
+    while explorer.More():
+        face = to_face(explorer.Current())
+        location = make_location()
+        poly = triangulation(face, location)
+        if poly is not None and not poly.IsNull():
+            reverse = face.Orientation() == reversed_orientation
+            patches.append((poly, location, reverse))
+            n_nodes += poly.NbNodes()
+            n_tris += poly.NbTriangles()
+        explorer.Next()
+    return patches, n_nodes, n_tris
+
+
+def fill_nodes(out: np.ndarray, poly: Any, location: Any) -> None:
+    """Write a triangulation's nodes, placed by the face location, into ``out``."""
+    out[:] = [
+        (p.X(), p.Y(), p.Z())
+        for p in map(poly.Node, range(1, len(out) + 1))
+    ]
+    if not location.IsIdentity():
+        rot, trans = _location_affine(location)
+        out[:] = np.einsum('ij,nj->ni', rot, out) + trans
+
+
+def triangulation_vertices(shape: Any, binding: str) -> np.ndarray:
+    """Collect the nodes of a shape's existing triangulation without meshing.
+
+    Args:
+        shape: TopoDS_Shape
+        binding: OCCT binding name
+
+    Returns:
+        (N, 3) float64 array of node positions (empty if the shape is not meshed)
+    """
+    patches, n_nodes, _ = collect_triangulations(shape, tessellation_symbols(binding))
+
+    vertices = np.empty((n_nodes, 3), dtype=np.float64)
+    offset = 0
+    for poly, location, _ in patches:
+        nb_nodes = poly.NbNodes()
+        fill_nodes(vertices[offset:offset + nb_nodes], poly, location)
+        offset += nb_nodes
+    return vertices
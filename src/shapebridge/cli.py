@@ -6,40 +6,22 @@ IR generation, and geometry analysis.
 
 from __future__ import annotations
 
-import json
-import sys
+import functools
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import structlog
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
-from kernel.export import export_model_view, ExportError
-from kernel.occt_io import (
-    LoadedModel,
-    OCCTNotAvailableError,
-    StepImportError,
-    get_occt_info,
-    load_step,
-)
-from kernel.summary import GeometrySummary, summarize_shape
-from stepgraph_ir.schema import IR, create_part_node
-from stepgraph_ir.serialize import dump_jsonl, to_json_string
-
-# Configure structured logging for CLI
-structlog.configure(
-    processors=[
-        structlog.dev.ConsoleRenderer(colors=True),
-    ],
-    logger_factory=structlog.WriteLoggerFactory(),
-    cache_logger_on_first_use=True,
-)
 
-logger = structlog.get_logger(__name__)
+# kernel pulls in the OCCT bindings, which take seconds to import; commands
+# import it (and structlog, rich) on first use so --help and argument errors
+# stay fast
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from kernel.summary import GeometrySummary
+    from stepgraph_ir.schema import IR
 
 # Create Typer app
 app = typer.Typer(
@@ -48,42 +30,100 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Shared Rich console, created on first output."""
+    from rich.console import Console
+
+    return Console()
+
+
+_LOG_CONFIGURED = False
+
+
+def _configure_logging(verbose: bool = False) -> None:
+    """Configure structured logging for CLI commands, once per process.
+
+    Debug events are only emitted with ``--verbose``.
+    """
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED:
+        return
+
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        processors=[
+            structlog.dev.ConsoleRenderer(colors=True),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.DEBUG if verbose else logging.INFO
+        ),
+        logger_factory=structlog.WriteLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    _LOG_CONFIGURED = True
 
 
 def _display_error(message: str, error: Optional[Exception] = None) -> None:
     """Display error message with styling."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     error_text = Text(f"❌ {message}", style="bold red")
     if error:
         error_text.append(f"\n   {str(error)}", style="red")
-    console.print(Panel(error_text, title="Error", border_style="red"))
+    _console().print(Panel(error_text, title="Error", border_style="red"))
 
 
 def _display_success(message: str) -> None:
     """Display success message with styling."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     success_text = Text(f"✅ {message}", style="bold green")
-    console.print(Panel(success_text, title="Success", border_style="green"))
+    _console().print(Panel(success_text, title="Success", border_style="green"))
 
 
 def _display_warning(message: str) -> None:
     """Display warning message with styling."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     warning_text = Text(f"⚠️  {message}", style="bold yellow")
-    console.print(Panel(warning_text, title="Warning", border_style="yellow"))
+    _console().print(Panel(warning_text, title="Warning", border_style="yellow"))
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_BBOX_FORMAT = "({:.2f}, {:.2f}, {:.2f}) → ({:.2f}, {:.2f}, {:.2f})"
 
 
 def _format_file_size(size: int) -> str:
     """Format file size in human-readable units."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    # Each unit spans 10 bits; negative sizes (unknown) fall through as bytes
+    index = min((max(size, 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
+
+def _format_units(units: dict[str, str]) -> str:
+    """Format a units dictionary as "key: value" pairs."""
+    # join() builds a list from a generator anyway; skip the generator
+    return ", ".join([f"{k}: {v}" for k, v in units.items()])
 
 
 @app.command()
 def info() -> None:
     """Display ShapeBridge information and OCCT binding status."""
-    console.print(Panel(
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from kernel.occt_io import get_occt_info
+
+    _configure_logging()
+    _console().print(Panel(
         "ShapeBridge Phase 0\n"
         "STEP file processing and STEPGraph-IR generation",
         title="ShapeBridge",
@@ -98,19 +138,15 @@ def info() -> None:
     table.add_column("Available", style="green")
     table.add_column("Version", style="yellow")
 
-    table.add_row(
-        "pyOCCT",
-        "✅" if occt_info["pyOCCT_available"] else "❌",
-        occt_info.get("occt_version", "unknown") if occt_info["pyOCCT_available"] else "N/A"
-    )
-
-    table.add_row(
-        "pythonOCC",
-        "✅" if occt_info["pythonOCC_available"] else "❌",
-        occt_info.get("occt_version", "unknown") if occt_info["pythonOCC_available"] else "N/A"
-    )
+    for binding in ("pyOCCT", "pythonOCC"):
+        available = occt_info[f"{binding}_available"]
+        table.add_row(
+            binding,
+            "✅" if available else "❌",
+            occt_info.get("occt_version", "unknown") if available else "N/A"
+        )
 
-    console.print(table)
+    _console().print(table)
 
     if occt_info["recommended_binding"]:
         _display_success(f"Recommended binding: {occt_info['recommended_binding']}")
@@ -123,48 +159,45 @@ def info() -> None:
 
 @app.command()
 def load(
-    path: str = typer.Argument(..., help="Path to STEP file"),
+    path: Path = typer.Argument(
+        ..., help="Path to STEP file", exists=True, dir_okay=False, readable=True, resolve_path=True
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
 ) -> None:
     """Load and validate a STEP file."""
-    if verbose:
-        structlog.configure(
-            processors=[
-                structlog.dev.ConsoleRenderer(colors=True),
-            ],
-            logger_factory=structlog.WriteLoggerFactory(),
-            cache_logger_on_first_use=True,
-        )
+    from rich.table import Table
+
+    from kernel.occt_io import OCCTNotAvailableError, StepImportError, load_step
 
-    file_path = Path(path)
+    _configure_logging(verbose)
 
     try:
-        console.print(f"🔄 Loading STEP file: {file_path}")
+        _console().print(f"🔄 Loading STEP file: {path}")
 
         # Load the model
-        loaded_model = load_step(file_path)
+        loaded_model = load_step(path)
 
         # Display results
         table = Table(title="Loaded Model Information")
         table.add_column("Property", style="cyan")
         table.add_column("Value", style="white")
 
+        metadata = loaded_model.metadata
         table.add_row("Model ID", loaded_model.model_id)
         table.add_row("File Path", str(loaded_model.file_path))
-        table.add_row("File Size", _format_file_size(loaded_model.metadata.get("file_size", 0)))
+        table.add_row("File Size", _format_file_size(metadata.get("file_size", 0)))
         table.add_row("OCCT Binding", loaded_model.occt_binding)
         table.add_row("OCCT Version", loaded_model.occt_version)
 
         # Units
-        units_str = ", ".join(f"{k}: {v}" for k, v in loaded_model.units.items())
-        table.add_row("Units", units_str)
+        table.add_row("Units", _format_units(loaded_model.units))
 
         # Metadata
-        for key, value in loaded_model.metadata.items():
+        for key, value in metadata.items():
             if key != "file_size":  # Already displayed above
                 table.add_row(f"Meta: {key}", str(value))
 
-        console.print(table)
+        _console().print(table)
         _display_success("STEP file loaded successfully")
 
     except (StepImportError, OCCTNotAvailableError) as e:
@@ -174,33 +207,30 @@ def load(
 
 @app.command()
 def summarize(
-    path: str = typer.Argument(..., help="Path to STEP file"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output path for IR file"),
+    path: Path = typer.Argument(
+        ..., help="Path to STEP file", exists=True, dir_okay=False, readable=True, resolve_path=True
+    ),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output path for IR file"),
     format: str = typer.Option("jsonl", "--format", help="Output format (jsonl, json)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
 ) -> None:
     """Generate geometry summary and STEPGraph-IR for a STEP file."""
-    if verbose:
-        structlog.configure(
-            processors=[
-                structlog.dev.ConsoleRenderer(colors=True),
-            ],
-            logger_factory=structlog.WriteLoggerFactory(),
-            cache_logger_on_first_use=True,
-        )
+    from kernel.occt_io import OCCTNotAvailableError, StepImportError, load_step
+    from kernel.summary import summarize_shape
+    from stepgraph_ir.serialize import dump_jsonl, to_json_bytes
 
-    file_path = Path(path)
+    _configure_logging(verbose)
 
     try:
-        console.print(f"🔄 Analyzing STEP file: {file_path}")
+        _console().print(f"🔄 Analyzing STEP file: {path}")
 
         # Load the model
-        loaded_model = load_step(file_path)
-        console.print(f"✅ Loaded model: {loaded_model.model_id}")
+        loaded_model = load_step(path)
+        _console().print(f"✅ Loaded model: {loaded_model.model_id}")
 
         # Generate summary
         summary = summarize_shape(loaded_model)
-        console.print("✅ Generated geometry summary")
+        _console().print("✅ Generated geometry summary")
 
         # Display summary
         _display_summary(summary)
@@ -209,17 +239,13 @@ def summarize(
         ir = _create_ir_from_summary(loaded_model.model_id, summary)
 
         # Determine output path
-        if output is None:
-            output_path = file_path.with_suffix(f".{format}")
-        else:
-            output_path = Path(output)
+        output_path = output if output is not None else path.with_suffix(f".{format}")
 
         # Write IR
         if format.lower() == "jsonl":
             dump_jsonl(ir, output_path)
         elif format.lower() == "json":
-            json_str = to_json_string(ir, deterministic=True, pretty=True)
-            output_path.write_text(json_str, encoding="utf-8")
+            output_path.write_bytes(to_json_bytes(ir, deterministic=True, pretty=True))
         else:
             raise ValueError(f"Unsupported format: {format}")
 
@@ -244,40 +270,57 @@ def summarize(
 
 @app.command()
 def export(
-    path: str = typer.Argument(..., help="Path to STEP file"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output path for 3D file"),
+    path: Path = typer.Argument(
+        ..., help="Path to STEP file", exists=True, dir_okay=False, readable=True, resolve_path=True
+    ),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output path for 3D file"),
     format: str = typer.Option("glb", "--format", help="Export format (glb, gltf)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
 ) -> None:
     """Export 3D view of a STEP file."""
-    if verbose:
-        structlog.configure(
-            processors=[
-                structlog.dev.ConsoleRenderer(colors=True),
-            ],
-            logger_factory=structlog.WriteLoggerFactory(),
-            cache_logger_on_first_use=True,
-        )
+    from rich.table import Table
 
-    file_path = Path(path)
+    from kernel.export import ExportError, export_model_view
+    from kernel.occt_io import OCCTNotAvailableError, StepImportError, load_step
+
+    _configure_logging(verbose)
 
     try:
-        console.print(f"🔄 Loading STEP file: {file_path}")
+        _console().print(f"🔄 Loading STEP file: {path}")
 
         # Load the model
-        loaded_model = load_step(file_path)
-        console.print(f"✅ Loaded model: {loaded_model.model_id}")
+        loaded_model = load_step(path)
+        _console().print(f"✅ Loaded model: {loaded_model.model_id}")
 
         # Determine output path
-        if output is None:
-            output_path = file_path.with_suffix(f".{format.lower()}")
-        else:
-            output_path = Path(output)
+        output_path = output if output is not None else path.with_suffix(f".{format.lower()}")
 
-        console.print(f"🔄 Exporting {format.upper()} view...")
+        # Reject unknown formats before anything touches the disk
+        if format.lower() not in ("glb", "gltf"):
+            raise ExportError(f"Unsupported export format: {format}")
 
-        # Export view
-        result = export_model_view(loaded_model, format=format, output_path=output_path)
+        _console().print(f"🔄 Exporting {format.upper()} view...")
+
+        # Export into a temporary file next to the target and move it into
+        # place only once complete, so a failure never clobbers an existing
+        # file or leaves a partial one behind
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{output_path.name}.", suffix=".tmp", dir=output_path.parent
+        )
+        try:
+            # mkstemp creates the file 0600; give it the mode open() would
+            umask = os.umask(0)
+            os.umask(umask)
+            os.fchmod(fd, 0o666 & ~umask)
+            with os.fdopen(fd, "wb", buffering=1 << 20) as output_fp:
+                result = export_model_view(
+                    loaded_model, format=format, encode_base64=False, output_fp=output_fp
+                )
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        result["uri"] = f"file://{output_path.resolve()}"
 
         # Display results
         table = Table(title="Export Results")
@@ -291,7 +334,7 @@ def export(
         if "size_bytes" in result:
             table.add_row("Size", _format_file_size(result["size_bytes"]))
 
-        console.print(table)
+        _console().print(table)
 
         _display_success(f"{format.upper()} file exported to: {output_path}")
         _display_warning("Phase 0: This is a placeholder export. Real tessellation will be available in Phase 1.")
@@ -309,18 +352,21 @@ def export(
 
 def _display_summary(summary: GeometrySummary) -> None:
     """Display geometry summary in a formatted table."""
+    from rich.table import Table
+
     # Topology table
     topology_table = Table(title="Topology")
     topology_table.add_column("Entity", style="cyan")
     topology_table.add_column("Count", style="yellow")
 
-    topology_table.add_row("Solids", str(summary.solids))
-    topology_table.add_row("Shells", str(summary.shells))
-    topology_table.add_row("Faces", str(summary.faces))
-    topology_table.add_row("Edges", str(summary.edges))
-    topology_table.add_row("Vertices", str(summary.vertices))
-
-    console.print(topology_table)
+    for label, count in (
+        ("Solids", summary.solids),
+        ("Shells", summary.shells),
+        ("Faces", summary.faces),
+        ("Edges", summary.edges),
+        ("Vertices", summary.vertices),
+    ):
+        topology_table.add_row(label, str(count))
 
     # Properties table
     props_table = Table(title="Properties")
@@ -328,15 +374,12 @@ def _display_summary(summary: GeometrySummary) -> None:
     props_table.add_column("Value", style="white")
 
     # Units
-    units_str = ", ".join(f"{k}: {v}" for k, v in summary.units.items())
-    props_table.add_row("Units", units_str)
+    # Read the flat fields rather than building the units dict
+    props_table.add_row("Units", f"length: {summary.length_unit}, angle: {summary.angle_unit}")
 
-    # Bounding box
-    if summary.bounding_box:
-        bbox = summary.bounding_box
-        bbox_str = (f"({bbox['min_x']:.2f}, {bbox['min_y']:.2f}, {bbox['min_z']:.2f}) → "
-                   f"({bbox['max_x']:.2f}, {bbox['max_y']:.2f}, {bbox['max_z']:.2f})")
-        props_table.add_row("Bounding Box", bbox_str)
+    # Bounding box; the BBox tuple is already in min/max corner order
+    if summary.bbox is not None:
+        props_table.add_row("Bounding Box", _BBOX_FORMAT.format(*summary.bbox))
 
     # Surface area and volume
     if summary.surface_area is not None:
@@ -345,32 +388,35 @@ def _display_summary(summary: GeometrySummary) -> None:
     if summary.volume is not None:
         props_table.add_row("Volume", f"{summary.volume:.2f}")
 
-    console.print(props_table)
-
     # Analysis flags
     analysis_table = Table(title="Analysis")
     analysis_table.add_column("Feature", style="cyan")
     analysis_table.add_column("Present", style="green")
 
-    analysis_table.add_row("Surfaces", "✅" if summary.has_surfaces else "❌")
-    analysis_table.add_row("Curves", "✅" if summary.has_curves else "❌")
-    analysis_table.add_row("Assemblies", "✅" if summary.has_assemblies else "❌")
-    analysis_table.add_row("PMI", "✅" if summary.has_pmi else "❌")
+    for label, present in (
+        ("Surfaces", summary.has_surfaces),
+        ("Curves", summary.has_curves),
+        ("Assemblies", summary.has_assemblies),
+        ("PMI", summary.has_pmi),
+    ):
+        analysis_table.add_row(label, "✅" if present else "❌")
 
-    console.print(analysis_table)
+    # One print renders and writes all three tables together
+    _console().print(topology_table, props_table, analysis_table)
 
     # Warnings
     if summary.analysis_warnings:
-        console.print("\n[bold yellow]Warnings:[/bold yellow]")
+        _console().print("\n[bold yellow]Warnings:[/bold yellow]")
         for warning in summary.analysis_warnings:
-            console.print(f"  ⚠️  {warning}")
+            _console().print(f"  ⚠️  {warning}")
 
 
 def _create_ir_from_summary(model_id: str, summary: GeometrySummary) -> IR:
     """Create IR from geometry summary."""
+    from stepgraph_ir.schema import IR, create_part_node
+
     # Create root part node
-    part_node = create_part_node(model_id, node_id=f"{model_id}_root")
-    part_node.attrs.update({
+    attrs: Dict[str, Any] = {
         "topology": {
             "solids": summary.solids,
             "faces": summary.faces,
@@ -382,16 +428,18 @@ def _create_ir_from_summary(model_id: str, summary: GeometrySummary) -> IR:
             "has_curves": summary.has_curves,
         },
         "occt_binding": summary.occt_binding,
-    })
+    }
 
     if summary.bounding_box:
-        part_node.attrs["bounding_box"] = summary.bounding_box
+        attrs["bounding_box"] = summary.bounding_box
 
     if summary.surface_area is not None:
-        part_node.attrs["surface_area"] = summary.surface_area
+        attrs["surface_area"] = summary.surface_area
 
     if summary.volume is not None:
-        part_node.attrs["volume"] = summary.volume
+        attrs["volume"] = summary.volume
+
+    part_node = create_part_node(model_id, node_id=f"{model_id}_root", attrs=attrs)
 
     # Create IR
     ir = IR(
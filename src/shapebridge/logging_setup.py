@@ -7,9 +7,32 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Literal
 
 import structlog
+from structlog.typing import EventDict, Processor, WrappedLogger
+
+# (second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp, replaced as a whole
+# so concurrent loggers never see a torn pair
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _add_timestamp(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+    """Add an ISO 8601 UTC timestamp, as ``TimeStamper(fmt="iso")`` does.
+
+    The date and time of day are formatted once per second; within a
+    second only the microseconds change.
+    """
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    event_dict["timestamp"] = f"{prefix}.{int((now - second) * 1e6):06d}Z"
+    return event_dict
 
 
 def configure_logging(
@@ -20,25 +43,34 @@ def configure_logging(
 ) -> None:
     """Configure structured logging for ShapeBridge.
 
+    Records are timestamped for JSON output and for console output to a
+    terminal. Console output piped elsewhere goes without timestamps,
+    leaving them to whatever collects it.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         enable_colors: Enable colored output for console
         enable_json: Use JSON output format
         extra_processors: Additional structlog processors
     """
+    log_level = getattr(logging, level.upper())
+
     # Set standard library logging level
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, level.upper()),
+        level=log_level,
     )
 
+    is_tty = sys.stdout.isatty()
+
     # Build processor chain
-    processors = [
+    processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="ISO"),
     ]
+    if enable_json or is_tty:
+        processors.append(_add_timestamp)
 
     if extra_processors:
         processors.extend(extra_processors)
@@ -48,12 +80,15 @@ def configure_logging(
         processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(
-            structlog.dev.ConsoleRenderer(colors=enable_colors and sys.stdout.isatty())
+            structlog.dev.ConsoleRenderer(colors=enable_colors and is_tty)
         )
 
     # Configure structlog
+    # The filtering wrapper turns calls below the level into no-ops before
+    # any event dict is built or processed
     structlog.configure(
         processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.WriteLoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -83,7 +118,7 @@ def log_context(**kwargs: Any) -> Dict[str, Any]:
     return kwargs
 
 
-# Predefined log levels and configurations
+# Predefined log levels
 LOG_LEVELS = {
     "DEBUG": logging.DEBUG,
     "INFO": logging.INFO,
@@ -92,21 +127,25 @@ LOG_LEVELS = {
     "CRITICAL": logging.CRITICAL,
 }
 
-# Default configuration for different environments
-CONFIGS = {
-    "development": {
-        "level": "DEBUG",
-        "enable_colors": True,
-        "enable_json": False,
-    },
-    "production": {
-        "level": "INFO",
-        "enable_colors": False,
-        "enable_json": True,
-    },
-    "testing": {
-        "level": "WARNING",
-        "enable_colors": False,
-        "enable_json": False,
-    },
-}
\ No newline at end of file
+
+def get_config(env: Literal["development", "production", "testing"]) -> Dict[str, Any]:
+    """Get the default ``configure_logging`` arguments for an environment.
+
+    Only the requested configuration is built; callers may modify it.
+
+    Args:
+        env: Environment name
+
+    Returns:
+        Keyword arguments for ``configure_logging``
+
+    Raises:
+        ValueError: If the environment is unknown
+    """
+    if env == "development":
+        return {"level": "DEBUG", "enable_colors": True, "enable_json": False}
+    if env == "production":
+        return {"level": "INFO", "enable_colors": False, "enable_json": True}
+    if env == "testing":
+        return {"level": "WARNING", "enable_colors": False, "enable_json": False}
+    raise ValueError(f"Unknown logging environment: {env}")
@@ -4,8 +4,21 @@ Provides MCP (Model Context Protocol) server implementation for Claude Code
 integration with deterministic STEP file processing and IR generation.
 """
 
-from .server import main as server_main
-from .tools import ShapeBridgeSession
+from typing import Any
 
 __version__ = "0.1.0"
-__all__ = ["server_main", "ShapeBridgeSession"]
\ No newline at end of file
+__all__ = ["server_main", "ShapeBridgeSession"]
+
+
+def __getattr__(name: str) -> Any:
+    # The server pulls in the MCP SDK and the tools load the OCCT bindings;
+    # defer both until requested
+    if name == "server_main":
+        from .server import main as server_main
+
+        return server_main
+    if name == "ShapeBridgeSession":
+        from .tools import ShapeBridgeSession
+
+        return ShapeBridgeSession
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,13 +12,6 @@ from typing import Any, Dict
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from .tools import (
-    tool_export_view,
-    tool_load_step,
-    tool_session_info,
-    tool_summarize_model,
-)
-
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -33,6 +26,24 @@ logger = structlog.get_logger(__name__)
 # Create FastMCP app
 app = FastMCP("shapebridge")
 
+# Failure results of each tool. Copying a template reuses its key layout,
+# which is cheaper than building the dict literal on every failure.
+_LOAD_STEP_ERROR: Dict[str, Any] = {
+    "success": False, "error": "", "model_id": None, "file_path": None,
+}
+_SUMMARIZE_ERROR: Dict[str, Any] = {
+    "success": False, "error": "", "model_id": None, "summary": None, "ir_path": None,
+}
+_EXPORT_VIEW_ERROR: Dict[str, Any] = {
+    "success": False, "error": "", "model_id": None, "format": None, "uri": None,
+}
+_SESSION_INFO_ERROR: Dict[str, Any] = {
+    "success": False, "error": "", "session_stats": None, "models": None,
+}
+
+# Each tool imports its implementation from .tools when called, so starting
+# the server does not load the kernel
+
 
 @app.tool()
 def load_step(path: str) -> Dict[str, Any]:
@@ -57,17 +68,17 @@ def load_step(path: str) -> Dict[str, Any]:
     """
     try:
         logger.info("MCP tool: load_step", path=path)
-        result = tool_load_step({"path": path})
+        from .tools import tool_load_step
+
+        result = tool_load_step(path)
         logger.info("MCP tool: load_step completed", success=result.get("success", False))
         return result
     except Exception as e:
         logger.error("MCP tool: load_step failed", path=path, error=str(e))
-        return {
-            "success": False,
-            "error": f"Tool execution failed: {e}",
-            "model_id": None,
-            "file_path": path,
-        }
+        result = _LOAD_STEP_ERROR.copy()
+        result["error"] = f"Tool execution failed: {e}"
+        result["file_path"] = path
+        return result
 
 
 @app.tool()
@@ -98,23 +109,18 @@ def summarize_model(model_id: str, out_dir: str | None = None) -> Dict[str, Any]
     """
     try:
         logger.info("MCP tool: summarize_model", model_id=model_id, out_dir=out_dir)
-        params = {"model_id": model_id}
-        if out_dir is not None:
-            params["out_dir"] = out_dir
+        from .tools import tool_summarize_model
 
-        result = tool_summarize_model(params)
+        result = tool_summarize_model(model_id, out_dir)
         logger.info("MCP tool: summarize_model completed",
                    model_id=model_id, success=result.get("success", False))
         return result
     except Exception as e:
         logger.error("MCP tool: summarize_model failed", model_id=model_id, error=str(e))
-        return {
-            "success": False,
-            "error": f"Tool execution failed: {e}",
-            "model_id": model_id,
-            "summary": None,
-            "ir_path": None,
-        }
+        result = _SUMMARIZE_ERROR.copy()
+        result["error"] = f"Tool execution failed: {e}"
+        result["model_id"] = model_id
+        return result
 
 
 @app.tool()
@@ -143,19 +149,19 @@ def export_view(model_id: str, format: str = "glb") -> Dict[str, Any]:
     """
     try:
         logger.info("MCP tool: export_view", model_id=model_id, format=format)
-        result = tool_export_view({"model_id": model_id, "format": format})
+        from .tools import tool_export_view
+
+        result = tool_export_view(model_id, format)
         logger.info("MCP tool: export_view completed",
                    model_id=model_id, format=format, success=result.get("success", False))
         return result
     except Exception as e:
         logger.error("MCP tool: export_view failed", model_id=model_id, format=format, error=str(e))
-        return {
-            "success": False,
-            "error": f"Tool execution failed: {e}",
-            "model_id": model_id,
-            "format": format,
-            "uri": None,
-        }
+        result = _EXPORT_VIEW_ERROR.copy()
+        result["error"] = f"Tool execution failed: {e}"
+        result["model_id"] = model_id
+        result["format"] = format
+        return result
 
 
 @app.tool()
@@ -178,18 +184,20 @@ def session_info() -> Dict[str, Any]:
     """
     try:
         logger.info("MCP tool: session_info")
+        from .tools import tool_session_info
+
         result = tool_session_info()
         logger.info("MCP tool: session_info completed",
                    loaded_models=len(result.get("models", [])))
         return result
     except Exception as e:
         logger.error("MCP tool: session_info failed", error=str(e))
-        return {
-            "success": False,
-            "error": f"Tool execution failed: {e}",
-            "session_stats": {},
-            "models": [],
-        }
+        result = _SESSION_INFO_ERROR.copy()
+        result["error"] = f"Tool execution failed: {e}"
+        # Fresh containers; the template's must never be shared
+        result["session_stats"] = {}
+        result["models"] = []
+        return result
 
 
 def main() -> None:
@@ -200,12 +208,13 @@ def main() -> None:
     try:
         logger.info("Starting ShapeBridge MCP server")
 
-        # Log startup information
+        # Log startup information; detection is memoized in kernel.occt_io,
+        # so tool calls that load models reuse this probe
         from kernel.occt_io import get_occt_info
         occt_info = get_occt_info()
         logger.info("OCCT binding status", **occt_info)
 
-        if not occt_info["pyOCCT_available"] and not occt_info["pythonOCC_available"]:
+        if occt_info["recommended_binding"] is None:
             logger.warning(
                 "No OCCT binding available - STEP loading will fail. "
                 "Install pyOCCT or pythonocc-core to enable geometry processing."
@@ -6,20 +6,24 @@ with proper error handling and session management.
 
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
-import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import structlog
 
-from kernel.export import export_model_view, ExportError
+# occt_io resolves the OCCT bindings on the first load; summary and export
+# pull in numpy and are imported on first use
 from kernel.occt_io import LoadedModel, load_step, OCCTNotAvailableError, StepImportError
-from kernel.summary import GeometrySummary, summarize_shape, create_placeholder_summary
 from stepgraph_ir.schema import IR, Node, Edge, ValidationInfo, create_part_node
 from stepgraph_ir.serialize import dump_jsonl
 
+if TYPE_CHECKING:
+    from kernel.summary import GeometrySummary
+
 logger = structlog.get_logger(__name__)
 
 
@@ -28,75 +32,159 @@ class SessionError(Exception):
     pass
 
 
+# What summarize_shape can raise for geometry it cannot analyse: OCCT
+# failures surface as RuntimeError, malformed models as the others
+_SUMMARY_ERRORS = (RuntimeError, ValueError, TypeError, AttributeError, KeyError, OSError)
+
+
 class ShapeBridgeSession:
     """Session manager for loaded models and operations."""
 
-    def __init__(self, max_models: int = 10):
+    def __init__(self, max_models: int = 10, max_cold: int = 50):
         """Initialize session.
 
+        Models evicted from memory are remembered in a cold tier of
+        ``(file_path, mtime_ns, summary)`` entries, so their summaries can
+        still be served and the model is re-parsed only when its geometry
+        is needed again.
+
         Args:
             max_models: Maximum number of models to keep in memory
+            max_cold: Maximum number of evicted models to remember
         """
-        self._models: Dict[str, LoadedModel] = {}
+        # Least recently used first; lookups move a model to the end
+        self._models: OrderedDict[str, LoadedModel] = OrderedDict()
         self._summaries: Dict[str, GeometrySummary] = {}
+        # Summary and minimal IR per model, plus where the IR was last written
+        self._irs: Dict[str, Tuple[GeometrySummary, IR]] = {}
+        self._ir_paths: Dict[str, Path] = {}
         self._max_models = max_models
-        self._load_times: Dict[str, float] = {}
+        # Evicted models, least recently used first
+        self._cold: OrderedDict[str, Tuple[str, int, Optional[GeometrySummary]]] = OrderedDict()
+        self._max_cold = max_cold
+        # Sorted ids of in-memory models, rebuilt when membership changes
+        self._ids_cache: Optional[List[str]] = None
 
-        logger.info("ShapeBridge session initialized", max_models=max_models)
+        logger.info("ShapeBridge session initialized", max_models=max_models, max_cold=max_cold)
 
     def cleanup_old_models(self) -> None:
-        """Remove oldest models if we exceed the limit."""
-        if len(self._models) <= self._max_models:
-            return
-
-        # Sort by load time and remove oldest
-        sorted_models = sorted(self._load_times.items(), key=lambda x: x[1])
-        models_to_remove = sorted_models[:-self._max_models]
-
-        for model_id, _ in models_to_remove:
-            self.remove_model(model_id)
+        """Remove least recently used models if we exceed the limit."""
+        while len(self._models) > self._max_models:
+            model_id, model = self._models.popitem(last=False)
+            self._ids_cache = None
+            self._demote(model_id, model)
+            logger.debug("Evicted model from session", model_id=model_id)
 
     def remove_model(self, model_id: str) -> None:
         """Remove a model from the session."""
         if model_id in self._models:
             del self._models[model_id]
+            self._ids_cache = None
             logger.debug("Removed model from session", model_id=model_id)
 
-        if model_id in self._summaries:
-            del self._summaries[model_id]
+        self._cold.pop(model_id, None)
+        self._invalidate(model_id)
 
-        if model_id in self._load_times:
-            del self._load_times[model_id]
+    def clear(self) -> None:
+        """Forget every model, in memory or cold, and everything derived from them."""
+        self._models.clear()
+        self._summaries.clear()
+        self._irs.clear()
+        self._ir_paths.clear()
+        self._cold.clear()
+        self._ids_cache = None
+
+    def _demote(self, model_id: str, model: LoadedModel) -> None:
+        """Move an evicted model to the cold tier, keeping its summary."""
+        try:
+            mtime_ns = os.stat(model.file_path).st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        self._cold[model_id] = (model.file_path, mtime_ns, self._summaries.get(model_id))
+        self._invalidate(model_id)
+
+        while len(self._cold) > self._max_cold:
+            self._cold.popitem(last=False)
+
+    def _promote(self, model_id: str) -> Optional[LoadedModel]:
+        """Re-load a cold model, reusing its summary if the file is unchanged."""
+        file_path, mtime_ns, summary = self._cold.pop(model_id)
+        try:
+            model = self.load_model(file_path)
+        except SessionError:
+            return None
+
+        if summary is not None:
+            try:
+                unchanged = os.stat(file_path).st_mtime_ns == mtime_ns
+            except OSError:
+                unchanged = False
+            if unchanged:
+                self._summaries[model.model_id] = summary
+        return model
+
+    def _invalidate(self, model_id: str) -> None:
+        """Drop everything derived from a model's geometry."""
+        self._summaries.pop(model_id, None)
+        self._irs.pop(model_id, None)
+        self._ir_paths.pop(model_id, None)
 
     def has_model(self, model_id: str) -> bool:
-        """Check if a model is loaded in the session."""
-        return model_id in self._models
+        """Check if a model is loaded in the session, in memory or cold."""
+        if model_id in self._models:
+            self._models.move_to_end(model_id)
+            return True
+        return model_id in self._cold
 
     def get_model(self, model_id: str) -> Optional[LoadedModel]:
-        """Get a loaded model by ID."""
-        return self._models.get(model_id)
+        """Get a loaded model by ID, re-loading it from the cold tier if needed."""
+        model = self._models.get(model_id)
+        if model is not None:
+            self._models.move_to_end(model_id)
+            return model
+        if model_id in self._cold:
+            return self._promote(model_id)
+        return None
 
     def get_summary(self, model_id: str) -> Optional[GeometrySummary]:
         """Get a model summary by ID."""
-        return self._summaries.get(model_id)
+        summary = self._summaries.get(model_id)
+        if summary is not None:
+            self._models.move_to_end(model_id)
+            return summary
+        cold = self._cold.get(model_id)
+        if cold is not None:
+            self._cold.move_to_end(model_id)
+            return cold[2]
+        return None
 
     def list_models(self) -> List[str]:
-        """Get list of loaded model IDs."""
-        return list(self._models.keys())
+        """Get the sorted IDs of models held in memory.
+
+        The list is cached until a model is added or removed and is shared
+        between calls, so callers must not modify it.
+        """
+        ids = self._ids_cache
+        # The length check also catches models added behind our back
+        if ids is None or len(ids) != len(self._models):
+            ids = self._ids_cache = sorted(self._models)
+        return ids
 
     def get_session_stats(self) -> Dict[str, Any]:
         """Get session statistics."""
         return {
             "loaded_models": len(self._models),
             "max_models": self._max_models,
-            "model_ids": list(self._models.keys()),
+            "model_ids": self.list_models(),
+            "cold_models": len(self._cold),
         }
 
-    def load_model(self, file_path: str) -> LoadedModel:
+    def load_model(self, file_path: str, file_stat: Optional[os.stat_result] = None) -> LoadedModel:
         """Load a STEP file and add to session.
 
         Args:
             file_path: Path to STEP file
+            file_stat: ``os.stat`` result for the file, if already known
 
         Returns:
             LoadedModel instance
@@ -108,11 +196,15 @@ class ShapeBridgeSession:
             logger.info("Loading STEP model", file_path=file_path)
 
             # Load the model
-            loaded_model = load_step(file_path)
+            loaded_model = load_step(file_path, file_stat=file_stat)
 
-            # Store in session
+            # Store in session; a reload replaces the geometry behind the id
+            self._cold.pop(loaded_model.model_id, None)
+            self._invalidate(loaded_model.model_id)
+            if loaded_model.model_id not in self._models:
+                self._ids_cache = None
             self._models[loaded_model.model_id] = loaded_model
-            self._load_times[loaded_model.model_id] = time.time()
+            self._models.move_to_end(loaded_model.model_id)
 
             # Cleanup old models if needed
             self.cleanup_old_models()
@@ -143,13 +235,14 @@ class ShapeBridgeSession:
         Raises:
             SessionError: If model not found or analysis fails
         """
-        if model_id not in self._models:
+        loaded_model = self.get_model(model_id)
+        if loaded_model is None:
             raise SessionError(f"Model not found in session: {model_id}")
 
+        from kernel.summary import create_placeholder_summary, summarize_shape
+
         try:
             logger.info("Generating geometry summary", model_id=model_id)
-
-            loaded_model = self._models[model_id]
             summary = summarize_shape(loaded_model)
 
             # Cache the summary
@@ -165,12 +258,47 @@ class ShapeBridgeSession:
 
             return summary
 
-        except Exception as e:
+        except _SUMMARY_ERRORS as e:
             logger.error("Failed to generate summary", model_id=model_id, error=str(e))
-            # Create placeholder summary for failed analysis
-            summary = create_placeholder_summary(model_id, str(e))
-            self._summaries[model_id] = summary
-            return summary
+            # Keep a summary from an earlier successful run of this geometry
+            previous = self._summaries.get(model_id)
+            if previous is not None:
+                return previous
+            placeholder = create_placeholder_summary(model_id, str(e))
+            self._summaries[model_id] = placeholder
+            return placeholder
+
+    def generate_ir(self, model_id: str) -> Tuple[GeometrySummary, IR]:
+        """Get the summary and minimal IR of a loaded model.
+
+        Both are built on the first call and reused until the model is
+        reloaded or removed.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            Tuple of (summary, ir)
+
+        Raises:
+            SessionError: If model not found
+        """
+        cached = self._irs.get(model_id)
+        if cached is not None:
+            return cached
+
+        summary = self.generate_summary(model_id)
+        result = (summary, _create_minimal_ir(model_id, summary))
+        self._irs[model_id] = result
+        return result
+
+    def get_ir_path(self, model_id: str) -> Optional[Path]:
+        """Get where the model's current IR was last written, if anywhere."""
+        return self._ir_paths.get(model_id)
+
+    def record_ir_path(self, model_id: str, path: Path) -> None:
+        """Record that the model's current IR was written to ``path``."""
+        self._ir_paths[model_id] = path
 
     def export_view(self, model_id: str, format: str = "glb") -> Dict[str, Any]:
         """Export 3D view of a loaded model.
@@ -185,13 +313,14 @@ class ShapeBridgeSession:
         Raises:
             SessionError: If model not found or export fails
         """
-        if model_id not in self._models:
+        loaded_model = self.get_model(model_id)
+        if loaded_model is None:
             raise SessionError(f"Model not found in session: {model_id}")
 
+        from kernel.export import ExportError, export_model_view
+
         try:
             logger.info("Exporting model view", model_id=model_id, format=format)
-
-            loaded_model = self._models[model_id]
             result = export_model_view(loaded_model, format=format)
 
             logger.info(
@@ -212,11 +341,11 @@ class ShapeBridgeSession:
 _session = ShapeBridgeSession()
 
 
-def tool_load_step(params: Dict[str, Any]) -> Dict[str, Any]:
+def tool_load_step(path: str) -> Dict[str, Any]:
     """MCP tool: Load a STEP file from disk.
 
     Args:
-        params: Tool parameters containing 'path'
+        path: Path to the STEP file
 
     Returns:
         Dictionary with load results
@@ -225,20 +354,21 @@ def tool_load_step(params: Dict[str, Any]) -> Dict[str, Any]:
         ValueError: If parameters are invalid
         SessionError: If loading fails
     """
-    if "path" not in params:
-        raise ValueError("Missing required parameter: path")
-
-    file_path = params["path"]
+    file_path = path
     if not file_path:
         raise ValueError("Parameter 'path' cannot be empty")
 
-    # Validate file path
-    path = Path(file_path)
-    if not path.exists():
-        raise ValueError(f"File not found: {file_path}")
+    # Validate file path; the stat is handed on so loading does not repeat it
+    try:
+        file_stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise ValueError(f"File not found: {file_path}") from None
+    except OSError:
+        # Let the loader report permission and similar errors
+        file_stat = None
 
     try:
-        loaded_model = _session.load_model(file_path)
+        loaded_model = _session.load_model(file_path, file_stat=file_stat)
 
         return {
             "success": True,
@@ -261,11 +391,18 @@ def tool_load_step(params: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def tool_summarize_model(params: Dict[str, Any]) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=32)
+def _out_dir(out_dir: Optional[str]) -> Path:
+    """Resolve an IR output directory, defaulting to the temp directory."""
+    return Path(tempfile.gettempdir() if out_dir is None else out_dir)
+
+
+def tool_summarize_model(model_id: str, out_dir: Optional[str] = None) -> Dict[str, Any]:
     """MCP tool: Generate geometry summary and IR for a loaded model.
 
     Args:
-        params: Tool parameters containing 'model_id' and optional 'out_dir'
+        model_id: Identifier of the loaded model
+        out_dir: Output directory for the IR file (defaults to temp directory)
 
     Returns:
         Dictionary with summary and IR path
@@ -274,58 +411,24 @@ def tool_summarize_model(params: Dict[str, Any]) -> Dict[str, Any]:
         ValueError: If parameters are invalid
         SessionError: If model not found or analysis fails
     """
-    if "model_id" not in params:
-        raise ValueError("Missing required parameter: model_id")
-
-    model_id = params["model_id"]
     if not model_id:
         raise ValueError("Parameter 'model_id' cannot be empty")
 
-    out_dir = params.get("out_dir", tempfile.gettempdir())
-
     try:
-        # Generate summary
-        summary = _session.generate_summary(model_id)
-
-        # Create minimal IR for Phase 0
-        ir = _create_minimal_ir(model_id, summary)
-
-        # Write IR to file
-        out_path = Path(out_dir) / f"{model_id}.jsonl"
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        dump_jsonl(ir, out_path)
+        # Summary and minimal IR for Phase 0, cached per loaded model
+        summary, ir = _session.generate_ir(model_id)
 
-        logger.info("IR written successfully", model_id=model_id, path=str(out_path))
+        # Write IR to file, unless this IR is already there
+        out_path = _out_dir(out_dir) / f"{model_id}.jsonl"
+        if _session.get_ir_path(model_id) != out_path or not out_path.exists():
+            dump_jsonl(ir, out_path)
+            _session.record_ir_path(model_id, out_path)
+            logger.info("IR written successfully", model_id=model_id, path=str(out_path))
 
         return {
             "success": True,
             "model_id": model_id,
-            "summary": {
-                "units": summary.units,
-                "topology": {
-                    "solids": summary.solids,
-                    "shells": summary.shells,
-                    "faces": summary.faces,
-                    "edges": summary.edges,
-                    "vertices": summary.vertices,
-                },
-                "properties": {
-                    "bounding_box": summary.bounding_box,
-                    "surface_area": summary.surface_area,
-                    "volume": summary.volume,
-                },
-                "analysis": {
-                    "has_pmi": summary.has_pmi,
-                    "has_assemblies": summary.has_assemblies,
-                    "has_curves": summary.has_curves,
-                    "has_surfaces": summary.has_surfaces,
-                },
-                "metadata": {
-                    "file_size": summary.file_size,
-                    "occt_binding": summary.occt_binding,
-                    "warnings": summary.analysis_warnings,
-                }
-            },
+            "summary": summary.to_dict(),
             "ir_path": str(out_path),
             "ir_valid": ir.validation.is_valid,
         }
@@ -341,11 +444,12 @@ def tool_summarize_model(params: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def tool_export_view(params: Dict[str, Any]) -> Dict[str, Any]:
+def tool_export_view(model_id: str, format: str = "glb") -> Dict[str, Any]:
     """MCP tool: Export 3D view of a loaded model.
 
     Args:
-        params: Tool parameters containing 'model_id' and optional 'format'
+        model_id: Identifier of the loaded model
+        format: Export format ("glb" or "gltf")
 
     Returns:
         Dictionary with export results
@@ -354,14 +458,10 @@ def tool_export_view(params: Dict[str, Any]) -> Dict[str, Any]:
         ValueError: If parameters are invalid
         SessionError: If model not found or export fails
     """
-    if "model_id" not in params:
-        raise ValueError("Missing required parameter: model_id")
-
-    model_id = params["model_id"]
     if not model_id:
         raise ValueError("Parameter 'model_id' cannot be empty")
 
-    format = params.get("format", "glb").lower()
+    format = format.lower()
     if format not in ("glb", "gltf"):
         raise ValueError(f"Unsupported format: {format}. Use 'glb' or 'gltf'")
 
@@ -390,12 +490,9 @@ def tool_export_view(params: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def tool_session_info(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def tool_session_info() -> Dict[str, Any]:
     """MCP tool: Get session information and loaded models.
 
-    Args:
-        params: Optional parameters (unused)
-
     Returns:
         Dictionary with session information
     """
@@ -448,8 +545,7 @@ def _create_minimal_ir(model_id: str, summary: GeometrySummary) -> IR:
         IR instance with minimal node/edge structure
     """
     # Create root part node
-    part_node = create_part_node(model_id, node_id=f"{model_id}_root")
-    part_node.attrs.update({
+    attrs: Dict[str, Any] = {
         "topology": {
             "solids": summary.solids,
             "faces": summary.faces,
@@ -461,16 +557,18 @@ def _create_minimal_ir(model_id: str, summary: GeometrySummary) -> IR:
             "has_curves": summary.has_curves,
         },
         "occt_binding": summary.occt_binding,
-    })
+    }
 
     if summary.bounding_box:
-        part_node.attrs["bounding_box"] = summary.bounding_box
+        attrs["bounding_box"] = summary.bounding_box
 
     if summary.surface_area is not None:
-        part_node.attrs["surface_area"] = summary.surface_area
+        attrs["surface_area"] = summary.surface_area
 
     if summary.volume is not None:
-        part_node.attrs["volume"] = summary.volume
+        attrs["volume"] = summary.volume
+
+    part_node = create_part_node(model_id, node_id=f"{model_id}_root", attrs=attrs)
 
     # Create IR with validation info
     validation = ValidationInfo()
@@ -4,8 +4,11 @@ This package provides the schema, serialization, and utilities for
 deterministic STEP file analysis and representation.
 """
 
-from .schema import IR, Node, Edge, NodeType
+from .schema import IR, Node, Edge, NodeType, NODE_TYPES, EDGE_TYPES
 from .serialize import to_json_dict, dump_jsonl, load_jsonl
 
 __version__ = "0.1.0"
-__all__ = ["IR", "Node", "Edge", "NodeType", "to_json_dict", "dump_jsonl", "load_jsonl"]
\ No newline at end of file
+__all__ = [
+    "IR", "Node", "Edge", "NodeType", "NODE_TYPES", "EDGE_TYPES",
+    "to_json_dict", "dump_jsonl", "load_jsonl",
+]
\ No newline at end of file
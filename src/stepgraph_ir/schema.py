@@ -6,10 +6,25 @@ in a deterministic, graph-based intermediate representation.
 
 from __future__ import annotations
 
+import itertools
+import os
+import sys
 import uuid
-from dataclasses import dataclass, field
+from collections import defaultdict
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    cast,
+    get_args,
+)
 
 # Schema versioning
 SCHEMA_VERSION = "0.1.0"
@@ -66,8 +81,40 @@ EdgeType = Literal[
     "coordinate_system",
 ]
 
+# Membership sets for validating type strings
+NODE_TYPES: frozenset[str] = frozenset(get_args(NodeType))
+EDGE_TYPES: frozenset[str] = frozenset(get_args(EdgeType))
 
-@dataclass
+
+class _IdGen:
+    """Cheap unique ID source: a counter under a random per-process prefix.
+
+    Avoids an ``os.urandom`` call and UUID formatting for every generated
+    node while keeping IDs from separate processes apart. A forked child
+    inherits the parent's state, so the module reseeds it after ``fork``.
+    """
+
+    __slots__ = ("_prefix", "_counter")
+
+    def __init__(self) -> None:
+        self.reseed()
+
+    def reseed(self) -> None:
+        """Start over with a fresh random prefix."""
+        self._prefix = uuid.uuid4().hex[:12]
+        self._counter = itertools.count(1)
+
+    def next(self, kind: str = "n") -> str:
+        """Return a new ID, e.g. ``n42-1a2b3c4d5e6f``."""
+        return f"{kind}{next(self._counter)}-{self._prefix}"
+
+
+_default_idgen = _IdGen()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_default_idgen.reseed)
+
+
+@dataclass(slots=True)
 class Node:
     """A node in the STEPGraph-IR representing a geometric or semantic entity."""
 
@@ -78,14 +125,19 @@ class Node:
     def __post_init__(self) -> None:
         """Validate node after creation."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = _default_idgen.next()
+        if self.attrs is None:
+            self.attrs = {}
+        # Types come from a small fixed set; share one string object each
+        self.type = cast(NodeType, sys.intern(self.type))
 
-        # Ensure required attributes based on node type
-        if self.type in ("Assembly", "Part", "Product") and "name" not in self.attrs:
-            self.attrs["name"] = f"Unnamed_{self.type}_{self.id[:8]}"
+    @property
+    def display_name(self) -> str:
+        """Name for display, with a generated fallback for unnamed nodes."""
+        return self.attrs.get("name") or f"Unnamed_{self.type}_{self.id[:8]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """An edge in the STEPGraph-IR representing a relationship between entities."""
 
@@ -100,11 +152,17 @@ class Edge:
             raise ValueError("Edge source and destination cannot be empty")
         if self.src == self.dst:
             raise ValueError("Self-loops are not allowed in STEPGraph-IR")
+        if self.attrs is None:
+            self.attrs = {}
+        self.type = cast(EdgeType, sys.intern(self.type))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
-    """3D bounding box representation."""
+    """3D bounding box representation.
+
+    Frozen so the derived volume and center can be cached on first access.
+    """
 
     min_x: float
     min_y: float
@@ -113,27 +171,45 @@ class BoundingBox:
     max_y: float
     max_z: float
 
+    # Slots for the cached derived values
+    _volume: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _center: Optional[tuple[float, float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def volume(self) -> float:
         """Calculate bounding box volume."""
-        return (self.max_x - self.min_x) * (self.max_y - self.min_y) * (self.max_z - self.min_z)
+        volume = self._volume
+        if volume is None:
+            volume = (
+                (self.max_x - self.min_x)
+                * (self.max_y - self.min_y)
+                * (self.max_z - self.min_z)
+            )
+            object.__setattr__(self, "_volume", volume)
+        return volume
 
     @property
     def center(self) -> tuple[float, float, float]:
         """Calculate bounding box center point."""
-        return (
-            (self.min_x + self.max_x) / 2,
-            (self.min_y + self.max_y) / 2,
-            (self.min_z + self.min_z) / 2,
-        )
-
-
-@dataclass
+        center = self._center
+        if center is None:
+            center = (
+                (self.min_x + self.max_x) / 2,
+                (self.min_y + self.max_y) / 2,
+                (self.min_z + self.max_z) / 2,
+            )
+            object.__setattr__(self, "_center", center)
+        return center
+
+
+@dataclass(slots=True)
 class ValidationInfo:
     """Validation information for the IR."""
 
     schema_version: str = SCHEMA_VERSION
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: Optional[str] = None
     node_count: int = 0
     edge_count: int = 0
     warnings: List[str] = field(default_factory=list)
@@ -144,8 +220,15 @@ class ValidationInfo:
         """Check if the IR passed validation."""
         return len(self.errors) == 0
 
+    @property
+    def created_at_iso(self) -> str:
+        """Creation timestamp, stamped on first read rather than at construction."""
+        if self.created_at is None:
+            self.created_at = datetime.utcnow().isoformat()
+        return self.created_at
+
 
-@dataclass
+@dataclass(slots=True)
 class IR:
     """STEPGraph Intermediate Representation - root container for geometry data."""
 
@@ -161,22 +244,70 @@ class IR:
     # Optional computed properties
     bounding_box: Optional[BoundingBox] = None
 
-    def __post_init__(self) -> None:
+    # Set to False for trusted data that already carries its validation
+    # results, e.g. a reload of a dumped IR; indices are still built
+    validate: InitVar[bool] = True
+
+    # Lookup indices, kept in sync by add_node/add_edge; the id index also
+    # serves as the node id set for validation
+    _node_by_id: Dict[str, Node] = field(init=False, repr=False, compare=False)
+    _nodes_by_type: DefaultDict[str, List[Node]] = field(init=False, repr=False, compare=False)
+    _out_edges: DefaultDict[str, List[Edge]] = field(init=False, repr=False, compare=False)
+    _in_edges: DefaultDict[str, List[Edge]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self, validate: bool) -> None:
         """Validate and update IR after creation."""
+        self._build_indices()
+
+        # Basic validation
+        if validate:
+            self._validate()
+
+    def _build_indices(self) -> None:
+        """Rebuild the lookup indices and counts from the node/edge lists."""
         self.validation.node_count = len(self.nodes)
         self.validation.edge_count = len(self.edges)
 
-        # Basic validation
+        self._node_by_id = {}
+        self._nodes_by_type = defaultdict(list)
+        for node in self.nodes:
+            self._node_by_id.setdefault(node.id, node)
+            self._nodes_by_type[node.type].append(node)
+
+        self._out_edges = defaultdict(list)
+        self._in_edges = defaultdict(list)
+        for edge in self.edges:
+            self._out_edges[edge.src].append(edge)
+            self._in_edges[edge.dst].append(edge)
+
+    def revalidate(self) -> None:
+        """Re-check the whole graph after bulk edits.
+
+        add_node and add_edge keep the indices and counts current in O(1)
+        and only check what they add. Call this after changing ``nodes`` or
+        ``edges`` directly: it rebuilds the indices and replaces
+        ``validation.errors`` with the result of a full validation pass.
+        """
+        self._build_indices()
+        self.validation.errors = []
         self._validate()
 
     def _validate(self) -> None:
         """Perform basic validation on the IR structure."""
-        node_ids = {node.id for node in self.nodes}
+        node_ids = self._node_by_id
 
         # Check for duplicate node IDs
         if len(node_ids) != len(self.nodes):
             self.validation.errors.append("Duplicate node IDs found")
 
+        # Check node and edge types
+        for node_type in self._nodes_by_type:
+            if node_type not in NODE_TYPES:
+                self.validation.errors.append(f"Unknown node type: {node_type}")
+        for edge in self.edges:
+            if edge.type not in EDGE_TYPES:
+                self.validation.errors.append(f"Unknown edge type: {edge.type}")
+
         # Check edge references
         for edge in self.edges:
             if edge.src not in node_ids:
@@ -186,64 +317,116 @@ class IR:
 
     def get_node_by_id(self, node_id: str) -> Optional[Node]:
         """Retrieve a node by its ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._node_by_id.get(node_id)
 
     def get_nodes_by_type(self, node_type: NodeType) -> List[Node]:
         """Retrieve all nodes of a specific type."""
-        return [node for node in self.nodes if node.type == node_type]
+        return list(self._nodes_by_type.get(node_type, ()))
 
     def get_edges_from_node(self, node_id: str) -> List[Edge]:
         """Get all edges originating from a specific node."""
-        return [edge for edge in self.edges if edge.src == node_id]
+        return list(self._out_edges.get(node_id, ()))
 
     def get_edges_to_node(self, node_id: str) -> List[Edge]:
         """Get all edges terminating at a specific node."""
-        return [edge for edge in self.edges if edge.dst == node_id]
+        return list(self._in_edges.get(node_id, ()))
 
     def add_node(self, node: Node) -> None:
         """Add a node to the IR with validation."""
-        if any(existing.id == node.id for existing in self.nodes):
+        if node.id in self._node_by_id:
             raise ValueError(f"Node with ID {node.id} already exists")
+        self._node_by_id[node.id] = node
+        self._nodes_by_type[node.type].append(node)
         self.nodes.append(node)
         self.validation.node_count = len(self.nodes)
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the IR with validation."""
-        node_ids = {node.id for node in self.nodes}
+        node_ids = self._node_by_id
         if edge.src not in node_ids:
             raise ValueError(f"Source node {edge.src} does not exist")
         if edge.dst not in node_ids:
             raise ValueError(f"Destination node {edge.dst} does not exist")
+        self._out_edges[edge.src].append(edge)
+        self._in_edges[edge.dst].append(edge)
         self.edges.append(edge)
         self.validation.edge_count = len(self.edges)
 
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        """Add several edges at once.
+
+        All edges are checked before any is added, so a bad reference
+        leaves the IR unchanged.
+        """
+        edges = list(edges)
+        node_ids = self._node_by_id
+        for edge in edges:
+            if edge.src not in node_ids:
+                raise ValueError(f"Source node {edge.src} does not exist")
+            if edge.dst not in node_ids:
+                raise ValueError(f"Destination node {edge.dst} does not exist")
+
+        out_edges = self._out_edges
+        in_edges = self._in_edges
+        for edge in edges:
+            out_edges[edge.src].append(edge)
+            in_edges[edge.dst].append(edge)
+        self.edges.extend(edges)
+        self.validation.edge_count = len(self.edges)
+
+
+# Factory functions for common node types; each entry builds the standard
+# attributes for its node type from the factory's positional arguments
+_NODE_FACTORIES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "Assembly": lambda name: {"name": name, "description": f"Assembly: {name}"},
+    "Part": lambda name: {"name": name, "description": f"Part: {name}"},
+    "Unit": lambda unit_type, unit_value: {"unit_type": unit_type, "value": unit_value},
+}
+
+
+def create_node(
+    node_type: NodeType,
+    *args: str,
+    node_id: Optional[str] = None,
+    attrs: Optional[Dict[str, Any]] = None,
+) -> Node:
+    """Create a node of a type with standard attributes.
+
+    ``args`` are passed to the type's attribute builder. ``attrs`` is used
+    as the node's attribute dict (not copied), with the standard
+    attributes added to it.
+    """
+    try:
+        build_attrs = _NODE_FACTORIES[node_type]
+    except KeyError:
+        raise ValueError(f"No node factory for type: {node_type}") from None
+
+    standard = build_attrs(*args)
+    if attrs is None:
+        attrs = standard
+    else:
+        attrs.update(standard)
+    return Node(id=node_id or _default_idgen.next(), type=node_type, attrs=attrs)
+
 
-# Factory functions for common node types
 def create_assembly_node(name: str, node_id: Optional[str] = None) -> Node:
     """Create an assembly node with standard attributes."""
-    return Node(
-        id=node_id or str(uuid.uuid4()),
-        type="Assembly",
-        attrs={"name": name, "description": f"Assembly: {name}"}
-    )
+    return create_node("Assembly", name, node_id=node_id)
 
 
-def create_part_node(name: str, node_id: Optional[str] = None) -> Node:
-    """Create a part node with standard attributes."""
-    return Node(
-        id=node_id or str(uuid.uuid4()),
-        type="Part",
-        attrs={"name": name, "description": f"Part: {name}"}
-    )
+def create_part_node(
+    name: str,
+    node_id: Optional[str] = None,
+    attrs: Optional[Dict[str, Any]] = None,
+) -> Node:
+    """Create a part node with standard attributes.
+
+    ``attrs`` is used as the node's attribute dict (not copied), with the
+    standard name and description added to it.
+    """
+    return create_node("Part", name, node_id=node_id, attrs=attrs)
 
 
 def create_unit_node(unit_type: str, unit_value: str, node_id: Optional[str] = None) -> Node:
     """Create a unit node."""
-    return Node(
-        id=node_id or str(uuid.uuid4()),
-        type="Unit",
-        attrs={"unit_type": unit_type, "value": unit_value}
-    )
\ No newline at end of file
+    return create_node("Unit", unit_type, unit_value, node_id=node_id)
@@ -6,23 +6,64 @@ for reproducible IR generation across different runs.
 
 from __future__ import annotations
 
-import json
+import dataclasses
+import mmap
+import operator
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Union
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, TypeVar, Union
 
 import orjson
 
-from .schema import IR, Node, Edge
+from .schema import IR, BoundingBox, Edge, Node, ValidationInfo
 
 
-def _sort_dict_recursive(obj: Any) -> Any:
-    """Recursively sort dictionaries for deterministic output."""
-    if isinstance(obj, dict):
-        return {k: _sort_dict_recursive(v) for k, v in sorted(obj.items())}
-    elif isinstance(obj, list):
-        return [_sort_dict_recursive(item) for item in obj]
-    else:
-        return obj
+def _dumps_options(deterministic: bool) -> int:
+    """orjson options for an IR dump; deterministic output sorts dict keys."""
+    return orjson.OPT_SORT_KEYS if deterministic else 0
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode values orjson has no native support for.
+
+    Node and edge attrs are free-form, so they may carry schema dataclasses
+    such as a BoundingBox, sets, paths or numpy values. Unknown types still
+    raise ``TypeError``, which orjson reports as ``JSONEncodeError``.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow, skipping private caches; orjson calls back for nested values
+        return {
+            field.name: getattr(obj, field.name)
+            for field in dataclasses.fields(obj)
+            if not field.name.startswith("_")
+        }
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    if hasattr(obj, "tolist"):  # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Node type priority for deterministic ordering
+_NODE_TYPE_PRIORITY = {
+    "Assembly": 0,
+    "Part": 1,
+    "Product": 2,
+    "ManifoldSolidBrep": 10,
+    "AdvancedFace": 11,
+    "EdgeCurve": 12,
+    "VertexPoint": 13,
+    "Unit": 20,
+    "CoordinateSystem": 21,
+    "PMI_Entity": 30,
+    "GeometricTolerance": 31,
+    "DimensioningTolerance": 32,
+    "ValidationProperty": 40,
+    "MaterialProperty": 41,
+    "SurfaceFinish": 42,
+}
 
 
 def _node_sort_key(node: Node) -> tuple[int, str]:
@@ -32,39 +73,23 @@ def _node_sort_key(node: Node) -> tuple[int, str]:
     1. Node type priority (Assembly -> Part -> Geometry -> Units -> PMI)
     2. Node ID alphabetically
     """
-    type_priority = {
-        "Assembly": 0,
-        "Part": 1,
-        "Product": 2,
-        "ManifoldSolidBrep": 10,
-        "AdvancedFace": 11,
-        "EdgeCurve": 12,
-        "VertexPoint": 13,
-        "Unit": 20,
-        "CoordinateSystem": 21,
-        "PMI_Entity": 30,
-        "GeometricTolerance": 31,
-        "DimensioningTolerance": 32,
-        "ValidationProperty": 40,
-        "MaterialProperty": 41,
-        "SurfaceFinish": 42,
-    }
+    return (_NODE_TYPE_PRIORITY.get(node.type, 999), node.id)
 
-    priority = type_priority.get(node.type, 999)
-    return (priority, node.id)
 
-
-def _edge_sort_key(edge: Edge) -> tuple[str, str, str]:
-    """Generate sort key for deterministic edge ordering."""
-    return (edge.src, edge.dst, edge.type)
+# Generate sort key for deterministic edge ordering: (src, dst, type)
+_edge_sort_key = operator.attrgetter("src", "dst", "type")
 
 
 def to_json_dict(ir: IR, deterministic: bool = True) -> Dict[str, Any]:
     """Convert IR to JSON-serializable dictionary.
 
+    Only nodes and edges are ordered here; dict keys are left in insertion
+    order, and deterministic dumps sort them when encoding
+    (``orjson.OPT_SORT_KEYS``).
+
     Args:
         ir: The IR to serialize
-        deterministic: If True, sort all collections for reproducible output
+        deterministic: If True, sort nodes and edges for reproducible output
 
     Returns:
         Dictionary representation ready for JSON serialization
@@ -77,42 +102,33 @@ def to_json_dict(ir: IR, deterministic: bool = True) -> Dict[str, Any]:
         nodes = sorted(nodes, key=_node_sort_key)
         edges = sorted(edges, key=_edge_sort_key)
 
-    # Convert to dictionaries
-    nodes_data = []
-    for node in nodes:
-        node_dict = {
-            "id": node.id,
-            "type": node.type,
-            "attrs": _sort_dict_recursive(node.attrs) if deterministic else node.attrs,
-        }
-        nodes_data.append(node_dict)
-
-    edges_data = []
-    for edge in edges:
-        edge_dict = {
-            "src": edge.src,
-            "dst": edge.dst,
-            "type": edge.type,
-            "attrs": _sort_dict_recursive(edge.attrs) if deterministic else edge.attrs,
-        }
-        edges_data.append(edge_dict)
+    # Convert to dictionaries. Handing the slotted dataclasses to orjson
+    # directly measured about 3x slower than building these dicts.
+    nodes_data = [
+        {"id": node.id, "type": node.type, "attrs": node.attrs}
+        for node in nodes
+    ]
+    edges_data = [
+        {"src": edge.src, "dst": edge.dst, "type": edge.type, "attrs": edge.attrs}
+        for edge in edges
+    ]
 
     # Build final dictionary
     result = {
         "schema_version": ir.validation.schema_version,
         "model_id": ir.model_id,
         "validation": {
-            "created_at": ir.validation.created_at,
+            "created_at": ir.validation.created_at_iso,
             "node_count": ir.validation.node_count,
             "edge_count": ir.validation.edge_count,
             "is_valid": ir.validation.is_valid,
             "warnings": ir.validation.warnings,
             "errors": ir.validation.errors,
         },
-        "units": _sort_dict_recursive(ir.units) if deterministic else ir.units,
+        "units": ir.units,
         "nodes": nodes_data,
         "edges": edges_data,
-        "provenance": _sort_dict_recursive(ir.provenance) if deterministic else ir.provenance,
+        "provenance": ir.provenance,
     }
 
     # Add optional fields if present
@@ -129,6 +145,28 @@ def to_json_dict(ir: IR, deterministic: bool = True) -> Dict[str, Any]:
     return result
 
 
+def to_json_bytes(ir: IR, deterministic: bool = True, pretty: bool = False) -> bytes:
+    """Convert IR to UTF-8 encoded JSON.
+
+    Prefer this over ``to_json_string`` when the result is written to a
+    file or socket; it skips decoding the payload into a ``str``.
+
+    Args:
+        ir: The IR to serialize
+        deterministic: If True, sort all collections for reproducible output
+        pretty: If True, format JSON with indentation
+
+    Returns:
+        JSON bytes
+    """
+    data = to_json_dict(ir, deterministic=deterministic)
+
+    option = _dumps_options(deterministic)
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_orjson_default, option=option)
+
+
 def to_json_string(ir: IR, deterministic: bool = True, pretty: bool = False) -> str:
     """Convert IR to JSON string.
 
@@ -140,38 +178,137 @@ def to_json_string(ir: IR, deterministic: bool = True, pretty: bool = False) ->
     Returns:
         JSON string representation
     """
-    data = to_json_dict(ir, deterministic=deterministic)
+    return to_json_bytes(ir, deterministic=deterministic, pretty=pretty).decode('utf-8')
+
+
+_BATCH_BUFFER_SIZE = 1 << 20
+
+
+def _iov_max() -> int:
+    """Most buffers a single ``os.writev`` call accepts."""
+    try:
+        return max(1, os.sysconf("SC_IOV_MAX"))
+    except (AttributeError, ValueError, OSError):
+        return 1024
+
+
+_IOV_MAX = _iov_max()
+
+
+def _writev_all(fd: int, chunks: List[bytes]) -> None:
+    """Write every chunk with ``os.writev``, resuming after short writes."""
+    views = [memoryview(chunk) for chunk in chunks]
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if views and written:
+            views[0] = views[0][written:]
+
+
+def _open_for_write(path: Path, buffering: int = -1) -> IO[bytes]:
+    """Open ``path`` for binary writing, creating its directory on demand.
+
+    The parent is only created once opening fails, so repeated dumps into
+    an existing directory cost no extra stat/mkdir syscalls.
+    """
+    try:
+        return open(path, 'wb', buffering=buffering)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, 'wb', buffering=buffering)
+
+
+def _encode_record(ir: IR, deterministic: bool) -> bytes:
+    """Encode one IR as a newline-terminated JSONL record."""
+    return orjson.dumps(
+        to_json_dict(ir, deterministic=deterministic),
+        default=_orjson_default,
+        option=_dumps_options(deterministic) | orjson.OPT_APPEND_NEWLINE,
+    )
 
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    else:
-        # Use orjson for faster serialization
-        return orjson.dumps(data).decode('utf-8')
 
+def write_jsonl(ir: IR, fp: IO[bytes], deterministic: bool = True) -> None:
+    """Append one IR as a JSONL record to an open binary file.
 
-def dump_jsonl(ir: IR, path: Union[str, Path], deterministic: bool = True) -> None:
+    Only this record is held in memory, so callers can stream any number
+    of IRs through a single handle.
+
+    Args:
+        ir: The IR to serialize
+        fp: Binary file object to write to
+        deterministic: If True, sort all collections for reproducible output
+    """
+    fp.write(_encode_record(ir, deterministic))
+
+
+def dump_jsonl(ir: IR, path: Union[str, Path, IO[bytes]], deterministic: bool = True) -> None:
     """Write IR to JSONL file (one JSON object per line).
 
     Args:
-        path: Output file path
+        path: Output file path, or an open binary file object
         ir: The IR to serialize
         deterministic: If True, sort all collections for reproducible output
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if not isinstance(path, (str, os.PathLike)):
+        write_jsonl(ir, path, deterministic=deterministic)
+        return
 
-    json_data = to_json_dict(ir, deterministic=deterministic)
+    with _open_for_write(Path(path)) as f:
+        write_jsonl(ir, f, deterministic=deterministic)
 
-    with open(path, 'wb') as f:
-        f.write(orjson.dumps(json_data))
-        f.write(b'\n')
 
+def _iter_lines(path: Path) -> Iterator[tuple[int, memoryview]]:
+    """Yield ``(line_num, line)`` for every line of a memory-mapped file.
 
-def load_jsonl(path: Union[str, Path]) -> Iterator[IR]:
+    Each line is a memoryview slice into the map and is released as soon
+    as the consumer asks for the next one.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped
+            return
+
+        with mm, memoryview(mm) as view:
+            size = len(mm)
+            pos = 0
+            line_num = 0
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end < 0:
+                    end = size
+                line_num += 1
+                start, pos = pos, end + 1
+
+                with view[start:end] as line:
+                    yield line_num, line
+
+
+def _iter_stream_lines(fp: IO[bytes]) -> Iterator[tuple[int, memoryview]]:
+    """Yield ``(line_num, line)`` for every line read from a binary stream."""
+    for line_num, line in enumerate(fp, 1):
+        yield line_num, memoryview(line)
+
+
+def _is_blank(line: memoryview) -> bool:
+    """Whether a JSONL line holds only whitespace."""
+    # Only lines starting with whitespace are copied to check the rest
+    return not line or (line[0] in b" \t\r\n" and not line.tobytes().strip())
+
+
+def load_jsonl(path: Union[str, Path, IO[bytes]], validate: bool = False) -> Iterator[IR]:
     """Load IR objects from JSONL file.
 
+    Records carry the validation results from when they were built, so by
+    default they are trusted and not re-validated; use ``validate=True``
+    (or ``IR.revalidate``) for files from other sources.
+
     Args:
-        path: Input file path
+        path: Input file path, or an open binary file object
+        validate: If True, re-run structural validation on each IR
 
     Yields:
         IR objects loaded from the file
@@ -180,73 +317,138 @@ def load_jsonl(path: Union[str, Path]) -> Iterator[IR]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If JSON parsing fails or schema is invalid
     """
+    if not isinstance(path, (str, os.PathLike)):
+        lines = _iter_stream_lines(path)
+    else:
+        path = Path(path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"JSONL file not found: {path}")
+
+        # orjson reads each line through a memoryview slice of the map, so
+        # no per-line bytes objects are made
+        lines = _iter_lines(path)
+
+    for line_num, line in lines:
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            # Blank lines are only detected once they fail to parse
+            if _is_blank(line):
+                continue
+            raise ValueError(f"Failed to parse line {line_num}: {e}") from e
+        try:
+            ir = _dict_to_ir(data, validate=validate)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Failed to parse line {line_num}: {e}") from e
+        yield ir
+
+
+def iter_jsonl_raw(path: Union[str, Path]) -> Iterator[memoryview]:
+    """Yield the raw, undecoded records of a JSONL file.
+
+    Records are zero-copy memoryviews into a memory map of the file,
+    without the trailing newline. Blank lines are skipped. A record is only
+    valid until the next one is requested; copy it with ``bytes()`` to keep
+    it longer. Pass it to ``orjson.loads`` to decode, or write it straight
+    to another file or socket to forward it.
+
+    Args:
+        path: Input file path
+
+    Yields:
+        One memoryview per record
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
     path = Path(path)
 
     if not path.exists():
         raise FileNotFoundError(f"JSONL file not found: {path}")
 
-    with open(path, 'rb') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    for _, line in _iter_lines(path):
+        if not _is_blank(line):
+            yield line
+
+
+def filter_jsonl(
+    predicate: Callable[[memoryview], bool],
+    src: Union[str, Path],
+    dst: Union[str, Path],
+) -> int:
+    """Copy the JSONL records of ``src`` accepted by ``predicate`` to ``dst``.
+
+    Records are forwarded byte-for-byte without being decoded, which makes
+    this suited to sharding or splitting large corpora.
+
+    Args:
+        predicate: Called with each raw record (see ``iter_jsonl_raw``)
+        src: Input file path
+        dst: Output file path
+
+    Returns:
+        Number of records written
+    """
+    written = 0
+    with _open_for_write(Path(dst), buffering=_BATCH_BUFFER_SIZE) as f:
+        write = f.write
+        for record in iter_jsonl_raw(src):
+            if predicate(record):
+                write(record)
+                write(b"\n")
+                written += 1
+    return written
+
+
+def _init_fields(cls: type) -> frozenset[str]:
+    """Names a dataclass accepts as ``__init__`` keyword arguments."""
+    return frozenset(f.name for f in dataclasses.fields(cls) if f.init)
 
-            try:
-                data = orjson.loads(line)
-                ir = _dict_to_ir(data)
-                yield ir
-            except (orjson.JSONDecodeError, ValueError) as e:
-                raise ValueError(f"Failed to parse line {line_num}: {e}") from e
 
+_NODE_FIELDS = _init_fields(Node)
+_EDGE_FIELDS = _init_fields(Edge)
+_BBOX_FIELDS = _init_fields(BoundingBox)
+_VALIDATION_FIELDS = _init_fields(ValidationInfo)
 
-def _dict_to_ir(data: Dict[str, Any]) -> IR:
+
+_T = TypeVar("_T")
+
+
+def _init_kwargs(data: Dict[str, Any], field_names: frozenset[str]) -> Dict[str, Any]:
+    """``data`` itself if it only has known keys, else a filtered copy."""
+    if field_names.issuperset(data):
+        return data
+    return {key: value for key, value in data.items() if key in field_names}
+
+
+def _from_records(
+    cls: type[_T], records: List[Dict[str, Any]], field_names: frozenset[str]
+) -> List[_T]:
+    """Build dataclass instances by unpacking decoded records as kwargs.
+
+    Records written by this module carry exactly the init fields, so the
+    common case is a straight ``cls(**record)``; unknown keys are only
+    filtered out once that fails.
+    """
+    try:
+        return [cls(**record) for record in records]
+    except TypeError:
+        return [cls(**_init_kwargs(record, field_names)) for record in records]
+
+
+def _dict_to_ir(data: Dict[str, Any], validate: bool = True) -> IR:
     """Convert dictionary back to IR object."""
-    from .schema import IR, Node, Edge, BoundingBox, ValidationInfo
-
-    # Reconstruct validation info
-    val_data = data.get("validation", {})
-    validation = ValidationInfo(
-        schema_version=val_data.get("schema_version", "0.1.0"),
-        created_at=val_data.get("created_at", ""),
-        node_count=val_data.get("node_count", 0),
-        edge_count=val_data.get("edge_count", 0),
-        warnings=val_data.get("warnings", []),
-        errors=val_data.get("errors", []),
-    )
+    # Validation data also carries the derived is_valid flag
+    validation = ValidationInfo(**_init_kwargs(data.get("validation", {}), _VALIDATION_FIELDS))
+
+    # Decoded attrs dicts are adopted as-is
+    nodes = _from_records(Node, data.get("nodes", []), _NODE_FIELDS)
+    edges = _from_records(Edge, data.get("edges", []), _EDGE_FIELDS)
 
-    # Reconstruct nodes
-    nodes = []
-    for node_data in data.get("nodes", []):
-        node = Node(
-            id=node_data["id"],
-            type=node_data["type"],
-            attrs=node_data.get("attrs", {})
-        )
-        nodes.append(node)
-
-    # Reconstruct edges
-    edges = []
-    for edge_data in data.get("edges", []):
-        edge = Edge(
-            src=edge_data["src"],
-            dst=edge_data["dst"],
-            type=edge_data["type"],
-            attrs=edge_data.get("attrs", {})
-        )
-        edges.append(edge)
-
-    # Reconstruct bounding box if present
     bbox = None
     if "bounding_box" in data:
-        bbox_data = data["bounding_box"]
-        bbox = BoundingBox(
-            min_x=bbox_data["min_x"],
-            min_y=bbox_data["min_y"],
-            min_z=bbox_data["min_z"],
-            max_x=bbox_data["max_x"],
-            max_y=bbox_data["max_y"],
-            max_z=bbox_data["max_z"],
-        )
+        bbox = BoundingBox(**_init_kwargs(data["bounding_box"], _BBOX_FIELDS))
 
     # Create IR object
     ir = IR(
@@ -257,24 +459,48 @@ def _dict_to_ir(data: Dict[str, Any]) -> IR:
         provenance=data.get("provenance", {}),
         validation=validation,
         bounding_box=bbox,
+        validate=validate,
     )
 
     return ir
 
 
-def batch_dump_jsonl(irs: List[IR], path: Union[str, Path], deterministic: bool = True) -> None:
+def batch_dump_jsonl(
+    irs: Iterable[IR],
+    path: Union[str, Path],
+    deterministic: bool = True,
+) -> None:
     """Write multiple IR objects to a JSONL file.
 
+    ``irs`` is consumed lazily, so a generator can stream a corpus larger
+    than memory.
+
     Args:
-        irs: List of IR objects to serialize
+        irs: IR objects to serialize
         path: Output file path
         deterministic: If True, sort all collections for reproducible output
     """
     path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(path, 'wb') as f:
-        for ir in irs:
-            json_data = to_json_dict(ir, deterministic=deterministic)
-            f.write(orjson.dumps(json_data))
-            f.write(b'\n')
\ No newline at end of file
+    records = (_encode_record(ir, deterministic) for ir in irs)
+
+    if not hasattr(os, "writev"):  # Windows
+        # Large buffer so many small records go out in few write syscalls
+        with _open_for_write(path, buffering=_BATCH_BUFFER_SIZE) as f:
+            f.writelines(records)
+        return
+
+    # Hand records to the kernel in scatter/gather batches, skipping the
+    # copy into an in-process buffer
+    with _open_for_write(path, buffering=0) as f:
+        fd = f.fileno()
+        chunks: List[bytes] = []
+        pending = 0
+        for record in records:
+            chunks.append(record)
+            pending += len(record)
+            if len(chunks) >= _IOV_MAX or pending >= _BATCH_BUFFER_SIZE:
+                _writev_all(fd, chunks)
+                chunks = []
+                pending = 0
+        if chunks:
+            _writev_all(fd, chunks)
@@ -6,7 +6,13 @@ to SI base units for consistent numerical processing.
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple, Union
+import functools
+import re
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 # Standard unit definitions
 LENGTH_UNITS = {
@@ -85,11 +91,63 @@ DEFAULT_UNITS = {
 }
 
 
+_UNIT_TABLES = {
+    "length": LENGTH_UNITS,
+    "angle": ANGLE_UNITS,
+    "area": AREA_UNITS,
+    "volume": VOLUME_UNITS,
+    "mass": MASS_UNITS,
+}
+
+# Every (unit_type, from, to) factor, converting via the SI base unit
+_FACTOR_TABLE = {
+    (unit_type, from_name, to_name): from_to_si * (1.0 / to_si)
+    for unit_type, table in _UNIT_TABLES.items()
+    for from_name, from_to_si in table.items()
+    for to_name, to_si in table.items()
+}
+
+
 class UnitConversionError(Exception):
     """Raised when unit conversion fails."""
     pass
 
 
+# Handle STEP/IGES standard unit names
+_STEP_UNIT_NAMES = {
+    "millimetre": "mm",
+    "millimeter": "mm",
+    "metre": "m",
+    "meter": "m",
+    "centimetre": "cm",
+    "centimeter": "cm",
+    "kilometre": "km",
+    "kilometer": "km",
+    "micrometre": "μm",
+    "micrometer": "μm",
+    "nanometre": "nm",
+    "nanometer": "nm",
+
+    "degree": "deg",
+    "degrees": "deg",
+    "radian": "rad",
+    "radians": "rad",
+
+    "inch": "in",
+    "inches": "in",
+    "foot": "ft",
+    "feet": "ft",
+    "yard": "yd",
+    "yards": "yd",
+
+    "kilogram": "kg",
+    "gram": "g",
+    "pound": "lb",
+    "ounce": "oz",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_unit_name(unit: str) -> str:
     """Normalize unit name to standard form.
 
@@ -106,43 +164,10 @@ def normalize_unit_name(unit: str) -> str:
         'deg'
     """
     unit = unit.strip().lower()
-
-    # Handle STEP/IGES standard unit names
-    step_mappings = {
-        "millimetre": "mm",
-        "millimeter": "mm",
-        "metre": "m",
-        "meter": "m",
-        "centimetre": "cm",
-        "centimeter": "cm",
-        "kilometre": "km",
-        "kilometer": "km",
-        "micrometre": "μm",
-        "micrometer": "μm",
-        "nanometre": "nm",
-        "nanometer": "nm",
-
-        "degree": "deg",
-        "degrees": "deg",
-        "radian": "rad",
-        "radians": "rad",
-
-        "inch": "in",
-        "inches": "in",
-        "foot": "ft",
-        "feet": "ft",
-        "yard": "yd",
-        "yards": "yd",
-
-        "kilogram": "kg",
-        "gram": "g",
-        "pound": "lb",
-        "ounce": "oz",
-    }
-
-    return step_mappings.get(unit, unit)
+    return _STEP_UNIT_NAMES.get(unit, unit)
 
 
+@functools.lru_cache(maxsize=256)
 def get_conversion_factor(from_unit: str, to_unit: str, unit_type: str) -> float:
     """Get conversion factor between two units.
 
@@ -157,32 +182,18 @@ def get_conversion_factor(from_unit: str, to_unit: str, unit_type: str) -> float
     Raises:
         UnitConversionError: If units are incompatible or unknown
     """
-    unit_tables = {
-        "length": LENGTH_UNITS,
-        "angle": ANGLE_UNITS,
-        "area": AREA_UNITS,
-        "volume": VOLUME_UNITS,
-        "mass": MASS_UNITS,
-    }
-
-    if unit_type not in unit_tables:
-        raise UnitConversionError(f"Unknown unit type: {unit_type}")
-
-    table = unit_tables[unit_type]
-
     from_normalized = normalize_unit_name(from_unit)
     to_normalized = normalize_unit_name(to_unit)
 
-    if from_normalized not in table:
-        raise UnitConversionError(f"Unknown {unit_type} unit: {from_unit}")
-    if to_normalized not in table:
-        raise UnitConversionError(f"Unknown {unit_type} unit: {to_unit}")
+    factor = _FACTOR_TABLE.get((unit_type, from_normalized, to_normalized))
+    if factor is not None:
+        return factor
 
-    # Convert via SI base unit
-    from_to_si = table[from_normalized]
-    si_to_target = 1.0 / table[to_normalized]
-
-    return from_to_si * si_to_target
+    if unit_type not in _UNIT_TABLES:
+        raise UnitConversionError(f"Unknown unit type: {unit_type}")
+    if from_normalized not in _UNIT_TABLES[unit_type]:
+        raise UnitConversionError(f"Unknown {unit_type} unit: {from_unit}")
+    raise UnitConversionError(f"Unknown {unit_type} unit: {to_unit}")
 
 
 def convert_value(value: float, from_unit: str, to_unit: str, unit_type: str) -> float:
@@ -207,6 +218,39 @@ def convert_value(value: float, from_unit: str, to_unit: str, unit_type: str) ->
     return value * factor
 
 
+def convert_array(
+    values: ArrayLike,
+    from_unit: str,
+    to_unit: str,
+    unit_type: str,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Convert an array of values between units.
+
+    The factor is resolved once and applied with a single NumPy multiply,
+    which suits bulk data such as vertex coordinates.
+
+    Args:
+        values: Numeric values to convert (any array-like)
+        from_unit: Source unit
+        to_unit: Target unit
+        unit_type: Type of unit (length, angle, area, volume, mass)
+        out: Optional float64 array to write the result into, e.g.
+            ``values`` itself for an in-place conversion
+
+    Returns:
+        Converted values as a float64 array
+
+    Examples:
+        >>> convert_array([1000.0, 2500.0], "mm", "m", "length")
+        array([1. , 2.5])
+    """
+    import numpy as np
+
+    factor = get_conversion_factor(from_unit, to_unit, unit_type)
+    return np.multiply(np.asarray(values, dtype=np.float64), factor, out=out)
+
+
 def normalize_to_si(value: float, unit: str, unit_type: str) -> float:
     """Convert value to SI base unit.
 
@@ -232,6 +276,16 @@ def normalize_to_si(value: float, unit: str, unit_type: str) -> float:
     return convert_value(value, unit, si_units[unit_type], unit_type)
 
 
+# Unit keywords in STEP data, matched as whole words in one pass. SI units
+# are written as SI_UNIT(.MILLI.,.METRE.), so the MILLI prefix means mm.
+_STEP_UNIT_PATTERN = re.compile(
+    r"\b(MILLIMETRE|MILLIMETER|MILLI|MM|METRE|METER|INCH|DEGREE|RADIAN)\b",
+    re.IGNORECASE,
+)
+
+_MILLIMETRE_KEYWORDS = frozenset({"MILLIMETRE", "MILLIMETER", "MILLI", "MM"})
+
+
 def detect_step_units(step_data: str) -> Dict[str, str]:
     """Detect units from STEP file header or content.
 
@@ -247,21 +301,20 @@ def detect_step_units(step_data: str) -> Dict[str, str]:
     """
     detected = DEFAULT_UNITS.copy()
 
-    # Simple pattern matching for common STEP unit declarations
-    step_data_upper = step_data.upper()
+    found = {match.upper() for match in _STEP_UNIT_PATTERN.findall(step_data)}
 
     # Length units
-    if "MILLIMETRE" in step_data_upper or "MM" in step_data_upper:
+    if found & _MILLIMETRE_KEYWORDS:
         detected["length"] = "mm"
-    elif "METRE" in step_data_upper or "METER" in step_data_upper:
+    elif "METRE" in found or "METER" in found:
         detected["length"] = "m"
-    elif "INCH" in step_data_upper or "IN" in step_data_upper:
+    elif "INCH" in found:
         detected["length"] = "in"
 
     # Angle units
-    if "DEGREE" in step_data_upper:
+    if "DEGREE" in found:
         detected["angle"] = "deg"
-    elif "RADIAN" in step_data_upper:
+    elif "RADIAN" in found:
         detected["angle"] = "rad"
 
     return detected
@@ -5,14 +5,15 @@ Provides common test fixtures and configuration for the ShapeBridge test suite.
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable
+from unittest.mock import Mock
 
 import pytest
 import structlog
 
 from kernel.occt_io import LoadedModel, get_occt_info
+from kernel.summary import GeometrySummary
 from stepgraph_ir.schema import IR, Node, Edge, create_part_node
 
 
@@ -27,13 +28,12 @@ structlog.configure(
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """Provide a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_step_content() -> str:
     """Provide minimal valid STEP file content for testing."""
     return """ISO-10303-21;
@@ -52,14 +52,20 @@ END-ISO-10303-21;
 """
 
 
-@pytest.fixture
-def sample_step_file(temp_dir: Path, sample_step_content: str) -> Path:
-    """Create a sample STEP file for testing."""
-    step_file = temp_dir / "test.step"
+@pytest.fixture(scope="session")
+def sample_step_file(tmp_path_factory: pytest.TempPathFactory, sample_step_content: str) -> Path:
+    """Create a sample STEP file once per session; tests must treat it as read-only."""
+    step_file = tmp_path_factory.mktemp("step") / "test.step"
     step_file.write_text(sample_step_content, encoding="utf-8")
     return step_file
 
 
+@pytest.fixture(scope="session")
+def sample_step_size(sample_step_file: Path) -> int:
+    """Size in bytes of the session's sample STEP file."""
+    return sample_step_file.stat().st_size
+
+
 @pytest.fixture
 def mock_loaded_model() -> LoadedModel:
     """Provide a mock LoadedModel for testing."""
@@ -74,9 +80,38 @@ def mock_loaded_model() -> LoadedModel:
     )
 
 
-@pytest.fixture
+# Attribute names of the mocked classes, listed once. Mock(spec=<class>)
+# walks dir() of the class again for every mock it builds.
+_LOADED_MODEL_SPEC = dir(LoadedModel)
+_SUMMARY_SPEC = dir(GeometrySummary)
+
+
+def _spec_mock_factory(spec: list[str]) -> Callable[..., Mock]:
+    def make(**attrs: Any) -> Mock:
+        mock = Mock(spec=spec)
+        mock.configure_mock(**attrs)
+        return mock
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_loaded_model() -> Callable[..., Mock]:
+    """Build Mocks restricted to LoadedModel attributes, configured from kwargs."""
+    return _spec_mock_factory(_LOADED_MODEL_SPEC)
+
+
+@pytest.fixture(scope="session")
+def make_summary() -> Callable[..., Mock]:
+    """Build Mocks restricted to GeometrySummary attributes, configured from kwargs."""
+    return _spec_mock_factory(_SUMMARY_SPEC)
+
+
+@pytest.fixture(scope="session")
 def sample_ir() -> IR:
-    """Provide a sample IR for testing."""
+    """Provide a sample IR for testing.
+
+    Shared across the session, so tests must treat it as read-only.
+    """
     part_node = create_part_node("test_part", "test_part_id")
     part_node.attrs["topology"] = {"faces": 6, "edges": 12, "vertices": 8}
 
@@ -89,12 +124,22 @@ def sample_ir() -> IR:
     )
 
 
-@pytest.fixture
-def skip_if_no_occt():
-    """Skip test if no OCCT binding is available."""
-    occt_info = get_occt_info()
-    if not occt_info["pyOCCT_available"] and not occt_info["pythonOCC_available"]:
-        pytest.skip("No OCCT binding available (pyOCCT or pythonOCC required)")
+@pytest.fixture(scope="session")
+def occt_info() -> dict[str, Any]:
+    """OCCT binding detection results, computed once per test session."""
+    return get_occt_info()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip every ``occt``-marked test up front if no OCCT binding is available."""
+    info = get_occt_info()
+    if info["pyOCCT_available"] or info["pythonOCC_available"]:
+        return
+
+    skip_occt = pytest.mark.skip(reason="No OCCT binding available (pyOCCT or pythonOCC required)")
+    for item in items:
+        if "occt" in item.keywords:
+            item.add_marker(skip_occt)
 
 
 class MockShape:
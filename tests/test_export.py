@@ -0,0 +1,229 @@
+"""Tests for placeholder 3D export."""
+
+from __future__ import annotations
+
+import base64
+import io
+import struct
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import orjson
+import pytest
+
+from kernel.export import (
+    ExportError,
+    _b64_stream,
+    _future_create_glb_from_mesh,
+    _future_tessellate_shape,
+    export_glb_placeholder,
+    export_gltf_placeholder,
+    export_model_view,
+    write_base64,
+)
+from kernel.occt_io import LoadedModel
+
+
+class TestPlaceholderExport:
+    """Test cases for placeholder GLB/GLTF generation."""
+
+    def test_glb_header(self):
+        """Test GLB header and JSON chunk layout."""
+        uri, data = export_glb_placeholder("test_model")
+
+        assert uri == "memory://test_model.glb"
+        magic, version, total_length = struct.unpack_from("<4sII", data, 0)
+        chunk_length, chunk_type = struct.unpack_from("<I4s", data, 12)
+        assert magic == b"glTF"
+        assert version == 2
+        assert total_length == len(data)
+        assert chunk_type == b"JSON"
+        assert chunk_length % 4 == 0
+        assert 20 + chunk_length == len(data)
+
+    def test_glb_write(self, temp_dir: Path):
+        """Test GLB export to file."""
+        output_path = temp_dir / "model.glb"
+        uri, data = export_glb_placeholder("test_model", output_path)
+
+        assert uri.startswith("file://")
+        assert output_path.read_bytes() == data
+
+    def test_glb_write_to_handle(self, temp_dir: Path):
+        """Test GLB bytes are written to an open file handle."""
+        output_path = temp_dir / "model.glb"
+        with open(output_path, "wb") as fp:
+            uri, data = export_glb_placeholder("test_model", output_fp=fp)
+
+        assert uri == f"file://{output_path.resolve()}"
+        assert output_path.read_bytes() == data
+
+    def test_gltf_write_to_stream(self):
+        """Test unnamed streams get an in-memory URI."""
+        buffer = io.BytesIO()
+        uri, gltf = export_gltf_placeholder("test_model", output_fp=buffer)
+
+        assert uri == "memory://test_model.gltf"
+        assert orjson.loads(buffer.getvalue()) == gltf
+
+    def test_gltf_model_id(self, temp_dir: Path):
+        """Test GLTF export embeds the model ID."""
+        output_path = temp_dir / "model.gltf"
+        _, gltf = export_gltf_placeholder('quote"model', output_path)
+
+        assert gltf["nodes"][0]["name"] == 'Model_quote"model'
+        assert gltf["meshes"][0]["name"] == 'Mesh_quote"model'
+        assert output_path.exists()
+
+
+class TestExportModelView:
+    """Test cases for export_model_view."""
+
+    def test_glb_base64_serializes(self, mock_loaded_model: LoadedModel):
+        """Test the base64 payload survives copying and JSON serialization."""
+        result = export_model_view(mock_loaded_model, format="glb")
+        _, data = export_glb_placeholder(mock_loaded_model.model_id)
+        encoded = base64.b64encode(data).decode("ascii")
+
+        assert result["size_bytes"] == len(data)
+        assert dict(result)["data_base64"] == encoded
+        assert orjson.loads(orjson.dumps(result))["data_base64"] == encoded
+
+    def test_glb_raw_bytes(self, mock_loaded_model: LoadedModel):
+        """Test raw bytes are returned without base64 encoding."""
+        result = export_model_view(mock_loaded_model, format="glb", encode_base64=False)
+
+        assert isinstance(result["data"], bytes)
+        assert "data_base64" not in result
+
+    def test_write_base64(self, mock_loaded_model: LoadedModel):
+        """Test raw GLB bytes can be streamed base64-encoded to a writer."""
+        result = export_model_view(mock_loaded_model, format="glb", encode_base64=False)
+        out = io.BytesIO()
+
+        written = write_base64(result["data"], out)
+
+        assert out.getvalue() == base64.b64encode(result["data"])
+        assert written == len(out.getvalue())
+
+    def test_b64_stream_chunks(self):
+        """Test chunked encoding matches one-shot encoding."""
+        data = bytes(range(256)) * 1000 + b"tail"
+        out = io.BytesIO()
+
+        _b64_stream(data, out)
+
+        assert out.getvalue() == base64.b64encode(data)
+
+    def test_unsupported_format(self, mock_loaded_model: LoadedModel):
+        """Test unsupported formats raise ExportError."""
+        with pytest.raises(ExportError, match="Unsupported export format"):
+            export_model_view(mock_loaded_model, format="obj")
+
+
+def _fake_face(nodes, triangles, reverse=False):
+    """Build a mock face/triangulation pair with 1-based OCCT accessors."""
+    poly = Mock()
+    poly.IsNull.return_value = False
+    poly.NbNodes.return_value = len(nodes)
+    poly.NbTriangles.return_value = len(triangles)
+    poly.Node.side_effect = lambda i: Mock(
+        X=Mock(return_value=nodes[i - 1][0]),
+        Y=Mock(return_value=nodes[i - 1][1]),
+        Z=Mock(return_value=nodes[i - 1][2]),
+    )
+    poly.Triangle.side_effect = lambda i: Mock(
+        Value=Mock(side_effect=lambda k: triangles[i - 1][k - 1])
+    )
+    face = Mock()
+    face.Orientation.return_value = "reversed" if reverse else "forward"
+    return face, poly
+
+
+class TestTessellation:
+    """Test cases for tessellation into flat arrays."""
+
+    def test_tessellate_arrays(self):
+        """Test per-face arrays are concatenated and reversed faces flipped."""
+        corners = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+        face_a, poly_a = _fake_face(corners, [(1, 2, 3)])
+        face_b, poly_b = _fake_face(corners, [(1, 2, 3)], reverse=True)
+        polys = {id(face_a): poly_a, id(face_b): poly_b}
+
+        explorer = Mock()
+        explorer.More.side_effect = [True, True, False]
+        explorer.Current.side_effect = [face_a, face_b]
+        mesher = Mock()
+        mesher.IsDone.return_value = True
+        location = Mock()
+        location.IsIdentity.return_value = True
+
+        symbols = {
+            "mesher": Mock(return_value=mesher),
+            "explorer": Mock(return_value=explorer),
+            "location": Mock(return_value=location),
+            "face_type": "face",
+            "reversed": "reversed",
+            "to_face": lambda shape: shape,
+            "triangulation": lambda face, loc: polys[id(face)],
+        }
+        with patch("kernel.export.tessellation_symbols", return_value=symbols):
+            mesh = _future_tessellate_shape(Mock(), "pythonOCC")
+
+        assert mesh["vertices"].shape == (6, 3)
+        assert mesh["vertices"].dtype == np.float32
+        assert mesh["faces"].dtype == np.uint32
+        assert mesh["faces"].tolist() == [[0, 1, 2], [3, 5, 4]]
+        assert mesh["normals"].shape == (6, 3)
+        np.testing.assert_allclose(mesh["normals"][0], [0.0, 0.0, 1.0])
+        np.testing.assert_allclose(mesh["normals"][3], [0.0, 0.0, -1.0])
+
+    def test_tessellate_unknown_binding(self):
+        """Test unknown bindings raise ExportError."""
+        with pytest.raises(ExportError, match="Unsupported binding"):
+            _future_tessellate_shape(Mock(), "nope")
+
+
+class TestQuantizedGLB:
+    """Test cases for quantized GLB generation from mesh arrays."""
+
+    def test_quantized_positions_roundtrip(self):
+        """Test positions decode back through the node transform."""
+        vertices = np.array(
+            [[-5.0, 0.0, 2.0], [5.0, 0.0, 2.0], [0.0, 10.0, 4.0]], dtype=np.float32
+        )
+        faces = np.array([[0, 1, 2]], dtype=np.uint32)
+        normals = np.tile(np.array([0.0, 0.0, 1.0], dtype=np.float32), (3, 1))
+
+        data = _future_create_glb_from_mesh(
+            {"vertices": vertices, "faces": faces, "normals": normals}
+        )
+
+        total_length = struct.unpack_from("<I", data, 8)[0]
+        json_length = struct.unpack_from("<I", data, 12)[0]
+        assert total_length == len(data)
+        gltf = orjson.loads(data[20:20 + json_length])
+        assert gltf["extensionsRequired"] == ["KHR_mesh_quantization"]
+
+        bin_offset = 20 + json_length
+        bin_length, chunk_type = struct.unpack_from("<I4s", data, bin_offset)
+        assert chunk_type == b"BIN\x00"
+        binary = data[bin_offset + 8:bin_offset + 8 + bin_length]
+
+        position = gltf["accessors"][0]
+        assert position["componentType"] == 5123
+        assert position["normalized"] is True
+        view = gltf["bufferViews"][position["bufferView"]]
+        q = np.frombuffer(
+            binary, dtype="<u2", count=view["byteLength"] // 2, offset=view["byteOffset"]
+        ).reshape(-1, 4)[:, :3]
+        assert position["min"] == q.min(axis=0).tolist()
+        assert position["max"] == q.max(axis=0).tolist()
+
+        node = gltf["nodes"][0]
+        decoded = np.array(node["translation"]) + q / 65535.0 * np.array(node["scale"])
+        np.testing.assert_allclose(decoded, vertices, atol=1e-3)
+
+        indices = gltf["accessors"][gltf["meshes"][0]["primitives"][0]["indices"]]
+        assert indices["count"] == 3
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import uuid
+import os
+import sys
+from datetime import datetime
 from typing import Dict, Any
 
 import pytest
@@ -16,12 +18,31 @@ from stepgraph_ir.schema import (
     BoundingBox,
     ValidationInfo,
     create_assembly_node,
+    create_node,
     create_part_node,
     create_unit_node,
     SCHEMA_VERSION,
+    NODE_TYPES,
+    EDGE_TYPES,
 )
 
 
+VALID_NODE_TYPES: list[NodeType] = [
+    "Assembly", "Part", "Product",
+    "ManifoldSolidBrep", "AdvancedFace", "EdgeCurve", "VertexPoint",
+    "Unit", "CoordinateSystem",
+    "PMI_Entity", "GeometricTolerance", "DimensioningTolerance",
+    "ValidationProperty", "MaterialProperty", "SurfaceFinish",
+]
+
+VALID_EDGE_TYPES: list[EdgeType] = [
+    "contains", "part_of", "instance_of",
+    "bounded_by", "adjacent_to", "shares_edge", "shares_vertex",
+    "has_pmi", "has_material", "has_tolerance", "references",
+    "measured_in", "coordinate_system",
+]
+
+
 class TestNode:
     """Test cases for Node class."""
 
@@ -37,28 +58,52 @@ class TestNode:
         node = Node(id="", type="Part")
         assert node.id != ""
         assert len(node.id) > 0
-        # Should be a valid UUID
-        uuid.UUID(node.id)
 
-    def test_node_auto_name_generation(self):
-        """Test automatic name generation for top-level nodes."""
+        # Generated IDs are unique, including across factory functions
+        other = Node(id="", type="Part")
+        assert other.id != node.id
+        assert create_part_node("Test Part").id not in (node.id, other.id)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+    def test_node_ids_differ_after_fork(self):
+        """Test a forked child does not repeat the parent's generated IDs."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, Node(id="", type="Part").id.encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent_id = Node(id="", type="Part").id
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_id = pipe.read().decode()
+        os.waitpid(pid, 0)
+
+        assert child_id
+        assert child_id != parent_id
+
+    def test_node_type_interned(self):
+        """Test that node and edge types built at runtime are interned."""
+        node = Node(id="test_id", type="".join(["Pa", "rt"]))
+        edge = Edge(src="a", dst="b", type="".join(["con", "tains"]))
+        assert node.type is sys.intern("Part")
+        assert edge.type is sys.intern("contains")
+
+    def test_node_display_name(self):
+        """Test display name fallback for unnamed nodes."""
         node = Node(id="test_id", type="Assembly")
-        assert "name" in node.attrs
-        assert "Unnamed_Assembly" in node.attrs["name"]
+        assert "name" not in node.attrs
+        assert node.display_name == "Unnamed_Assembly_test_id"
 
-    def test_node_types(self):
-        """Test all supported node types."""
-        valid_types: list[NodeType] = [
-            "Assembly", "Part", "Product",
-            "ManifoldSolidBrep", "AdvancedFace", "EdgeCurve", "VertexPoint",
-            "Unit", "CoordinateSystem",
-            "PMI_Entity", "GeometricTolerance", "DimensioningTolerance",
-            "ValidationProperty", "MaterialProperty", "SurfaceFinish",
-        ]
+        named = Node(id="test_id", type="Part", attrs={"name": "Bracket"})
+        assert named.display_name == "Bracket"
 
-        for node_type in valid_types:
-            node = Node(id=f"test_{node_type}", type=node_type)
-            assert node.type == node_type
+    @pytest.mark.parametrize("node_type", VALID_NODE_TYPES, ids=VALID_NODE_TYPES)
+    def test_node_types(self, node_type: NodeType):
+        """Test all supported node types."""
+        node = Node(id=f"test_{node_type}", type=node_type)
+        assert node.type == node_type
 
 
 class TestEdge:
@@ -84,18 +129,11 @@ class TestEdge:
         with pytest.raises(ValueError, match="Self-loops are not allowed"):
             Edge(src="node1", dst="node1", type="contains")
 
-    def test_edge_types(self):
+    @pytest.mark.parametrize("edge_type", VALID_EDGE_TYPES, ids=VALID_EDGE_TYPES)
+    def test_edge_types(self, edge_type: EdgeType):
         """Test all supported edge types."""
-        valid_types: list[EdgeType] = [
-            "contains", "part_of", "instance_of",
-            "bounded_by", "adjacent_to", "shares_edge", "shares_vertex",
-            "has_pmi", "has_material", "has_tolerance", "references",
-            "measured_in", "coordinate_system",
-        ]
-
-        for edge_type in valid_types:
-            edge = Edge(src="node1", dst="node2", type=edge_type)
-            assert edge.type == edge_type
+        edge = Edge(src="node1", dst="node2", type=edge_type)
+        assert edge.type == edge_type
 
 
 class TestBoundingBox:
@@ -125,7 +163,17 @@ class TestBoundingBox:
             max_x=10.0, max_y=20.0, max_z=30.0
         )
         center = bbox.center
-        assert center == (5.0, 10.0, 0.0)  # Note: bug in original center calculation
+        assert center == (5.0, 10.0, 15.0)
+        assert bbox.center is center
+
+    def test_bounding_box_is_immutable(self):
+        """Test that cached derived values cannot go stale."""
+        bbox = BoundingBox(
+            min_x=0.0, min_y=0.0, min_z=0.0,
+            max_x=1.0, max_y=1.0, max_z=1.0
+        )
+        with pytest.raises(AttributeError):
+            bbox.max_x = 2.0
 
 
 class TestValidationInfo:
@@ -151,27 +199,51 @@ class TestValidationInfo:
         validation = ValidationInfo(warnings=["Test warning"])
         assert validation.is_valid is True
 
+    def test_validation_info_created_at_lazy(self):
+        """Test that the creation timestamp is stamped once on first read."""
+        validation = ValidationInfo()
+        assert validation.created_at is None
+
+        stamp = validation.created_at_iso
+        assert datetime.fromisoformat(stamp)
+        assert validation.created_at == stamp
+        assert validation.created_at_iso == stamp
+
+        loaded = ValidationInfo(created_at="2024-01-01T00:00:00")
+        assert loaded.created_at_iso == "2024-01-01T00:00:00"
+
+
+@pytest.fixture(scope="module")
+def small_assembly_ir() -> IR:
+    """An assembly containing two adjacent parts, shared read-only by TestIR."""
+    return IR(
+        model_id="test_model",
+        nodes=[
+            Node(id="node1", type="Part"),
+            Node(id="node2", type="Part"),
+            Node(id="node3", type="Assembly"),
+        ],
+        edges=[
+            Edge(src="node3", dst="node1", type="contains"),
+            Edge(src="node3", dst="node2", type="contains"),
+            Edge(src="node1", dst="node2", type="adjacent_to"),
+        ],
+    )
+
 
 class TestIR:
     """Test cases for IR class."""
 
-    def test_ir_creation(self):
+    def test_ir_creation(self, small_assembly_ir: IR):
         """Test basic IR creation."""
-        node1 = Node(id="node1", type="Part")
-        node2 = Node(id="node2", type="Part")
-        edge1 = Edge(src="node1", dst="node2", type="contains")
-
-        ir = IR(
-            model_id="test_model",
-            nodes=[node1, node2],
-            edges=[edge1],
-        )
+        ir = small_assembly_ir
 
         assert ir.model_id == "test_model"
-        assert len(ir.nodes) == 2
-        assert len(ir.edges) == 1
-        assert ir.validation.node_count == 2
-        assert ir.validation.edge_count == 1
+        assert len(ir.nodes) == 3
+        assert len(ir.edges) == 3
+        assert ir.validation.node_count == 3
+        assert ir.validation.edge_count == 3
+        assert ir.validation.is_valid
 
     def test_ir_validation_duplicate_nodes(self):
         """Test IR validation catches duplicate node IDs."""
@@ -201,70 +273,54 @@ class TestIR:
         assert not ir.validation.is_valid
         assert any("unknown destination node" in error for error in ir.validation.errors)
 
-    def test_ir_get_node_by_id(self):
-        """Test getting node by ID."""
+    def test_ir_validation_unknown_types(self):
+        """Test IR validation catches node and edge types outside the schema."""
         node1 = Node(id="node1", type="Part")
-        node2 = Node(id="node2", type="Assembly")
+        node2 = Node(id="node2", type="Widget")
+        edge1 = Edge(src="node1", dst="node2", type="glued_to")
 
         ir = IR(
             model_id="test_model",
             nodes=[node1, node2],
-            edges=[],
+            edges=[edge1],
         )
 
-        found_node = ir.get_node_by_id("node1")
+        assert "Unknown node type: Widget" in ir.validation.errors
+        assert "Unknown edge type: glued_to" in ir.validation.errors
+        assert "Part" in NODE_TYPES
+        assert "contains" in EDGE_TYPES
+
+    def test_ir_get_node_by_id(self, small_assembly_ir: IR):
+        """Test getting node by ID."""
+        found_node = small_assembly_ir.get_node_by_id("node1")
         assert found_node is not None
         assert found_node.id == "node1"
         assert found_node.type == "Part"
 
-        not_found = ir.get_node_by_id("nonexistent")
+        not_found = small_assembly_ir.get_node_by_id("nonexistent")
         assert not_found is None
 
-    def test_ir_get_nodes_by_type(self):
+    def test_ir_get_nodes_by_type(self, small_assembly_ir: IR):
         """Test getting nodes by type."""
-        node1 = Node(id="node1", type="Part")
-        node2 = Node(id="node2", type="Part")
-        node3 = Node(id="node3", type="Assembly")
-
-        ir = IR(
-            model_id="test_model",
-            nodes=[node1, node2, node3],
-            edges=[],
-        )
-
-        parts = ir.get_nodes_by_type("Part")
+        parts = small_assembly_ir.get_nodes_by_type("Part")
         assert len(parts) == 2
         assert all(node.type == "Part" for node in parts)
 
-        assemblies = ir.get_nodes_by_type("Assembly")
+        assemblies = small_assembly_ir.get_nodes_by_type("Assembly")
         assert len(assemblies) == 1
         assert assemblies[0].id == "node3"
 
-    def test_ir_edge_queries(self):
+    def test_ir_edge_queries(self, small_assembly_ir: IR):
         """Test edge query methods."""
-        node1 = Node(id="node1", type="Assembly")
-        node2 = Node(id="node2", type="Part")
-        node3 = Node(id="node3", type="Part")
-
-        edge1 = Edge(src="node1", dst="node2", type="contains")
-        edge2 = Edge(src="node1", dst="node3", type="contains")
-        edge3 = Edge(src="node2", dst="node3", type="adjacent_to")
-
-        ir = IR(
-            model_id="test_model",
-            nodes=[node1, node2, node3],
-            edges=[edge1, edge2, edge3],
-        )
-
         # Test outgoing edges
-        outgoing = ir.get_edges_from_node("node1")
+        outgoing = small_assembly_ir.get_edges_from_node("node3")
         assert len(outgoing) == 2
-        assert all(edge.src == "node1" for edge in outgoing)
+        assert all(edge.src == "node3" for edge in outgoing)
 
         # Test incoming edges
-        incoming = ir.get_edges_to_node("node3")
+        incoming = small_assembly_ir.get_edges_to_node("node2")
         assert len(incoming) == 2
-        assert all(edge.dst == "node3" for edge in incoming)
+        assert all(edge.dst == "node2" for edge in incoming)
 
     def test_ir_add_node(self):
         """Test adding nodes to IR."""
@@ -304,6 +360,60 @@ class TestIR:
         with pytest.raises(ValueError, match="Destination node nonexistent does not exist"):
             ir.add_edge(edge3)
 
+    def test_ir_add_edges(self):
+        """Test adding edges in bulk."""
+        nodes = [Node(id=f"node{i}", type="Part") for i in range(3)]
+        ir = IR(model_id="test_model", nodes=nodes, edges=[])
+
+        ir.add_edges(
+            Edge(src="node0", dst=f"node{i}", type="contains") for i in (1, 2)
+        )
+
+        assert len(ir.edges) == 2
+        assert ir.validation.edge_count == 2
+        assert len(ir.get_edges_from_node("node0")) == 2
+
+        # A bad reference rejects the whole batch
+        batch = [
+            Edge(src="node1", dst="node2", type="adjacent_to"),
+            Edge(src="node1", dst="nonexistent", type="adjacent_to"),
+        ]
+        with pytest.raises(ValueError, match="Destination node nonexistent does not exist"):
+            ir.add_edges(batch)
+        assert len(ir.edges) == 2
+        assert ir.get_edges_from_node("node1") == []
+
+    def test_ir_revalidate(self):
+        """Test revalidating after editing the node and edge lists directly."""
+        ir = IR(model_id="test_model", nodes=[Node(id="node1", type="Part")], edges=[])
+
+        ir.nodes.append(Node(id="node2", type="Part"))
+        ir.edges.append(Edge(src="node1", dst="missing", type="contains"))
+        ir.revalidate()
+
+        assert ir.get_node_by_id("node2") is not None
+        assert ir.validation.node_count == 2
+        assert ir.validation.edge_count == 1
+        assert ir.validation.errors == ["Edge references unknown destination node: missing"]
+
+        ir.edges.clear()
+        ir.revalidate()
+        assert ir.validation.is_valid
+
+    def test_ir_queries_after_incremental_build(self):
+        """Test that queries see nodes and edges added after construction."""
+        ir = IR(model_id="test_model", nodes=[], edges=[])
+
+        ir.add_node(Node(id="node1", type="Assembly"))
+        ir.add_node(Node(id="node2", type="Part"))
+        ir.add_edge(Edge(src="node1", dst="node2", type="contains"))
+
+        assert ir.get_node_by_id("node2").type == "Part"
+        assert [node.id for node in ir.get_nodes_by_type("Part")] == ["node2"]
+        assert [edge.dst for edge in ir.get_edges_from_node("node1")] == ["node2"]
+        assert [edge.src for edge in ir.get_edges_to_node("node2")] == ["node1"]
+        assert ir.get_edges_from_node("node2") == []
+
 
 class TestFactoryFunctions:
     """Test cases for factory functions."""
@@ -322,6 +432,27 @@ class TestFactoryFunctions:
         assert node.type == "Part"
         assert node.attrs["name"] == "Test Part"
 
+    def test_create_part_node_with_attrs(self):
+        """Test part node factory with extra attributes."""
+        attrs = {"volume": 1.0}
+        node = create_part_node("Test Part", attrs=attrs)
+        assert node.attrs is attrs
+        assert node.attrs == {
+            "volume": 1.0,
+            "name": "Test Part",
+            "description": "Part: Test Part",
+        }
+
+    def test_create_node_dispatch(self):
+        """Test the generic node factory."""
+        node = create_node("Assembly", "Frame", node_id="frame")
+        assert node.id == "frame"
+        assert node.type == "Assembly"
+        assert node.attrs == {"name": "Frame", "description": "Assembly: Frame"}
+
+        with pytest.raises(ValueError, match="No node factory for type: Widget"):
+            create_node("Widget", "x")
+
     def test_create_unit_node(self):
         """Test unit node factory."""
         node = create_unit_node("length", "mm")
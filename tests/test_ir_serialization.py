@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import io
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -10,10 +12,14 @@ import pytest
 from stepgraph_ir.schema import IR, Node, Edge, create_part_node, BoundingBox, ValidationInfo
 from stepgraph_ir.serialize import (
     to_json_dict,
+    to_json_bytes,
     to_json_string,
     dump_jsonl,
     load_jsonl,
     batch_dump_jsonl,
+    filter_jsonl,
+    iter_jsonl_raw,
+    write_jsonl,
     _node_sort_key,
     _edge_sort_key,
 )
@@ -74,6 +80,50 @@ class TestSerialization:
         # Should be compact (no unnecessary whitespace)
         assert json_str.count("\n") <= 1  # Only possible newline at end
 
+    def test_to_json_bytes(self, sample_ir: IR):
+        """Test JSON bytes match the string form."""
+        json_bytes = to_json_bytes(sample_ir)
+
+        assert isinstance(json_bytes, bytes)
+        assert json_bytes.decode("utf-8") == to_json_string(sample_ir)
+        assert json.loads(json_bytes)["model_id"] == sample_ir.model_id
+
+    def test_non_native_attr_values(self):
+        """Test dataclass, set and path attr values are encoded."""
+        bbox = BoundingBox(0.0, 0.0, 0.0, 1.0, 2.0, 3.0)
+        node = Node(
+            id="n1",
+            type="Part",
+            attrs={"bbox": bbox, "tags": {"b", "a"}, "source": Path("parts/a.step")},
+        )
+        ir = IR(model_id="test_default", nodes=[node], edges=[])
+
+        attrs = json.loads(to_json_bytes(ir))["nodes"][0]["attrs"]
+        assert attrs["bbox"] == {
+            "min_x": 0.0, "min_y": 0.0, "min_z": 0.0,
+            "max_x": 1.0, "max_y": 2.0, "max_z": 3.0,
+        }
+        assert attrs["tags"] == ["a", "b"]
+        assert attrs["source"] == str(Path("parts/a.step"))
+
+    def test_unsupported_attr_value(self):
+        """Test unknown attr types still fail to encode."""
+        node = Node(id="n1", type="Part", attrs={"handle": object()})
+        ir = IR(model_id="test_default", nodes=[node], edges=[])
+
+        with pytest.raises(TypeError):
+            to_json_bytes(ir)
+
+    def test_deterministic_string_sorts_keys(self):
+        """Test deterministic output sorts nested dict keys."""
+        node = Node(id="n1", type="Unit", attrs={"value": "mm", "unit_type": "length"})
+        ir = IR(model_id="test_keys", nodes=[node], edges=[])
+
+        assert '"attrs":{"unit_type":"length","value":"mm"}' in to_json_string(ir)
+        assert '"attrs":{"value":"mm","unit_type":"length"}' in to_json_string(
+            ir, deterministic=False
+        )
+
     def test_deterministic_sorting(self):
         """Test deterministic sorting of nodes and edges."""
         # Create nodes in non-alphabetical order
@@ -140,6 +190,29 @@ class TestDumpLoad:
         assert len(loaded_ir.nodes) == len(sample_ir.nodes)
         assert len(loaded_ir.edges) == len(sample_ir.edges)
 
+    def test_dump_and_load_in_memory(self, sample_ir: IR):
+        """Test roundtrip through a binary stream instead of a file path."""
+        buffer = io.BytesIO()
+        dump_jsonl(sample_ir, buffer)
+        dump_jsonl(sample_ir, buffer)
+        buffer.write(b"\n")
+        buffer.seek(0)
+
+        loaded = list(load_jsonl(buffer))
+        assert [ir.model_id for ir in loaded] == [sample_ir.model_id] * 2
+        assert loaded[0].nodes[0].attrs == sample_ir.nodes[0].attrs
+
+    def test_dump_creates_missing_directories(self, sample_ir: IR, temp_dir: Path):
+        """Test dumping into directories that do not exist yet."""
+        single_path = temp_dir / "a" / "b" / "single.jsonl"
+        batch_path = temp_dir / "c" / "batch.jsonl"
+
+        dump_jsonl(sample_ir, single_path)
+        batch_dump_jsonl([sample_ir], batch_path)
+
+        assert next(load_jsonl(single_path)).model_id == sample_ir.model_id
+        assert next(load_jsonl(batch_path)).model_id == sample_ir.model_id
+
     def test_batch_dump_jsonl(self, temp_dir: Path):
         """Test batch dumping multiple IRs."""
         ir1 = IR(model_id="model1", nodes=[create_part_node("part1")], edges=[])
@@ -153,6 +226,55 @@ class TestDumpLoad:
         assert len(loaded_irs) == 2
         assert {ir.model_id for ir in loaded_irs} == {"model1", "model2"}
 
+    def test_batch_dump_jsonl_from_generator(self, temp_dir: Path):
+        """Test batch dumping consumes an iterator of IRs."""
+        irs = (
+            IR(model_id=f"model{i}", nodes=[create_part_node(f"part{i}")], edges=[])
+            for i in range(3)
+        )
+
+        output_path = temp_dir / "stream.jsonl"
+        batch_dump_jsonl(irs, output_path)
+
+        assert [ir.model_id for ir in load_jsonl(output_path)] == ["model0", "model1", "model2"]
+
+    @pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev not available")
+    def test_batch_dump_jsonl_short_writes(self, temp_dir: Path, monkeypatch):
+        """Test batch dumping resumes after partial writev calls."""
+        real_writev = os.writev
+
+        def short_writev(fd, buffers):
+            return real_writev(fd, [bytes(buffers[0])[:7]])
+
+        monkeypatch.setattr(os, "writev", short_writev)
+        irs = [IR(model_id=f"model{i}", nodes=[], edges=[]) for i in range(3)]
+
+        output_path = temp_dir / "short.jsonl"
+        batch_dump_jsonl(irs, output_path)
+
+        assert [ir.model_id for ir in load_jsonl(output_path)] == ["model0", "model1", "model2"]
+
+    def test_batch_dump_jsonl_without_writev(self, temp_dir: Path, monkeypatch):
+        """Test the buffered fallback used where os.writev is missing."""
+        monkeypatch.delattr(os, "writev", raising=False)
+        irs = [IR(model_id=f"model{i}", nodes=[], edges=[]) for i in range(2)]
+
+        output_path = temp_dir / "fallback.jsonl"
+        batch_dump_jsonl(irs, output_path)
+
+        assert [ir.model_id for ir in load_jsonl(output_path)] == ["model0", "model1"]
+
+    def test_write_jsonl_to_stream(self, sample_ir: IR):
+        """Test records are appended to an open binary stream, one per line."""
+        buffer = io.BytesIO()
+
+        write_jsonl(sample_ir, buffer)
+        write_jsonl(sample_ir, buffer)
+
+        lines = buffer.getvalue().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == to_json_dict(sample_ir)
+
     def test_load_nonexistent_file(self, temp_dir: Path):
         """Test loading non-existent file raises FileNotFoundError."""
         nonexistent_path = temp_dir / "nonexistent.jsonl"
@@ -168,7 +290,94 @@ class TestDumpLoad:
         with pytest.raises(ValueError, match="Failed to parse line"):
             list(load_jsonl(invalid_path))
 
-    def test_roundtrip_with_validation_info(self, temp_dir: Path):
+    def test_load_skips_blank_lines(self, sample_ir: IR, temp_dir: Path):
+        """Test loading tolerates blank lines, CRLF endings and no final newline."""
+        record = to_json_bytes(sample_ir)
+        path = temp_dir / "blank.jsonl"
+        path.write_bytes(b"\r\n" + record + b"\r\n  \n\n" + record)
+
+        loaded = list(load_jsonl(path))
+        assert [ir.model_id for ir in loaded] == [sample_ir.model_id] * 2
+
+    def test_load_empty_file(self, temp_dir: Path):
+        """Test loading an empty file yields nothing."""
+        path = temp_dir / "empty.jsonl"
+        path.touch()
+
+        assert list(load_jsonl(path)) == []
+
+    def test_iter_jsonl_raw(self, temp_dir: Path):
+        """Test raw records are yielded undecoded, skipping blank lines."""
+        irs = [IR(model_id=f"model{i}", nodes=[], edges=[]) for i in range(2)]
+        path = temp_dir / "raw.jsonl"
+        batch_dump_jsonl(irs, path)
+        path.write_bytes(path.read_bytes() + b"\n  \n")
+
+        records = [bytes(record) for record in iter_jsonl_raw(path)]
+        assert records == [to_json_bytes(ir) for ir in irs]
+
+    def test_filter_jsonl(self, temp_dir: Path):
+        """Test filtering forwards matching records byte-for-byte."""
+        irs = [IR(model_id=f"model{i}", nodes=[], edges=[]) for i in range(4)]
+        src = temp_dir / "all.jsonl"
+        dst = temp_dir / "shard" / "even.jsonl"
+        batch_dump_jsonl(irs, src)
+
+        count = filter_jsonl(
+            lambda record: json.loads(bytes(record))["model_id"][-1] in "02", src, dst
+        )
+
+        assert count == 2
+        assert [ir.model_id for ir in load_jsonl(dst)] == ["model0", "model2"]
+
+    def test_load_ignores_unknown_keys(self, temp_dir: Path):
+        """Test records with extra keys and null attrs still load."""
+        record = {
+            "model_id": "extra_keys",
+            "nodes": [
+                {"id": "a", "type": "Part", "attrs": None, "color": "red"},
+                {"id": "b", "type": "Part", "attrs": {"name": "b"}},
+            ],
+            "edges": [{"src": "a", "dst": "b", "type": "contains", "weight": 1}],
+            "validation": {"node_count": 2, "is_valid": True},
+        }
+        path = temp_dir / "extra.jsonl"
+        path.write_bytes(json.dumps(record).encode() + b"\n")
+
+        ir = next(load_jsonl(path))
+        assert [node.attrs for node in ir.nodes] == [{}, {"name": "b"}]
+        assert ir.edges[0].attrs == {}
+        assert ir.validation.node_count == 2
+
+    def test_load_trusts_stored_validation(self):
+        """Test reloads keep stored errors and only re-validate on request."""
+        record = {
+            "model_id": "dangling",
+            "nodes": [{"id": "a", "type": "Part", "attrs": {}}],
+            "edges": [{"src": "a", "dst": "gone", "type": "contains", "attrs": {}}],
+            "validation": {"errors": ["Stored error"]},
+        }
+        line = json.dumps(record).encode() + b"\n"
+
+        trusted = next(load_jsonl(io.BytesIO(line)))
+        assert trusted.validation.errors == ["Stored error"]
+        assert trusted.get_edges_to_node("gone") == trusted.edges
+
+        checked = next(load_jsonl(io.BytesIO(line), validate=True))
+        assert checked.validation.errors == [
+            "Stored error",
+            "Edge references unknown destination node: gone",
+        ]
+
+    def test_load_missing_required_field(self, temp_dir: Path):
+        """Test records missing a required node field raise ValueError."""
+        path = temp_dir / "missing.jsonl"
+        path.write_text('{"model_id": "m", "nodes": [{"id": "a"}], "edges": []}\n')
+
+        with pytest.raises(ValueError, match="Failed to parse line 1"):
+            list(load_jsonl(path))
+
+    def test_roundtrip_with_validation_info(self):
         """Test roundtrip preserves validation information."""
         validation = ValidationInfo(
             warnings=["Test warning"],
@@ -182,10 +391,11 @@ class TestDumpLoad:
             validation=validation,
         )
 
-        output_path = temp_dir / "validation.jsonl"
-        dump_jsonl(ir, output_path)
+        buffer = io.BytesIO()
+        dump_jsonl(ir, buffer)
+        buffer.seek(0)
 
-        loaded_ir = list(load_jsonl(output_path))[0]
+        loaded_ir = list(load_jsonl(buffer))[0]
         assert loaded_ir.validation.warnings == ["Test warning"]
         assert loaded_ir.validation.errors == ["Test error"]
         assert not loaded_ir.validation.is_valid
@@ -231,6 +441,18 @@ class TestSortingFunctions:
         assert known_key < unknown_key
 
 
+    def test_sorted_output_follows_node_list(self):
+        """Test nodes replaced or retyped in place are serialized as they are now."""
+        ir = IR(model_id="test", nodes=[create_part_node("a", node_id="p1")], edges=[])
+        ir.nodes[0] = create_part_node("b", node_id="p2")
+        assert [n["id"] for n in to_json_dict(ir)["nodes"]] == ["p2"]
+
+        ir.nodes.append(Node(id="a", type="Part"))
+        ir.nodes[0].type = "Assembly"
+        nodes = to_json_dict(ir)["nodes"]
+        assert [(n["id"], n["type"]) for n in nodes] == [("p2", "Assembly"), ("a", "Part")]
+
+
 class TestComplexIR:
     """Test cases for complex IR structures."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -15,12 +16,26 @@ from shapebridge_mcp.tools import (
     tool_summarize_model,
     tool_export_view,
     tool_session_info,
+    _create_minimal_ir,
     _session,
 )
-from kernel.occt_io import LoadedModel, StepImportError
+from kernel.occt_io import StepImportError
 from kernel.summary import GeometrySummary
 
 
+@pytest.fixture(scope="class")
+def pooled_session() -> ShapeBridgeSession:
+    """One default session reused by every test in a class."""
+    return ShapeBridgeSession()
+
+
+@pytest.fixture
+def session(pooled_session: ShapeBridgeSession) -> ShapeBridgeSession:
+    """The class's pooled session, emptied before each test."""
+    pooled_session.clear()
+    return pooled_session
+
+
 class TestShapeBridgeSession:
     """Test cases for ShapeBridgeSession class."""
 
@@ -36,6 +51,19 @@ class TestShapeBridgeSession:
         session = ShapeBridgeSession(max_models=5)
         assert session._max_models == 5
 
+    def test_list_models_cached(self, session: ShapeBridgeSession, make_loaded_model):
+        """Test that the model list is reused until membership changes."""
+        session._models["b"] = make_loaded_model()
+        session._models["a"] = make_loaded_model()
+
+        models = session.list_models()
+        assert models == ["a", "b"]
+        session.get_model("a")
+        assert session.list_models() is models
+
+        session.remove_model("a")
+        assert session.list_models() == ["b"]
+
     def test_session_stats(self):
         """Test session statistics."""
         session = ShapeBridgeSession(max_models=5)
@@ -45,23 +73,18 @@ class TestShapeBridgeSession:
         assert stats["max_models"] == 5
         assert stats["model_ids"] == []
 
-    def test_has_model(self):
+    def test_has_model(self, session: ShapeBridgeSession, make_loaded_model):
         """Test model existence checking."""
-        session = ShapeBridgeSession()
-
         # Add a mock model directly
-        mock_model = Mock(spec=LoadedModel)
-        mock_model.model_id = "test_model"
+        mock_model = make_loaded_model(model_id="test_model")
         session._models["test_model"] = mock_model
 
         assert session.has_model("test_model")
         assert not session.has_model("nonexistent")
 
-    def test_get_model(self):
+    def test_get_model(self, session: ShapeBridgeSession, make_loaded_model):
         """Test model retrieval."""
-        session = ShapeBridgeSession()
-
-        mock_model = Mock(spec=LoadedModel)
+        mock_model = make_loaded_model()
         session._models["test_model"] = mock_model
 
         retrieved = session.get_model("test_model")
@@ -70,38 +93,46 @@ class TestShapeBridgeSession:
         not_found = session.get_model("nonexistent")
         assert not_found is None
 
-    def test_remove_model(self):
+    def test_remove_model(self, session: ShapeBridgeSession, make_loaded_model, make_summary):
         """Test model removal."""
-        session = ShapeBridgeSession()
-
         # Add mock data
-        mock_model = Mock(spec=LoadedModel)
-        mock_summary = Mock(spec=GeometrySummary)
+        mock_model = make_loaded_model()
+        mock_summary = make_summary()
         session._models["test_model"] = mock_model
         session._summaries["test_model"] = mock_summary
-        session._load_times["test_model"] = 123.456
 
         # Remove model
         session.remove_model("test_model")
 
         assert not session.has_model("test_model")
         assert session.get_summary("test_model") is None
-        assert "test_model" not in session._load_times
 
         # Removing non-existent model should not error
         session.remove_model("nonexistent")
 
-    def test_cleanup_old_models(self):
+    def test_clear(self, session: ShapeBridgeSession, make_loaded_model, make_summary):
+        """Test clearing drops in-memory and cold models alike."""
+        session._models["hot"] = make_loaded_model()
+        session._summaries["hot"] = make_summary()
+        session._cold["cold"] = ("/path/to/cold.step", 0, None)
+        assert session.list_models() == ["hot"]
+
+        session.clear()
+
+        assert not session.has_model("hot")
+        assert not session.has_model("cold")
+        assert session.list_models() == []
+        assert session.get_summary("hot") is None
+
+    def test_cleanup_old_models(self, make_loaded_model):
         """Test automatic cleanup of old models."""
         session = ShapeBridgeSession(max_models=2)
 
-        # Add models with different load times
+        # Inserted in order, so model_0 is the least recently used
         for i in range(3):
             model_id = f"model_{i}"
-            mock_model = Mock(spec=LoadedModel)
-            mock_model.model_id = model_id
+            mock_model = make_loaded_model(model_id=model_id, file_path=f"/path/to/{model_id}.step")
             session._models[model_id] = mock_model
-            session._load_times[model_id] = i  # model_0 is oldest
 
         session.cleanup_old_models()
 
@@ -111,30 +142,72 @@ class TestShapeBridgeSession:
         assert "model_1" in session._models
         assert "model_2" in session._models
 
+    def test_cleanup_evicts_least_recently_used(self, make_loaded_model):
+        """Test that accessing a model protects it from eviction."""
+        session = ShapeBridgeSession(max_models=2)
+
+        for i in range(3):
+            model_id = f"model_{i}"
+            mock_model = make_loaded_model(model_id=model_id, file_path=f"/path/to/{model_id}.step")
+            session._models[model_id] = mock_model
+
+        session.get_model("model_0")
+        session.cleanup_old_models()
+
+        assert list(session._models) == ["model_2", "model_0"]
+
     @patch('shapebridge_mcp.tools.load_step')
-    def test_load_model_success(self, mock_load_step):
-        """Test successful model loading."""
-        session = ShapeBridgeSession()
+    def test_evicted_model_kept_cold(
+        self, mock_load_step, tmp_path, make_loaded_model, make_summary
+    ):
+        """Test that evicted models keep their summary and re-load on demand."""
+        session = ShapeBridgeSession(max_models=1)
+        step_file = tmp_path / "model_0.step"
+        step_file.write_text("ISO-10303-21;")
+
+        mock_model = make_loaded_model(model_id="model_0", file_path=str(step_file))
+        mock_summary = make_summary()
+        session._models["model_0"] = mock_model
+        session._summaries["model_0"] = mock_summary
+
+        other = make_loaded_model(model_id="model_1", file_path="/path/to/model_1.step")
+        session._models["model_1"] = other
+        session.cleanup_old_models()
+
+        assert list(session._models) == ["model_1"]
+        assert session.has_model("model_0")
+        assert session.get_summary("model_0") is mock_summary
+        assert session.get_session_stats()["cold_models"] == 1
+        mock_load_step.assert_not_called()
 
-        mock_model = Mock(spec=LoadedModel)
-        mock_model.model_id = "test_model"
-        mock_model.file_path = "/path/to/test.step"
-        mock_model.units = {"length": "mm"}
-        mock_model.occt_binding = "pyOCCT"
+        mock_load_step.return_value = mock_model
+        assert session.get_model("model_0") is mock_model
+        mock_load_step.assert_called_once_with(str(step_file), file_stat=None)
+        assert session._summaries["model_0"] is mock_summary
+        assert list(session._models) == ["model_0"]
+
+    @patch('shapebridge_mcp.tools.load_step')
+    def test_load_model_success(
+        self, mock_load_step, session: ShapeBridgeSession, make_loaded_model
+    ):
+        """Test successful model loading."""
+        mock_model = make_loaded_model(
+            model_id="test_model",
+            file_path="/path/to/test.step",
+            units={"length": "mm"},
+            occt_binding="pyOCCT",
+        )
         mock_load_step.return_value = mock_model
 
         result = session.load_model("/path/to/test.step")
 
         assert result is mock_model
         assert session.has_model("test_model")
-        assert "test_model" in session._load_times
-        mock_load_step.assert_called_once_with("/path/to/test.step")
+        mock_load_step.assert_called_once_with("/path/to/test.step", file_stat=None)
 
     @patch('shapebridge_mcp.tools.load_step')
-    def test_load_model_failure(self, mock_load_step):
+    def test_load_model_failure(self, mock_load_step, session: ShapeBridgeSession):
         """Test model loading failure."""
-        session = ShapeBridgeSession()
-
         mock_load_step.side_effect = StepImportError("Test error")
 
         with pytest.raises(SessionError, match="Failed to load STEP file"):
@@ -142,20 +215,17 @@ class TestShapeBridgeSession:
 
         assert len(session._models) == 0
 
-    @patch('shapebridge_mcp.tools.summarize_shape')
-    def test_generate_summary_success(self, mock_summarize_shape):
+    @patch('kernel.summary.summarize_shape')
+    def test_generate_summary_success(
+        self, mock_summarize_shape, session: ShapeBridgeSession, make_loaded_model, make_summary
+    ):
         """Test successful summary generation."""
-        session = ShapeBridgeSession()
-
         # Add mock model
-        mock_model = Mock(spec=LoadedModel)
+        mock_model = make_loaded_model()
         session._models["test_model"] = mock_model
 
         # Mock summary
-        mock_summary = Mock(spec=GeometrySummary)
-        mock_summary.faces = 6
-        mock_summary.edges = 12
-        mock_summary.vertices = 8
+        mock_summary = make_summary(faces=6, edges=12, vertices=8)
         mock_summarize_shape.return_value = mock_summary
 
         result = session.generate_summary("test_model")
@@ -164,27 +234,54 @@ class TestShapeBridgeSession:
         assert session.get_summary("test_model") is mock_summary
         mock_summarize_shape.assert_called_once_with(mock_model)
 
-    def test_generate_summary_no_model(self):
-        """Test summary generation for non-existent model."""
-        session = ShapeBridgeSession()
+    @patch('shapebridge_mcp.tools.load_step')
+    @patch('kernel.summary.summarize_shape')
+    def test_generate_ir_cached_until_reload(
+        self, mock_summarize_shape, mock_load_step, session: ShapeBridgeSession, make_loaded_model
+    ):
+        """Test the summary and IR are reused until the model is reloaded."""
+        mock_model = make_loaded_model(model_id="test_model")
+        mock_load_step.return_value = mock_model
+        mock_summarize_shape.return_value = GeometrySummary(
+            model_id="test_model", length_unit="mm", angle_unit="deg"
+        )
+        session.load_model("/path/to/test.step")
+
+        first = session.generate_ir("test_model")
+        assert session.generate_ir("test_model") is first
+        assert mock_summarize_shape.call_count == 1
+
+        session.record_ir_path("test_model", Path("/tmp/test_model.jsonl"))
+        session.load_model("/path/to/test.step")
+
+        assert session.get_ir_path("test_model") is None
+        assert session.generate_ir("test_model") is not first
+        assert mock_summarize_shape.call_count == 2
 
+    def test_generate_summary_no_model(self, session: ShapeBridgeSession):
+        """Test summary generation for non-existent model."""
         with pytest.raises(SessionError, match="Model not found in session"):
             session.generate_summary("nonexistent")
 
-    @patch('shapebridge_mcp.tools.summarize_shape')
-    @patch('shapebridge_mcp.tools.create_placeholder_summary')
-    def test_generate_summary_failure(self, mock_placeholder, mock_summarize_shape):
+    @patch('kernel.summary.summarize_shape')
+    @patch('kernel.summary.create_placeholder_summary')
+    def test_generate_summary_failure(
+        self,
+        mock_placeholder,
+        mock_summarize_shape,
+        session: ShapeBridgeSession,
+        make_loaded_model,
+        make_summary,
+    ):
         """Test summary generation failure handling."""
-        session = ShapeBridgeSession()
-
         # Add mock model
-        mock_model = Mock(spec=LoadedModel)
+        mock_model = make_loaded_model()
         session._models["test_model"] = mock_model
 
         # Mock analysis failure
-        mock_summarize_shape.side_effect = Exception("Analysis failed")
+        mock_summarize_shape.side_effect = RuntimeError("Analysis failed")
 
-        mock_placeholder_summary = Mock(spec=GeometrySummary)
+        mock_placeholder_summary = make_summary()
         mock_placeholder.return_value = mock_placeholder_summary
 
         result = session.generate_summary("test_model")
@@ -192,13 +289,21 @@ class TestShapeBridgeSession:
         assert result is mock_placeholder_summary
         mock_placeholder.assert_called_once_with("test_model", "Analysis failed")
 
-    @patch('shapebridge_mcp.tools.export_model_view')
-    def test_export_view_success(self, mock_export):
-        """Test successful view export."""
-        session = ShapeBridgeSession()
+        # A later failure keeps the stored summary instead of replacing it
+        mock_placeholder.reset_mock()
+        assert session.generate_summary("test_model") is mock_placeholder_summary
+        mock_placeholder.assert_not_called()
+
+        # Unexpected errors are not turned into placeholders
+        mock_summarize_shape.side_effect = MemoryError()
+        with pytest.raises(MemoryError):
+            session.generate_summary("test_model")
 
+    @patch('kernel.export.export_model_view')
+    def test_export_view_success(self, mock_export, session: ShapeBridgeSession, make_loaded_model):
+        """Test successful view export."""
         # Add mock model
-        mock_model = Mock(spec=LoadedModel)
+        mock_model = make_loaded_model()
         session._models["test_model"] = mock_model
 
         expected_result = {
@@ -213,10 +318,8 @@ class TestShapeBridgeSession:
         assert result == expected_result
         mock_export.assert_called_once_with(mock_model, format="glb")
 
-    def test_export_view_no_model(self):
+    def test_export_view_no_model(self, session: ShapeBridgeSession):
         """Test view export for non-existent model."""
-        session = ShapeBridgeSession()
-
         with pytest.raises(SessionError, match="Model not found in session"):
             session.export_view("nonexistent")
 
@@ -224,88 +327,90 @@ class TestShapeBridgeSession:
 class TestMCPTools:
     """Test cases for MCP tool functions."""
 
-    def test_tool_load_step_missing_path(self):
-        """Test load_step tool with missing path parameter."""
-        with pytest.raises(ValueError, match="Missing required parameter: path"):
-            tool_load_step({})
-
-    def test_tool_load_step_empty_path(self):
-        """Test load_step tool with empty path."""
-        with pytest.raises(ValueError, match="Parameter 'path' cannot be empty"):
-            tool_load_step({"path": ""})
+    @pytest.fixture(autouse=True)
+    def mock_session(self, monkeypatch) -> Mock:
+        """Replace the global session for every tool test."""
+        mock = Mock(spec=ShapeBridgeSession)
+        monkeypatch.setattr("shapebridge_mcp.tools._session", mock)
+        return mock
+
+    @pytest.mark.parametrize(
+        ("tool", "kwargs", "match"),
+        [
+            (tool_load_step, {"path": ""}, "Parameter 'path' cannot be empty"),
+            (tool_summarize_model, {"model_id": ""}, "Parameter 'model_id' cannot be empty"),
+            (tool_export_view, {"model_id": ""}, "Parameter 'model_id' cannot be empty"),
+            (tool_export_view, {"model_id": "test", "format": "invalid"}, "Unsupported format"),
+        ],
+        ids=["load_step-empty-path", "summarize-empty-id", "export-empty-id", "export-bad-format"],
+    )
+    def test_tool_param_validation(self, tool, kwargs: dict, match: str):
+        """Test tools reject empty or invalid parameters."""
+        with pytest.raises(ValueError, match=match):
+            tool(**kwargs)
 
     def test_tool_load_step_nonexistent_file(self, temp_dir: Path):
         """Test load_step tool with non-existent file."""
         nonexistent = temp_dir / "nonexistent.step"
 
         with pytest.raises(ValueError, match="File not found"):
-            tool_load_step({"path": str(nonexistent)})
+            tool_load_step(str(nonexistent))
 
-    @patch('shapebridge_mcp.tools._session')
-    def test_tool_load_step_success(self, mock_session, sample_step_file: Path):
+    def test_tool_load_step_success(self, mock_session: Mock, sample_step_file: Path, make_loaded_model):
         """Test successful load_step tool execution."""
-        mock_model = Mock(spec=LoadedModel)
-        mock_model.model_id = "test"
-        mock_model.file_path = str(sample_step_file)
-        mock_model.units = {"length": "mm"}
-        mock_model.occt_binding = "pyOCCT"
-        mock_model.occt_version = "7.6.0"
-        mock_model.metadata = {"file_size": 1024}
+        mock_model = make_loaded_model(
+            model_id="test",
+            file_path=str(sample_step_file),
+            units={"length": "mm"},
+            occt_binding="pyOCCT",
+            occt_version="7.6.0",
+            metadata={"file_size": 1024},
+        )
 
         mock_session.load_model.return_value = mock_model
         mock_session.get_session_stats.return_value = {"loaded_models": 1}
 
-        result = tool_load_step({"path": str(sample_step_file)})
+        result = tool_load_step(str(sample_step_file))
 
         assert result["success"] is True
         assert result["model_id"] == "test"
         assert result["units"]["length"] == "mm"
-        mock_session.load_model.assert_called_once_with(str(sample_step_file))
+        mock_session.load_model.assert_called_once_with(
+            str(sample_step_file), file_stat=os.stat(sample_step_file)
+        )
 
-    @patch('shapebridge_mcp.tools._session')
-    def test_tool_load_step_session_error(self, mock_session, sample_step_file: Path):
+    def test_tool_load_step_session_error(self, mock_session: Mock, sample_step_file: Path):
         """Test load_step tool with session error."""
         mock_session.load_model.side_effect = SessionError("Test error")
 
-        result = tool_load_step({"path": str(sample_step_file)})
+        result = tool_load_step(str(sample_step_file))
 
         assert result["success"] is False
         assert "Test error" in result["error"]
         assert result["model_id"] is None
 
-    def test_tool_summarize_model_missing_id(self):
-        """Test summarize_model tool with missing model_id."""
-        with pytest.raises(ValueError, match="Missing required parameter: model_id"):
-            tool_summarize_model({})
-
-    def test_tool_summarize_model_empty_id(self):
-        """Test summarize_model tool with empty model_id."""
-        with pytest.raises(ValueError, match="Parameter 'model_id' cannot be empty"):
-            tool_summarize_model({"model_id": ""})
-
-    @patch('shapebridge_mcp.tools._session')
     @patch('shapebridge_mcp.tools.dump_jsonl')
-    def test_tool_summarize_model_success(self, mock_dump, mock_session, temp_dir: Path):
+    def test_tool_summarize_model_success(self, mock_dump, mock_session: Mock, temp_dir: Path):
         """Test successful summarize_model tool execution."""
         # Mock summary
-        mock_summary = Mock(spec=GeometrySummary)
-        mock_summary.units = {"length": "mm", "angle": "deg"}
-        mock_summary.solids = 1
-        mock_summary.faces = 6
-        mock_summary.edges = 12
-        mock_summary.vertices = 8
-        mock_summary.bounding_box = {"min_x": 0, "max_x": 10}
-        mock_summary.surface_area = 600.0
-        mock_summary.volume = 1000.0
-        mock_summary.has_pmi = False
-        mock_summary.has_surfaces = True
-        mock_summary.file_size = 1024
-        mock_summary.occt_binding = "pyOCCT"
-        mock_summary.analysis_warnings = []
-
-        mock_session.generate_summary.return_value = mock_summary
-
-        result = tool_summarize_model({"model_id": "test_model", "out_dir": str(temp_dir)})
+        mock_summary = GeometrySummary(
+            model_id="test_model",
+            length_unit="mm",
+            angle_unit="deg",
+            solids=1,
+            faces=6,
+            edges=12,
+            vertices=8,
+            has_surfaces=True,
+            file_size=1024,
+            occt_binding="pyOCCT",
+        )
+
+        mock_session.generate_ir.return_value = (
+            mock_summary, _create_minimal_ir("test_model", mock_summary)
+        )
+
+        result = tool_summarize_model("test_model", str(temp_dir))
 
         assert result["success"] is True
         assert result["model_id"] == "test_model"
@@ -313,21 +418,10 @@ class TestMCPTools:
         assert result["ir_valid"] is True
         assert str(temp_dir) in result["ir_path"]
 
-        mock_session.generate_summary.assert_called_once_with("test_model")
+        mock_session.generate_ir.assert_called_once_with("test_model")
         mock_dump.assert_called_once()
 
-    def test_tool_export_view_missing_id(self):
-        """Test export_view tool with missing model_id."""
-        with pytest.raises(ValueError, match="Missing required parameter: model_id"):
-            tool_export_view({})
-
-    def test_tool_export_view_invalid_format(self):
-        """Test export_view tool with invalid format."""
-        with pytest.raises(ValueError, match="Unsupported format"):
-            tool_export_view({"model_id": "test", "format": "invalid"})
-
-    @patch('shapebridge_mcp.tools._session')
-    def test_tool_export_view_success(self, mock_session):
+    def test_tool_export_view_success(self, mock_session: Mock):
         """Test successful export_view tool execution."""
         expected_result = {
             "format": "glb",
@@ -339,15 +433,14 @@ class TestMCPTools:
 
         mock_session.export_view.return_value = expected_result
 
-        result = tool_export_view({"model_id": "test_model", "format": "glb"})
+        result = tool_export_view("test_model", format="glb")
 
         assert result["success"] is True
         assert result["format"] == "glb"
         assert result["uri"] == "memory://test.glb"
         mock_session.export_view.assert_called_once_with("test_model", format="glb")
 
-    @patch('shapebridge_mcp.tools._session')
-    def test_tool_session_info(self, mock_session):
+    def test_tool_session_info(self, mock_session: Mock, make_loaded_model, make_summary):
         """Test session_info tool."""
         mock_session.get_session_stats.return_value = {
             "loaded_models": 2,
@@ -356,13 +449,13 @@ class TestMCPTools:
         }
 
         # Mock models
-        mock_model1 = Mock(spec=LoadedModel)
-        mock_model1.file_path = "/path/to/model1.step"
-        mock_model1.units = {"length": "mm"}
-        mock_model1.occt_binding = "pyOCCT"
+        mock_model1 = make_loaded_model(
+            file_path="/path/to/model1.step",
+            units={"length": "mm"},
+            occt_binding="pyOCCT",
+        )
 
-        mock_summary1 = Mock(spec=GeometrySummary)
-        mock_summary1.faces = 6
+        mock_summary1 = make_summary(faces=6)
 
         mock_session.get_model.side_effect = lambda mid: mock_model1 if mid == "model1" else None
         mock_session.get_summary.side_effect = lambda mid: mock_summary1 if mid == "model1" else None
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,17 +16,20 @@ from kernel.occt_io import (
     OCCTNotAvailableError,
     get_occt_info,
     load_step,
+    load_step_batch,
     _validate_step_file,
     _extract_step_units,
+    _extract_step_units_from_header,
+    _read_step_header,
 )
 
 
 class TestOCCTInfo:
     """Test cases for OCCT binding detection."""
 
-    def test_get_occt_info_structure(self):
+    def test_get_occt_info_structure(self, occt_info: dict[str, Any]):
         """Test that get_occt_info returns expected structure."""
-        info = get_occt_info()
+        info = occt_info
 
         required_keys = {
             "pyOCCT_available",
@@ -37,9 +43,14 @@ class TestOCCTInfo:
         assert isinstance(info["pyOCCT_available"], bool)
         assert isinstance(info["pythonOCC_available"], bool)
 
+    def test_get_occt_info_cached(self):
+        """Test that binding detection is memoized."""
+        assert get_occt_info() is get_occt_info()
+
     @patch('kernel.occt_io.logger')
     def test_occt_info_logging(self, mock_logger):
         """Test that OCCT detection logs appropriately."""
+        get_occt_info.cache_clear()
         get_occt_info()
         # Should have logged something about binding availability
         assert mock_logger.info.called or mock_logger.debug.called
@@ -50,8 +61,17 @@ class TestFileValidation:
 
     def test_validate_existing_file(self, sample_step_file: Path):
         """Test validation of existing STEP file."""
-        validated_path = _validate_step_file(sample_step_file)
-        assert validated_path == sample_step_file.resolve()
+        validated_path, file_stat = _validate_step_file(sample_step_file)
+        assert validated_path == str(sample_step_file.resolve())
+        assert file_stat.st_size == sample_step_file.stat().st_size
+
+    def test_validate_reuses_caller_stat(self, sample_step_file: Path):
+        """Test validation uses a stat result passed by the caller."""
+        st = os.stat(sample_step_file)
+        with patch("kernel.occt_io.os.stat") as mock_stat:
+            validated_path, file_stat = _validate_step_file(sample_step_file, st)
+        mock_stat.assert_not_called()
+        assert file_stat is st
 
     def test_validate_nonexistent_file(self, temp_dir: Path):
         """Test validation fails for non-existent file."""
@@ -74,20 +94,7 @@ class TestFileValidation:
             _validate_step_file(temp_dir)
 
 
-class TestUnitExtraction:
-    """Test cases for unit extraction from STEP files."""
-
-    def test_extract_units_default(self, temp_dir: Path):
-        """Test unit extraction returns defaults for unknown content."""
-        test_file = temp_dir / "test.step"
-        test_file.write_text("Unknown content")
-
-        units = _extract_step_units(test_file)
-        assert units == {"length": "mm", "angle": "deg"}
-
-    def test_extract_units_millimetre(self, temp_dir: Path):
-        """Test unit extraction detects millimetre."""
-        content = """ISO-10303-21;
+MM_STEP_CONTENT = """ISO-10303-21;
 HEADER;
 FILE_NAME('test.step','2024-01-01T12:00:00',('Test'),('ShapeBridge'),'','','');
 FILE_SCHEMA(('AUTOMOTIVE_DESIGN'));
@@ -97,15 +104,8 @@ DATA;
 ENDSEC;
 END-ISO-10303-21;
 """
-        test_file = temp_dir / "test_mm.step"
-        test_file.write_text(content)
-
-        units = _extract_step_units(test_file)
-        assert units["length"] == "mm"
 
-    def test_extract_units_degree(self, temp_dir: Path):
-        """Test unit extraction detects degree."""
-        content = """ISO-10303-21;
+DEG_STEP_CONTENT = """ISO-10303-21;
 HEADER;
 FILE_NAME('test.step','2024-01-01T12:00:00',('Test'),('ShapeBridge'),'','','');
 FILE_SCHEMA(('AUTOMOTIVE_DESIGN'));
@@ -116,11 +116,76 @@ DATA;
 ENDSEC;
 END-ISO-10303-21;
 """
-        test_file = temp_dir / "test_deg.step"
+
+RAD_STEP_CONTENT = "#1 = ( PLANE_ANGLE_UNIT() NAMED_UNIT(*) SI_UNIT($,.RADIAN.) );"
+
+
+class TestUnitExtraction:
+    """Test cases for unit extraction from STEP files."""
+
+    @pytest.mark.parametrize(
+        "content,expected_key,expected_val",
+        [
+            ("Unknown content", "length", "mm"),
+            (MM_STEP_CONTENT, "length", "mm"),
+            (DEG_STEP_CONTENT, "angle", "deg"),
+            (RAD_STEP_CONTENT, "angle", "rad"),
+        ],
+        ids=["default", "millimetre", "degree", "radian"],
+    )
+    def test_extract_units(self, content: str, expected_key: str, expected_val: str):
+        """Test unit detection for unknown, millimetre, degree and radian content."""
+        # Only the header section, as _read_step_header passes it
+        header = content.encode().split(b"ENDSEC;", 1)[0]
+        units = _extract_step_units_from_header(header)
+        assert units[expected_key] == expected_val
+        assert set(units) == {"length", "angle"}
+
+    def test_extract_units_inch_header(self, temp_dir: Path):
+        """Test unit extraction reads the header section only."""
+        content = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('Part in INCH'),'2;1');
+ENDSEC;
+DATA;
+#1 = ( PLANE_ANGLE_UNIT() NAMED_UNIT(*) SI_UNIT($,.RADIAN.) );
+ENDSEC;
+END-ISO-10303-21;
+"""
+        test_file = temp_dir / "test_in.step"
         test_file.write_text(content)
 
         units = _extract_step_units(test_file)
-        assert units["angle"] == "deg"
+        assert units == {"length": "in", "angle": "deg"}
+
+    def test_extract_units_long_header(self, temp_dir: Path):
+        """Test unit extraction scans headers longer than a single block."""
+        padding = "x" * 10000
+        content = f"""ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('{padding}'),'2;1');
+FILE_NAME('Part in INCH','2024-01-01T12:00:00',('Test'),('ShapeBridge'),'','','');
+ENDSEC;
+"""
+        test_file = temp_dir / "test_long.step"
+        test_file.write_text(content)
+
+        units = _extract_step_units(test_file)
+        assert units["length"] == "in"
+
+    def test_extract_units_cached(self, temp_dir: Path):
+        """Test repeat extraction is cached until the file changes."""
+        test_file = temp_dir / "test_cached.step"
+        test_file.write_text("ISO-10303-21;\nHEADER;\nFILE_NAME('INCH');\nENDSEC;\n")
+
+        with patch("kernel.occt_io._read_step_header", wraps=_read_step_header) as read:
+            assert _extract_step_units(test_file)["length"] == "in"
+            assert _extract_step_units(test_file)["length"] == "in"
+            assert read.call_count == 1
+
+            test_file.write_text("ISO-10303-21;\nHEADER;\nENDSEC;\n")
+            assert _extract_step_units(test_file)["length"] == "mm"
+            assert read.call_count == 2
 
 
 class TestLoadedModel:
@@ -179,6 +244,24 @@ class TestLoadedModel:
 class TestLoadStep:
     """Test cases for load_step function."""
 
+    @pytest.fixture(autouse=True)
+    def bindings(self, monkeypatch) -> SimpleNamespace:
+        """Patch binding detection and both importers once for every test."""
+        mocks = SimpleNamespace(
+            get_info=Mock(return_value={
+                "pyOCCT_available": True,
+                "pythonOCC_available": True,
+                "recommended_binding": "pyOCCT",
+                "occt_version": "7.6.0",
+            }),
+            pyocct=Mock(return_value=None),
+            pythonocc=Mock(return_value=None),
+        )
+        monkeypatch.setattr("kernel.occt_io.get_occt_info", mocks.get_info)
+        monkeypatch.setattr("kernel.occt_io._try_pyocct_import", mocks.pyocct)
+        monkeypatch.setattr("kernel.occt_io._try_pythonocc_import", mocks.pythonocc)
+        return mocks
+
     def test_load_step_validation_error(self, temp_dir: Path):
         """Test load_step with invalid file."""
         nonexistent = temp_dir / "nonexistent.step"
@@ -186,10 +269,9 @@ class TestLoadStep:
         with pytest.raises(StepImportError, match="STEP file not found"):
             load_step(nonexistent)
 
-    @patch('kernel.occt_io.get_occt_info')
-    def test_load_step_no_bindings(self, mock_get_info, sample_step_file: Path):
+    def test_load_step_no_bindings(self, bindings: SimpleNamespace, sample_step_file: Path):
         """Test load_step when no OCCT bindings are available."""
-        mock_get_info.return_value = {
+        bindings.get_info.return_value = {
             "pyOCCT_available": False,
             "pythonOCC_available": False,
             "recommended_binding": None,
@@ -199,100 +281,137 @@ class TestLoadStep:
         with pytest.raises(OCCTNotAvailableError, match="No OCCT Python binding available"):
             load_step(sample_step_file)
 
-    @patch('kernel.occt_io._try_pyocct_import')
-    @patch('kernel.occt_io._try_pythonocc_import')
-    @patch('kernel.occt_io.get_occt_info')
-    def test_load_step_binding_failure(self, mock_get_info, mock_pythonocc, mock_pyocct, sample_step_file: Path):
+    def test_load_step_binding_failure(self, sample_step_file: Path):
         """Test load_step when bindings are available but fail."""
-        mock_get_info.return_value = {
-            "pyOCCT_available": True,
-            "pythonOCC_available": True,
-            "recommended_binding": "pyOCCT",
-            "occt_version": "7.6.0",
-        }
-
         # Both importers return None (failed)
-        mock_pyocct.return_value = None
-        mock_pythonocc.return_value = None
-
         with pytest.raises(StepImportError, match="Failed to load STEP file with available bindings"):
             load_step(sample_step_file)
 
-    @patch('kernel.occt_io._try_pyocct_import')
-    @patch('kernel.occt_io.get_occt_info')
-    def test_load_step_success_pyocct(self, mock_get_info, mock_pyocct, sample_step_file: Path):
+    def test_load_step_success_pyocct(
+        self, bindings: SimpleNamespace, sample_step_file: Path, sample_step_size: int
+    ):
         """Test successful load_step with pyOCCT."""
-        mock_get_info.return_value = {
-            "pyOCCT_available": True,
-            "pythonOCC_available": False,
-            "recommended_binding": "pyOCCT",
-            "occt_version": "7.6.0",
-        }
+        bindings.get_info.return_value["pythonOCC_available"] = False
 
         expected_model = LoadedModel(
             model_id="test",
             file_path=str(sample_step_file),
             occt_shape=Mock(),
             units={"length": "mm", "angle": "deg"},
-            metadata={"file_size": sample_step_file.stat().st_size},
+            metadata={"file_size": sample_step_size},
             occt_binding="pyOCCT",
             occt_version="7.6.0",
         )
 
-        mock_pyocct.return_value = expected_model
+        bindings.pyocct.return_value = expected_model
 
         result = load_step(sample_step_file)
 
         assert result == expected_model
-        mock_pyocct.assert_called_once()
+        bindings.pyocct.assert_called_once()
+        bindings.pythonocc.assert_not_called()
 
-    @patch('kernel.occt_io._try_pyocct_import')
-    @patch('kernel.occt_io._try_pythonocc_import')
-    @patch('kernel.occt_io.get_occt_info')
-    def test_load_step_fallback_to_pythonocc(self, mock_get_info, mock_pythonocc, mock_pyocct, sample_step_file: Path):
+    def test_load_step_fallback_to_pythonocc(
+        self, bindings: SimpleNamespace, sample_step_file: Path, sample_step_size: int
+    ):
         """Test load_step falls back to pythonOCC when pyOCCT fails."""
-        mock_get_info.return_value = {
-            "pyOCCT_available": True,
-            "pythonOCC_available": True,
-            "recommended_binding": "pyOCCT",
-            "occt_version": "7.6.0",
-        }
-
         # pyOCCT fails, pythonOCC succeeds
-        mock_pyocct.return_value = None
         expected_model = LoadedModel(
             model_id="test",
             file_path=str(sample_step_file),
             occt_shape=Mock(),
             units={"length": "mm", "angle": "deg"},
-            metadata={"file_size": sample_step_file.stat().st_size},
+            metadata={"file_size": sample_step_size},
             occt_binding="pythonOCC",
             occt_version="7.6.0",
         )
-        mock_pythonocc.return_value = expected_model
+        bindings.pythonocc.return_value = expected_model
 
         result = load_step(sample_step_file)
 
         assert result == expected_model
+        bindings.pyocct.assert_called_once()
+        bindings.pythonocc.assert_called_once()
+
+
+class TestLoadStepFileErrors:
+    """Test cases for file-level import errors."""
+
+    @patch('kernel.occt_io._try_pyocct_import')
+    @patch('kernel.occt_io._try_pythonocc_import')
+    @patch('kernel.occt_io.get_occt_info')
+    def test_load_step_file_error_skips_fallback(self, mock_get_info, mock_pythonocc, mock_pyocct, sample_step_file: Path):
+        """Test that a file rejected by OCCT is not retried with other bindings."""
+        mock_get_info.return_value = {
+            "pyOCCT_available": True,
+            "pythonOCC_available": True,
+            "recommended_binding": "pyOCCT",
+            "occt_version": "7.6.0",
+        }
+        mock_pyocct.side_effect = StepImportError("No geometry roots found in STEP file")
+
+        with pytest.raises(StepImportError, match="No geometry roots found"):
+            load_step(sample_step_file)
+
         mock_pyocct.assert_called_once()
-        mock_pythonocc.assert_called_once()
+        mock_pythonocc.assert_not_called()
+
+
+class TestLoadStepBatch:
+    """Test cases for load_step_batch function."""
+
+    @patch('kernel.occt_io._try_pyocct_import')
+    @patch('kernel.occt_io.get_occt_info')
+    def test_load_step_batch_errors_inline(
+        self, mock_get_info, mock_pyocct, temp_dir: Path, sample_step_file: Path, make_loaded_model
+    ):
+        """Test that per-file failures are returned in input order."""
+        mock_get_info.return_value = {
+            "pyOCCT_available": True,
+            "pythonOCC_available": False,
+            "recommended_binding": "pyOCCT",
+            "occt_version": "7.6.0",
+        }
+        expected_model = make_loaded_model(model_id="test", units={"length": "mm", "angle": "deg"})
+        mock_pyocct.return_value = expected_model
+
+        nonexistent = temp_dir / "nonexistent.step"
+        results = load_step_batch([sample_step_file, nonexistent], max_workers=2, use_processes=False)
+
+        assert len(results) == 2
+        assert results[0] is expected_model
+        assert isinstance(results[1], StepImportError)
+
+    def test_load_step_batch_worker_failure_stays_in_slot(self, make_loaded_model):
+        """Test a failure outside load_step does not abort the other files."""
+        model = make_loaded_model(model_id="a")
+        crash = RuntimeError("worker died")
+
+        with patch('kernel.occt_io._load_one', side_effect=[model, crash, model]):
+            results = load_step_batch(["a.step", "b.step", "c.step"], max_workers=1)
+
+        assert results == [model, crash, model]
+
+    def test_load_step_batch_empty(self):
+        """Test batch loading with no input."""
+        assert load_step_batch([]) == []
 
 
 @pytest.mark.occt
 class TestRealOCCT:
     """Test cases that require actual OCCT bindings.
 
-    These tests are marked with @pytest.mark.occt and will be skipped
-    if no OCCT binding is available.
+    These tests are marked with @pytest.mark.occt and are skipped at
+    collection time if no OCCT binding is available.
     """
 
-    def test_real_occt_binding_detection(self, skip_if_no_occt):
+    def test_real_occt_binding_detection(self, occt_info: dict[str, Any]):
         """Test that at least one OCCT binding is detected."""
-        info = get_occt_info()
+        info = occt_info
         assert info["pyOCCT_available"] or info["pythonOCC_available"]
         assert info["recommended_binding"] is not None
 
-    def test_load_sample_step_file(self, skip_if_no_occt, sample_step_file: Path):
+    def test_load_sample_step_file(self, sample_step_file: Path):
         """Test loading a real STEP file with available OCCT binding."""
         try:
             model = load_step(sample_step_file)
@@ -0,0 +1,437 @@
+"""Tests for geometry summary generation."""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import weakref
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import orjson
+import pytest
+
+from kernel.occt_io import LoadedModel
+from kernel.summary import (
+    BBox,
+    GeometrySummary,
+    _analyze_geometry_content,
+    _compute_bounding_box,
+    _count_topology,
+    _resolve_first,
+    create_placeholder_summary,
+    summarize_shape,
+    summarize_shapes,
+)
+
+# Unique entity counts reported by the fake MapShapes, keyed by TopAbs type
+_BOX_COUNTS = {"SOLID": 1, "SHELL": 1, "FACE": 6, "EDGE": 12, "VERTEX": 8}
+
+_TYPE_MAPPINGS = (
+    ("VERTEX", "vertices"),
+    ("EDGE", "edges"),
+    ("FACE", "faces"),
+    ("SHELL", "shells"),
+    ("SOLID", "solids"),
+)
+
+
+class FakeShapeMap:
+    """Minimal TopTools_IndexedMapOfShape stand-in."""
+
+    def __init__(self):
+        self.extent = 0
+
+    def Extent(self) -> int:
+        return self.extent
+
+
+def fake_map_shapes(shape: dict[str, int], topo_type: str, shape_map: FakeShapeMap) -> None:
+    """Fill the map with the number of unique entities of ``topo_type``."""
+    shape_map.extent = shape.get(topo_type, 0)
+
+
+class FakeBox:
+    """Minimal Bnd_Box stand-in."""
+
+    def __init__(self):
+        self.corners = None
+
+    def IsVoid(self) -> bool:
+        return self.corners is None
+
+    def Get(self) -> tuple[float, ...]:
+        return self.corners
+
+
+class FakeProps:
+    """Minimal GProp_GProps stand-in."""
+
+    def __init__(self):
+        self.mass = 0.0
+
+    def Mass(self) -> float:
+        return self.mass
+
+
+def fake_bnd_add(shape: dict[str, int], bbox: FakeBox, use_triangulation: bool) -> None:
+    bbox.corners = (0, 0, 0, 10, 10, 10)
+
+
+def fake_bnd_add_optimal(shape: dict[str, int], bbox: FakeBox, *args) -> None:
+    bbox.corners = (1, 1, 1, 9, 9, 9)
+
+
+def fake_surface_properties(shape: dict[str, int], props: FakeProps) -> None:
+    props.mass = 600.0
+
+
+def fake_volume_properties(shape: dict[str, int], props: FakeProps, *args) -> None:
+    raise RuntimeError("volume integration failed")
+
+
+_FAKE_SYMBOLS = {
+    "fake": SimpleNamespace(
+        map_shapes=fake_map_shapes,
+        shape_map=FakeShapeMap,
+        type_mappings=_TYPE_MAPPINGS,
+        bnd_box=FakeBox,
+        bnd_add=fake_bnd_add,
+        bnd_add_optimal=fake_bnd_add_optimal,
+        gprops=FakeProps,
+        surface_properties=fake_surface_properties,
+        volume_properties=fake_volume_properties,
+    )
+}
+
+
+class TestTopologyCounting:
+    """Test cases for topology counting and content classification."""
+
+    def test_counts_and_flags(self):
+        """Test counts and the content flags derived from them."""
+        with patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS):
+            counts = _count_topology(_BOX_COUNTS, "fake")
+        analysis = _analyze_geometry_content(counts)
+
+        assert counts == {"solids": 1, "shells": 1, "faces": 6, "edges": 12, "vertices": 8}
+        assert analysis["has_curves"] is True
+        assert analysis["has_surfaces"] is True
+        assert analysis["has_pmi"] is False
+
+    def test_wireframe_flags(self):
+        """Test a wireframe shape has curves but no surfaces."""
+        with patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS):
+            counts = _count_topology({"EDGE": 3, "VERTEX": 3}, "fake")
+        analysis = _analyze_geometry_content(counts)
+
+        assert counts["faces"] == 0
+        assert analysis["has_curves"] is True
+        assert analysis["has_surfaces"] is False
+
+    def test_counting_continues_past_empty_type(self):
+        """Test every type is counted even when an inner type is empty."""
+        walked = []
+
+        def map_shapes(shape, topo_type, shape_map):
+            walked.append(topo_type)
+            fake_map_shapes(shape, topo_type, shape_map)
+
+        symbols = SimpleNamespace(
+            map_shapes=map_shapes, shape_map=FakeShapeMap, type_mappings=_TYPE_MAPPINGS
+        )
+        with patch.dict("kernel.summary._BINDINGS", {"fake": symbols}):
+            counts = _count_topology({"FACE": 2, "SHELL": 1, "VERTEX": 3}, "fake")
+
+        assert walked == ["VERTEX", "EDGE", "FACE", "SHELL", "SOLID"]
+        assert counts == {"solids": 0, "shells": 1, "faces": 2, "edges": 0, "vertices": 3}
+
+    def test_flags_from_counts(self):
+        """Test content flags are derived from counts alone."""
+        analysis = _analyze_geometry_content(
+            {"solids": 0, "shells": 0, "faces": 0, "edges": 0, "vertices": 1}
+        )
+
+        assert analysis == {
+            "has_curves": False,
+            "has_surfaces": False,
+            "has_assemblies": False,
+            "has_pmi": False,
+        }
+
+    def test_resolve_first_installed_package(self):
+        """Test binding symbols fall back to the next installed package."""
+        symbols = SimpleNamespace()
+        resolved = {"OCP": None, "OCC.Core": symbols}
+
+        with patch("kernel.summary._resolve_binding_symbols", side_effect=resolved.get):
+            assert _resolve_first(("OCP", "OCC.Core")) is symbols
+            assert _resolve_first(("OCP",)) is None
+
+    def test_unavailable_binding(self):
+        """Test unavailable bindings yield zero counts."""
+        counts = _count_topology(object(), "missing")
+        analysis = _analyze_geometry_content(counts)
+
+        assert set(counts.values()) == {0}
+        assert not any(analysis.values())
+
+
+class TestBoundingBox:
+    """Test cases for bounding box computation."""
+
+    def test_void_box_uses_triangulation(self):
+        """Test a void Bnd_Box falls back to triangulation nodes."""
+        symbols = SimpleNamespace(bnd_box=FakeBox, bnd_add=lambda shape, bbox, *args: None)
+        nodes = np.array([[1.0, -2.0, 0.5], [-1.0, 4.0, 0.0], [0.0, 0.0, 3.0]])
+
+        with patch.dict("kernel.summary._BINDINGS", {"fake": symbols}), patch(
+            "kernel.summary.triangulation_vertices", return_value=nodes
+        ):
+            bbox = _compute_bounding_box(object(), "fake")
+
+        assert bbox == BBox(-1.0, -2.0, 0.0, 1.0, 4.0, 3.0)
+
+    def test_void_box_without_triangulation(self):
+        """Test an unmeshed shape with a void Bnd_Box has no bbox."""
+        symbols = SimpleNamespace(bnd_box=FakeBox, bnd_add=lambda shape, bbox, *args: None)
+
+        with patch.dict("kernel.summary._BINDINGS", {"fake": symbols}), patch(
+            "kernel.summary.triangulation_vertices", return_value=np.empty((0, 3))
+        ):
+            assert _compute_bounding_box(object(), "fake") is None
+
+    @patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS)
+    def test_precise_uses_add_optimal(self):
+        """Test precise boxes come from AddOptimal and default ones from Add."""
+        assert _compute_bounding_box({}, "fake") == BBox(0, 0, 0, 10, 10, 10)
+        assert _compute_bounding_box({}, "fake", precise=True) == BBox(1, 1, 1, 9, 9, 9)
+
+    def test_precise_without_add_optimal(self):
+        """Test precise boxes fall back to Add on OCCT without AddOptimal."""
+        symbols = SimpleNamespace(
+            bnd_box=FakeBox, bnd_add=fake_bnd_add, bnd_add_optimal=None
+        )
+
+        with patch.dict("kernel.summary._BINDINGS", {"fake": symbols}):
+            bbox = _compute_bounding_box({}, "fake", precise=True)
+
+        assert bbox == BBox(0, 0, 0, 10, 10, 10)
+
+
+class TestGeometrySummary:
+    """Test cases for the GeometrySummary record."""
+
+    def test_flat_fields_and_views(self):
+        """Test dictionary views are built from the flat fields."""
+        summary = GeometrySummary(
+            model_id="part",
+            length_unit="in",
+            angle_unit="rad",
+            bbox=BBox(0.0, 1.0, 2.0, 3.0, 4.0, 5.0),
+        )
+
+        assert summary.units == {"length": "in", "angle": "rad"}
+        assert summary.bounding_box["min_z"] == 2.0
+        assert summary.bounding_box["max_x"] == 3.0
+        assert summary.surface_area is None
+        assert summary.analysis_warnings == ()
+
+    def test_frozen(self):
+        """Test summaries cannot be modified after creation."""
+        summary = GeometrySummary(model_id="part", length_unit="mm", angle_unit="deg")
+
+        with pytest.raises(AttributeError):
+            summary.faces = 1
+
+    def test_to_json(self):
+        """Test JSON encoding matches the nested dictionary view."""
+        summary = GeometrySummary(
+            model_id="part",
+            length_unit="mm",
+            angle_unit="deg",
+            faces=6,
+            bbox=BBox(0.0, 0.0, 0.0, 1.0, 1.0, 1.0),
+            warnings=("note",),
+        )
+
+        data = orjson.loads(summary.to_json())
+
+        assert data == summary.to_dict()
+        assert data["topology"]["faces"] == 6
+        assert data["properties"]["bounding_box"]["max_y"] == 1.0
+        assert data["metadata"]["warnings"] == ["note"]
+
+
+class TestSummarizeShape:
+    """Test cases for summarize_shape."""
+
+    def test_unknown_binding(self, mock_loaded_model: LoadedModel):
+        """Test unknown bindings produce an empty summary with warnings."""
+        summary = summarize_shape(mock_loaded_model)
+
+        assert isinstance(summary, GeometrySummary)
+        assert summary.model_id == "test_model"
+        assert summary.faces == 0
+        assert summary.bounding_box is None
+        assert summary.file_size == 1024
+        assert "Unknown OCCT binding: mock" in summary.analysis_warnings
+
+    def test_summary_with_binding(self, mock_loaded_model: LoadedModel):
+        """Test a full summary through the binding symbol table."""
+        mock_loaded_model.occt_shape = _BOX_COUNTS
+        mock_loaded_model.occt_binding = "fake"
+
+        with patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS):
+            summary = summarize_shape(mock_loaded_model)
+
+            assert summary.faces == 6
+            assert summary.bounding_box == {
+                "min_x": 0.0, "min_y": 0.0, "min_z": 0.0,
+                "max_x": 10.0, "max_y": 10.0, "max_z": 10.0,
+            }
+            assert summary.surface_area == 600.0
+            assert summary.volume is None
+            assert "Could not compute volume" in summary.analysis_warnings
+
+    def test_mass_properties_skipped(self, mock_loaded_model: LoadedModel):
+        """Test volume is not integrated for shapes without solids."""
+        mock_loaded_model.occt_shape = {"FACE": 1, "EDGE": 4, "VERTEX": 4}
+        mock_loaded_model.occt_binding = "fake"
+
+        with patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS), patch(
+            "kernel.summary._compute_mass_properties", return_value=(1.0, None)
+        ) as mass:
+            summary = summarize_shape(mock_loaded_model)
+
+            assert summary.volume is None
+            assert summary.surface_area == 1.0
+            assert mass.call_args.kwargs == {"compute_area": True, "compute_volume": False}
+            assert "Could not compute volume" not in summary.analysis_warnings
+
+    def test_mass_properties_lazy(self, mock_loaded_model: LoadedModel):
+        """Test mass properties are only computed when first read."""
+        mock_loaded_model.occt_shape = _BOX_COUNTS
+        mock_loaded_model.occt_binding = "fake"
+
+        with patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS), patch(
+            "kernel.summary._compute_mass_properties", return_value=(600.0, 1000.0)
+        ) as mass:
+            summary = summarize_shape(mock_loaded_model)
+            assert summary.faces == 6
+            mass.assert_not_called()
+
+            assert summary.volume == 1000.0
+            assert summary.surface_area == 600.0
+            assert mass.call_count == 1
+            assert summary.mass.source is None
+
+    def test_summary_binding_not_installed(self, mock_loaded_model: LoadedModel):
+        """Test a known but missing binding is not reported as unknown."""
+        mock_loaded_model.occt_binding = "pyOCCT"
+
+        with patch.dict("kernel.summary._BINDINGS", clear=True):
+            summary = summarize_shape(mock_loaded_model)
+
+        assert summary.faces == 0
+        assert "Could not compute bounding box" in summary.analysis_warnings
+        assert not any("Unknown OCCT binding" in w for w in summary.analysis_warnings)
+
+    def test_summary_uses_recorded_metadata(self, mock_loaded_model: LoadedModel):
+        """Test counts and bbox recorded by the loader skip the OCCT passes."""
+        mock_loaded_model.occt_binding = "fake"
+        mock_loaded_model.metadata["topology_counts"] = {
+            "solids": 1, "shells": 1, "faces": 6, "edges": 12, "vertices": 8,
+        }
+        mock_loaded_model.metadata["bounding_box"] = {
+            "min_x": 0, "min_y": 0, "min_z": 0, "max_x": 1, "max_y": 2, "max_z": 3,
+        }
+
+        with patch.dict("kernel.summary._BINDINGS", _FAKE_SYMBOLS), patch(
+            "kernel.summary._count_topology"
+        ) as count, patch("kernel.summary._compute_bounding_box") as bbox:
+            summary = summarize_shape(mock_loaded_model)
+
+        count.assert_not_called()
+        bbox.assert_not_called()
+        assert summary.faces == 6
+        assert summary.has_surfaces is True
+        assert summary.bbox == BBox(0.0, 0.0, 0.0, 1.0, 2.0, 3.0)
+
+    def test_summary_force_recompute(self, mock_loaded_model: LoadedModel):
+        """Test force_recompute ignores recorded metadata."""
+        mock_loaded_model.metadata["topology_counts"] = {
+            "solids": 1, "shells": 1, "faces": 6, "edges": 12, "vertices": 8,
+        }
+
+        recorded = summarize_shape(mock_loaded_model)
+        fresh = summarize_shape(mock_loaded_model, force_recompute=True)
+
+        assert recorded.faces == 6
+        assert fresh.faces == 0
+
+    def test_summary_does_not_retain_shape(self, mock_loaded_model: LoadedModel):
+        """Test a summarized shape is freed once the caller drops it."""
+        shape = Mock()
+        shape_ref = weakref.ref(shape)
+        mock_loaded_model.occt_shape = shape
+
+        summary = summarize_shape(mock_loaded_model)
+        assert summary.model_id == "test_model"
+
+        del shape, summary
+        mock_loaded_model.occt_shape = None
+        gc.collect()
+        assert shape_ref() is None
+
+    def test_placeholder_summary(self):
+        """Test placeholder summary records the failure."""
+        summary = create_placeholder_summary("broken", "boom")
+
+        assert summary.model_id == "broken"
+        assert summary.analysis_warnings == ("Analysis failed: boom",)
+
+
+class TestSummarizeShapes:
+    """Test cases for batch summarization."""
+
+    def test_order_preserved(self, mock_loaded_model: LoadedModel):
+        """Test summaries from the process pool come back in input order."""
+        models = [replace(mock_loaded_model, model_id=f"model_{i}") for i in range(3)]
+
+        summaries = summarize_shapes(models, max_workers=2)
+
+        assert [s.model_id for s in summaries] == ["model_0", "model_1", "model_2"]
+        assert all(s.file_size == 1024 for s in summaries)
+
+    def test_unpicklable_shapes_use_threads(self, mock_loaded_model: LoadedModel):
+        """Test shapes that cannot be pickled are summarized on threads."""
+        mock_loaded_model.occt_shape = lambda: None
+        other = replace(mock_loaded_model, model_id="other")
+
+        summaries = summarize_shapes([mock_loaded_model, other], max_workers=2)
+
+        assert [s.model_id for s in summaries] == ["test_model", "other"]
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="Workers only inherit the patch when forked",
+    )
+    def test_worker_errors_propagate(self, mock_loaded_model: LoadedModel):
+        """Test errors raised inside workers are not retried on threads."""
+        models = [replace(mock_loaded_model, model_id=f"model_{i}") for i in range(2)]
+
+        with patch(
+            "kernel.summary._build_summary", side_effect=TypeError("bad shape")
+        ), patch("kernel.summary.ThreadPoolExecutor") as threads, pytest.raises(
+            TypeError, match="bad shape"
+        ):
+            summarize_shapes(models, max_workers=2)
+
+        threads.assert_not_called()
+
+    def test_empty(self):
+        """Test an empty batch needs no pool."""
+        assert summarize_shapes([]) == []
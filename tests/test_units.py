@@ -0,0 +1,92 @@
+"""Tests for STEPGraph-IR unit conversion."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from stepgraph_ir.units import (
+    UnitConversionError,
+    convert_array,
+    convert_value,
+    detect_step_units,
+    get_conversion_factor,
+    normalize_unit_name,
+)
+
+
+class TestConvertArray:
+    """Test cases for array unit conversion."""
+
+    def test_matches_scalar_conversion(self):
+        """Test array conversion agrees with convert_value."""
+        values = [0.0, 1.5, 1000.0]
+        result = convert_array(values, "mm", "in", "length")
+
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(
+            result, [convert_value(v, "mm", "in", "length") for v in values]
+        )
+
+    def test_in_place(self):
+        """Test conversion into a caller-provided array."""
+        values = np.array([90.0, 180.0])
+        result = convert_array(values, "deg", "rad", "angle", out=values)
+
+        assert result is values
+        np.testing.assert_allclose(values, [np.pi / 2, np.pi])
+
+    def test_unknown_unit(self):
+        """Test unknown units raise before touching the data."""
+        with pytest.raises(UnitConversionError, match="Unknown length unit: parsec"):
+            convert_array([1.0], "parsec", "m", "length")
+
+
+class TestDetectStepUnits:
+    """Test cases for STEP unit detection."""
+
+    def test_si_prefixed_millimetre(self):
+        """Test SI_UNIT with a MILLI prefix is read as millimetres."""
+        units = detect_step_units("#1=(LENGTH_UNIT()NAMED_UNIT(*)SI_UNIT(.MILLI.,.METRE.));")
+        assert units["length"] == "mm"
+
+    def test_metre_and_radian(self):
+        """Test plain SI metre and radian declarations."""
+        units = detect_step_units("SI_UNIT($,.METRE.); SI_UNIT($,.RADIAN.);")
+        assert units["length"] == "m"
+        assert units["angle"] == "rad"
+
+    def test_inch_case_insensitive(self):
+        """Test conversion-based inch units in any case."""
+        units = detect_step_units("conversion_based_unit('inch',#5);")
+        assert units["length"] == "in"
+
+    def test_no_substring_false_positives(self):
+        """Test words merely containing unit names do not match."""
+        units = detect_step_units("FILE_NAME('COMMAND_LINE_INPUT','SUMMIT');SI_UNIT($,.METRE.);")
+        assert units["length"] == "m"
+
+
+class TestConversionCache:
+    """Test cases for cached unit lookups."""
+
+    def test_repeat_lookups_hit_cache(self):
+        """Test repeated conversions reuse cached results."""
+        get_conversion_factor.cache_clear()
+        first = get_conversion_factor("MILLIMETRE", "inch", "length")
+        second = get_conversion_factor("MILLIMETRE", "inch", "length")
+
+        assert first == second == pytest.approx(0.001 / 0.0254)
+        assert get_conversion_factor.cache_info().hits == 1
+        assert normalize_unit_name(" Millimetre ") == "mm"
+
+    def test_errors_are_not_cached(self):
+        """Test unknown units keep raising on every call."""
+        for _ in range(2):
+            with pytest.raises(UnitConversionError, match="Unknown unit type: speed"):
+                get_conversion_factor("m", "mm", "speed")
+
+    def test_unknown_target_unit(self):
+        """Test an unknown target unit is reported by name."""
+        with pytest.raises(UnitConversionError, match="Unknown angle unit: arcsec"):
+            get_conversion_factor("deg", "arcsec", "angle")